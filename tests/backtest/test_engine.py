@@ -0,0 +1,158 @@
+import numpy as np
+import pandas as pd
+import pytest
+from trader.backtest.engine import backtest_dataframe
+from trader.backtest.runner import run_parallel_backtests
+from trader.backtest.walk_forward import run_walk_forward_optimization
+from trader.strategies.entry.base import EntryStrategy
+from trader.strategies.entry.bollinger_bands import BollingerBandsEntryStrategy
+from trader.strategies.exit.base import ExitStrategy
+from trader.strategies.exit.trailing_stop_loss import TrailingStopLossExitStrategy
+
+
+class FixedSignalEntryStrategy(EntryStrategy):
+    NAME = "Fixed Signal"
+    VERSION = "1.0.0"
+    DATA_FEEDS = ()
+    PARAMETER_SPACE = {}
+
+    def enhance_data(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        return dataframe
+
+    def get_buy_signal_strength(self, dataframe: pd.DataFrame, row_index: int) -> float:
+        return 1.0 if row_index in self.arguments["signal_indices"] else 0.0
+
+
+class FixedSignalExitStrategy(ExitStrategy):
+    NAME = "Fixed Signal"
+    VERSION = "1.0.0"
+    DATA_FEEDS = ()
+    PARAMETER_SPACE = {}
+
+    def enhance_data(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        return dataframe
+
+    def get_sell_signal_strength(self, dataframe: pd.DataFrame, row_index: int) -> float:
+        return 1.0 if row_index in self.arguments["signal_indices"] else 0.0
+
+
+def test_backtest_dataframe_trades_and_equity():
+    close = np.array([100, 101, 102, 104, 103, 106, 108, 107, 110, 112], dtype="float64")
+    dataframe = pd.DataFrame(
+        {"open": close - 0.5, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0},
+        index=pd.date_range("2021-01-01", periods=10, freq="1D", tz="UTC"),
+    )
+    result = backtest_dataframe(
+        1,
+        dataframe,
+        FixedSignalEntryStrategy,
+        {"signal_indices": {1, 3, 6}},
+        FixedSignalExitStrategy,
+        {"signal_indices": {4}},
+        fee_rate=0.01,
+        slippage_rate=0.001,
+    )
+    assert len(result.trades) == 2
+    closed_trade, open_trade = result.trades
+    assert closed_trade.entry_date == dataframe.index[2]
+    assert closed_trade.entry_price == pytest.approx(101.5 * 1.001)
+    assert closed_trade.exit_date == dataframe.index[5]
+    assert closed_trade.exit_price == pytest.approx(105.5 * 0.999)
+    assert closed_trade.net_return == pytest.approx(0.99**2 * (105.5 * 0.999) / (101.5 * 1.001) - 1)
+    assert open_trade.entry_date == dataframe.index[7]
+    assert open_trade.exit_date is None
+    assert result.total_return == pytest.approx((1 + closed_trade.net_return) * (1 + open_trade.net_return) - 1)
+    assert result.equity.iloc[:2].tolist() == [1.0, 1.0]
+    assert result.exposure == pytest.approx(0.6)
+    assert 0 < result.max_drawdown < 0.05
+
+
+def test_backtest_dataframe_open_final_trade_matches_equity():
+    close = np.array([100, 102, 101, 105, 108, 107], dtype="float64")
+    dataframe = pd.DataFrame(
+        {"open": close - 1, "high": close + 1, "low": close - 1, "close": close, "volume": 1.0},
+        index=pd.date_range("2021-01-01", periods=6, freq="1D", tz="UTC"),
+    )
+    result = backtest_dataframe(
+        1,
+        dataframe,
+        FixedSignalEntryStrategy,
+        {"signal_indices": {1}},
+        FixedSignalExitStrategy,
+        {"signal_indices": set()},
+        fee_rate=0.01,
+        slippage_rate=0.001,
+    )
+    (open_trade,) = result.trades
+    assert open_trade.exit_date is None
+    assert open_trade.exit_price == 107.0
+    assert open_trade.net_return == pytest.approx(0.99 * 107 / (100 * 1.001) - 1)
+    assert result.total_return == pytest.approx(open_trade.net_return)
+    assert result.equity.iloc[-1] == pytest.approx(1 + open_trade.net_return)
+
+
+def test_run_parallel_backtests_matches_serial():
+    random = np.random.default_rng(2)
+    index = pd.date_range("2020-01-01", periods=250, freq="1D", tz="UTC")
+    frames = []
+    for base_asset_id in (3, 1, 2):
+        close = 100 * np.exp(np.cumsum(random.normal(0, 0.03, 250)))
+        frames.append(
+            pd.DataFrame(
+                {"open": close, "high": close * 1.01, "low": close * 0.99, "close": close, "volume": 1.0},
+                index=pd.MultiIndex.from_product([[base_asset_id], index], names=("base_asset_id", "date_open")),
+            )
+        )
+    panel = pd.concat(frames)
+    entry_arguments_list = [{"bollinger_bands_period": 10}, {"bollinger_bands_period": 20}]
+    exit_arguments_list = [{"trailing_stop_loss_percentage": 0.05}, {"trailing_stop_loss_percentage": 0.2}]
+    summaries = run_parallel_backtests(
+        panel,
+        BollingerBandsEntryStrategy,
+        TrailingStopLossExitStrategy,
+        entry_arguments_list=entry_arguments_list,
+        exit_arguments_list=exit_arguments_list,
+        processes=2,
+    )
+    assert summaries.shape[0] == 12
+    for summary in summaries.itertuples():
+        result = backtest_dataframe(
+            summary.base_asset_id,
+            panel.xs(summary.base_asset_id, level="base_asset_id"),
+            BollingerBandsEntryStrategy,
+            summary.entry_arguments,
+            TrailingStopLossExitStrategy,
+            summary.exit_arguments,
+        )
+        assert summary.total_return == pytest.approx(result.total_return)
+        assert summary.trade_count == len(result.trades)
+
+
+def test_run_walk_forward_optimization_windows():
+    random = np.random.default_rng(4)
+    index = pd.date_range("2019-01-01", periods=400, freq="1D", tz="UTC")
+    frames = []
+    for base_asset_id, periods in ((1, 400), (2, 250)):
+        close = 100 * np.exp(np.cumsum(random.normal(0, 0.03, periods)))
+        frames.append(
+            pd.DataFrame(
+                {"open": close, "high": close * 1.01, "low": close * 0.99, "close": close, "volume": 1.0},
+                index=pd.MultiIndex.from_product(
+                    [[base_asset_id], index[-periods:]], names=("base_asset_id", "date_open")
+                ),
+            )
+        )
+    result = run_walk_forward_optimization(
+        pd.concat(frames),
+        BollingerBandsEntryStrategy,
+        TrailingStopLossExitStrategy,
+        train_bars=200,
+        test_bars=50,
+        entry_arguments_list=[{"bollinger_bands_period": 10}, {"bollinger_bands_period": 20}],
+        exit_arguments_list=[{"trailing_stop_loss_percentage": 0.05}, {"trailing_stop_loss_percentage": 0.2}],
+        processes=2,
+    )
+    assert [w.test_start for w in result.windows] == [index[200], index[250], index[300], index[350]]
+    assert result.windows[-1].test_end > index[-1]
+    assert result.entry_arguments == result.windows[-1].entry_arguments
+    assert np.isfinite(result.test_score)
@@ -0,0 +1,44 @@
+from unittest import mock
+import pytest
+import requests
+from trader.connections.http import (
+    HTTP_CACHE_MODE_CACHE,
+    HTTP_CACHE_MODE_REPLAY,
+    HTTPCacheMissError,
+    HTTPClient,
+    JitteredRetry,
+    canonicalize_url,
+)
+
+
+def test_canonicalize_url():
+    assert canonicalize_url("HTTPS://Example.com/path?b=2&a=1") == "https://example.com/path?a=1&b=2"
+    assert canonicalize_url("https://example.com/path?b=2", {"a": 1}) == "https://example.com/path?a=1&b=2"
+
+
+def test_http_client_cache_and_replay(tmp_path):
+    response = requests.Response()
+    response.status_code = 200
+    response.url = "https://example.com/path?a=1"
+    response.encoding = "utf-8"
+    response._content = b'{"value": 1}'
+    client = HTTPClient(str(tmp_path), mode=HTTP_CACHE_MODE_CACHE, ttl_seconds=60)
+    with mock.patch.object(requests.Session, "get", return_value=response) as get:
+        assert client.get("https://example.com/path", params={"a": 1}).json() == {"value": 1}
+        assert client.get("https://example.com/path?a=1").json() == {"value": 1}
+        assert get.call_count == 1
+    replay_client = HTTPClient(str(tmp_path), mode=HTTP_CACHE_MODE_REPLAY)
+    with mock.patch.object(requests.Session, "get") as get:
+        assert replay_client.get("https://example.com/path?a=1").json() == {"value": 1}
+        with pytest.raises(HTTPCacheMissError):
+            replay_client.get("https://example.com/path?a=2")
+        get.assert_not_called()
+    assert HTTPClient(str(tmp_path), mode=HTTP_CACHE_MODE_CACHE, ttl_seconds=0).evict_expired() == 1
+
+
+def test_jittered_retry_backoff_is_bounded():
+    retry = JitteredRetry(total=5, backoff_factor=1, backoff_max_seconds=3)
+    for _ in range(4):
+        retry = retry.increment(method="GET", url="/")
+    assert isinstance(retry, JitteredRetry)
+    assert all(0 <= retry.get_backoff_time() <= 3 for _ in range(100))
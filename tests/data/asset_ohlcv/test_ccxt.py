@@ -0,0 +1,78 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import trader.data.asset_ohlcv.ccxt as ccxt_module
+from trader.data.asset_ohlcv.ccxt import CCXTAssetOHLCVDataFeedRetriever
+from trader.utilities.functions.time import datetime_to_ms_timestamp
+
+
+FROM_INCLUSIVE = datetime(2021, 1, 1, tzinfo=timezone.utc)
+BARS = [
+    [datetime_to_ms_timestamp(FROM_INCLUSIVE + timedelta(days=i)), i, i + 2, i - 1, i + 1, 10 * i]
+    for i in range(1200)
+    if not 600 <= i < 640
+]
+
+
+class FakeExchange:
+    id = "fake"
+    rateLimit = 1
+
+    def __init__(self, config=None):
+        self.calls = 0
+
+    def fetch_ohlcv(self, symbol, timeframe=None, since=None, limit=None):
+        self.calls += 1
+        return [b for b in BARS if b[0] >= since][: limit or 300]
+
+
+class FakeAsyncExchange(FakeExchange):
+    async def fetch_ohlcv(self, symbol, timeframe=None, since=None, limit=None):
+        return super().fetch_ohlcv(symbol, timeframe=timeframe, since=since, limit=limit)
+
+    async def close(self):
+        pass
+
+
+class FakeCCXTRetriever(CCXTAssetOHLCVDataFeedRetriever):
+    SOURCE = None
+    CCXT_EXCHANGE_ID = "fake"
+
+    def validate_attributes(self):
+        return True
+
+
+def get_retriever(days: int) -> FakeCCXTRetriever:
+    retriever = FakeCCXTRetriever(
+        SimpleNamespace(symbol="BTC"),
+        SimpleNamespace(symbol="USD"),
+        SimpleNamespace(unit="d", amount=1, ccxt_label="1d"),
+        FROM_INCLUSIVE,
+        to_exclusive=FROM_INCLUSIVE + timedelta(days=days),
+    )
+    retriever._exchange = FakeExchange()
+    return retriever
+
+
+def test_generate_windows():
+    windows = get_retriever(1200).generate_windows()
+    assert windows == [
+        (FROM_INCLUSIVE, FROM_INCLUSIVE + timedelta(days=500)),
+        (FROM_INCLUSIVE + timedelta(days=500), FROM_INCLUSIVE + timedelta(days=1000)),
+        (FROM_INCLUSIVE + timedelta(days=1000), FROM_INCLUSIVE + timedelta(days=1200)),
+    ]
+    assert get_retriever(30).generate_windows() == [(FROM_INCLUSIVE, FROM_INCLUSIVE + timedelta(days=30))]
+
+
+def test_asynchronous_retrieval_matches_synchronous(monkeypatch):
+    monkeypatch.setattr(ccxt_module, "ccxt_async", SimpleNamespace(fake=FakeAsyncExchange))
+    retriever = get_retriever(1200)
+    expected = retriever.retrieve_asset_ohlcv_synchronously()
+    synchronous_calls = retriever.exchange.calls
+    assert len(expected) == 1160
+    assert asyncio.run(retriever.retrieve_asset_ohlcv_asynchronously()) == expected
+    assert retriever.retrieve_asset_ohlcv() == expected
+    assert retriever.exchange.calls == synchronous_calls
+    short_retriever = get_retriever(30)
+    assert short_retriever.retrieve_asset_ohlcv() == expected[:30]
+    assert short_retriever.exchange.calls == 1
@@ -0,0 +1,45 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import trader.data.asset_ohlcv.derived as derived_module
+from trader.data.asset_ohlcv.derived import DerivedAssetOHLCVDataFeedRetriever
+from trader.data.initial.timeframe import TIMEFRAME_ONE_DAY, TIMEFRAME_ONE_MONTH
+
+
+class FakeQuery:
+    def __init__(self, records):
+        self.records = records
+
+    def filter(self, *args):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def all(self):
+        return self.records
+
+
+def test_derived_retriever_resamples_stored_bars(monkeypatch):
+    from_inclusive = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    records = []
+    for i in range(59):
+        date_open = from_inclusive + timedelta(days=i)
+        date_high = date_open + timedelta(hours=6) if i % 2 == 0 else None
+        records.append((date_open, 1.0, 2.0 + i, 0.5, 1.5, 10.0, date_high, None))
+    monkeypatch.setattr(derived_module, "session", SimpleNamespace(query=lambda *columns: FakeQuery(records)))
+    source_asset_ohlcv_group = SimpleNamespace(
+        id=1, source_id=2, base_asset=None, quote_asset=None, timeframe_id=7, timeframe=TIMEFRAME_ONE_DAY
+    )
+    retriever = DerivedAssetOHLCVDataFeedRetriever(
+        source_asset_ohlcv_group,
+        TIMEFRAME_ONE_MONTH,
+        from_inclusive,
+        to_exclusive=datetime(2021, 3, 1, tzinfo=timezone.utc),
+    )
+    output = retriever.retrieve_asset_ohlcv()
+    assert [r["date_open"] for r in output] == [from_inclusive, datetime(2021, 2, 1, tzinfo=timezone.utc)]
+    assert output[0]["high"] == 32.0
+    assert output[0]["volume"] == 310.0
+    assert output[0]["date_high"] == datetime(2021, 1, 31, 6, 0, tzinfo=timezone.utc)
+    assert output[1]["date_high"] == datetime(2021, 2, 28, 6, 0, tzinfo=timezone.utc)
+    assert output[1]["date_low"] == datetime(2021, 2, 1, tzinfo=timezone.utc)
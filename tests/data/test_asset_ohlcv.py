@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+import trader.data.asset_ohlcv as asset_ohlcv_module
+from trader.data.asset_ohlcv import AssetOHLCVDataFeedRetriever
+
+
+class FakeQuery:
+    def __init__(self, calls, result):
+        self.calls = calls
+        self.result = result
+
+    def filter_by(self, **kwargs):
+        return self
+
+    def one_or_none(self):
+        self.calls.append("query")
+        return self.result
+
+
+class FakeSession:
+    def __init__(self, calls, asset_ohlcv_group):
+        self.calls = calls
+        self.asset_ohlcv_group = asset_ohlcv_group
+
+    def query(self, model):
+        return FakeQuery(self.calls, self.asset_ohlcv_group)
+
+    def add(self, instance):
+        instance.id = 1
+
+    def flush(self):
+        self.calls.append("flush")
+
+    def commit(self):
+        self.calls.append("commit")
+
+
+class FakeRetriever(AssetOHLCVDataFeedRetriever):
+    SOURCE = None
+
+    def __init__(self, calls, *args, **kwargs):
+        self.calls = calls
+        super().__init__(*args, **kwargs)
+
+    @property
+    def source_id(self):
+        return 1
+
+    def get_to_exclusive(self, to_exclusive):
+        return to_exclusive
+
+    def validate_attributes(self):
+        return True
+
+    def retrieve_asset_ohlcv(self):
+        self.calls.append("retrieve")
+        return [{"date_open": self.from_inclusive - timedelta(days=400)}, {"date_open": self.to_exclusive}]
+
+
+def test_update_asset_ohlcv_creates_partitions_for_retrieved_range_without_read_locks(monkeypatch):
+    calls = []
+    asset_ohlcv_group = SimpleNamespace(id=1, asset_ohlcv_group_watermark=None)
+    monkeypatch.setattr(asset_ohlcv_module, "session", FakeSession(calls, asset_ohlcv_group))
+    monkeypatch.setattr(
+        asset_ohlcv_module, "ensure_asset_ohlcv_partitions", lambda *args: calls.append(("partitions", *args))
+    )
+    monkeypatch.setattr(asset_ohlcv_module, "seed_asset_ohlcv_group_watermark", lambda *args: calls.append("seed"))
+    monkeypatch.setattr(asset_ohlcv_module, "insert_asset_ohlcv_records", lambda *args: calls.append("insert") or 1)
+    timeframe = SimpleNamespace(id=7, unit="d", amount=1)
+    from_inclusive = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    to_exclusive = datetime(2021, 2, 1, tzinfo=timezone.utc)
+    base_asset = SimpleNamespace(id=1)
+    quote_asset = SimpleNamespace(id=2)
+    retriever = FakeRetriever(calls, base_asset, quote_asset, timeframe, from_inclusive, to_exclusive=to_exclusive)
+    assert retriever.update_asset_ohlcv() == 1
+    assert calls == [
+        "retrieve",
+        "commit",
+        ("partitions", 7, "d", from_inclusive - timedelta(days=400), to_exclusive + timedelta(days=1)),
+        "query",
+        "seed",
+        "flush",
+        "insert",
+        "commit",
+    ]
@@ -0,0 +1,126 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from trader.indicators import (
+    AverageTrueRange,
+    BollingerBands,
+    ExponentialMovingAverage,
+    IndicatorRegistry,
+    MovingAverageConvergenceDivergence,
+    RelativeStrengthIndex,
+    RollingMax,
+    RollingMean,
+    RollingMin,
+    RollingStandardDeviation,
+)
+from trader.indicators.functions import rolling_mean_and_standard_deviation_matrix
+
+
+@pytest.fixture
+def ohlc_dataframe() -> pd.DataFrame:
+    rng = np.random.default_rng(11)
+    close = 30000 + np.cumsum(rng.normal(0, 50, 600))
+    return pd.DataFrame(
+        {"high": close + rng.uniform(0, 40, 600), "low": close - rng.uniform(0, 40, 600), "close": close}
+    )
+
+
+def test_batch_indicators_match_pandas(ohlc_dataframe):
+    close = ohlc_dataframe["close"]
+    high = ohlc_dataframe["high"]
+    low = ohlc_dataframe["low"]
+    bands = BollingerBands("close", 20).update_many(close.to_numpy())
+    middle = close.rolling(20).mean()
+    assert np.allclose(bands[:, 0], middle + 2 * close.rolling(20).std(), equal_nan=True)
+    assert np.allclose(bands[:, 1], middle, equal_nan=True)
+    assert np.allclose(RollingMax("high", 10).update_many(high.to_numpy()), high.rolling(10).max(), equal_nan=True)
+    assert np.allclose(RollingMin("low", 10).update_many(low.to_numpy()), low.rolling(10).min(), equal_nan=True)
+    previous_close = close.shift()
+    true_range = pd.concat((high - low, (high - previous_close).abs(), (previous_close - low).abs()), axis=1).max(
+        axis=1
+    )
+    assert np.allclose(
+        AverageTrueRange(14).update_many(high.to_numpy(), low.to_numpy(), close.to_numpy()),
+        true_range.rolling(14).mean(),
+        equal_nan=True,
+    )
+    delta = close.diff()
+    gain = delta.clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+    loss = (-delta).clip(lower=0).ewm(alpha=1 / 14, adjust=False).mean()
+    expected_rsi = np.array(100 * gain / (gain + loss))
+    expected_rsi[:14] = np.nan
+    assert np.allclose(RelativeStrengthIndex("close", 14).update_many(close.to_numpy()), expected_rsi, equal_nan=True)
+    expected_macd = np.array(close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean())
+    expected_macd[:25] = np.nan
+    macd = MovingAverageConvergenceDivergence("close").update_many(close.to_numpy())
+    assert np.allclose(macd[:, 0], expected_macd, equal_nan=True)
+    assert np.allclose(macd[:, 2], macd[:, 0] - macd[:, 1], equal_nan=True)
+
+
+@pytest.mark.parametrize("period", [5, 20])
+def test_rolling_statistics_are_stable_over_wide_dynamic_range(period):
+    rng = np.random.default_rng(5)
+    values = np.geomspace(5e4, 1e-4, 3000) * rng.uniform(0.9, 1.1, 3000)
+    windows = pd.Series(values).rolling(period)
+    expected_mean = windows.apply(np.mean, raw=True).to_numpy()
+    expected_standard_deviation = windows.apply(lambda w: w.std(ddof=1), raw=True).to_numpy()
+    standard_deviation = RollingStandardDeviation("close", period)
+    streamed = np.array([standard_deviation.update(v) for v in values.tolist()], dtype="float64")
+    assert np.allclose(RollingMean("close", period).update_many(values), expected_mean, rtol=1e-9, equal_nan=True)
+    assert np.allclose(
+        RollingStandardDeviation("close", period).update_many(values),
+        expected_standard_deviation,
+        rtol=1e-9,
+        atol=0,
+        equal_nan=True,
+    )
+    assert np.allclose(streamed, expected_standard_deviation, rtol=1e-9, atol=0, equal_nan=True)
+    bands = BollingerBands("close", period).update_many(values)
+    assert np.allclose(
+        bands[:, 2], expected_mean - 2 * expected_standard_deviation, rtol=1e-9, atol=1e-12, equal_nan=True
+    )
+
+
+def test_rolling_mean_and_standard_deviation_matrix_over_wide_dynamic_range():
+    rng = np.random.default_rng(5)
+    values = np.geomspace(5e4, 1e-4, 3000) * np.exp(rng.normal(0, 0.3, 3000))
+    periods = np.array([5, 20, 40, 20])
+    means, standard_deviations = rolling_mean_and_standard_deviation_matrix(values, periods, start_index=10)
+    assert means.shape == standard_deviations.shape == (4, 2990)
+    for period, period_means, period_standard_deviations in zip(periods, means, standard_deviations):
+        windows = pd.Series(values).rolling(period)
+        expected_mean = windows.apply(np.mean, raw=True).to_numpy()[10:]
+        expected_standard_deviation = windows.apply(lambda w: w.std(ddof=1), raw=True).to_numpy()[10:]
+        assert np.allclose(period_means, expected_mean, rtol=1e-9, atol=0, equal_nan=True)
+        assert np.allclose(period_standard_deviations, expected_standard_deviation, rtol=1e-9, atol=0, equal_nan=True)
+
+
+@pytest.mark.parametrize(
+    "indicator_factory",
+    [
+        lambda: BollingerBands("close", 20),
+        lambda: ExponentialMovingAverage("close", 9),
+        lambda: MovingAverageConvergenceDivergence("close"),
+        lambda: RelativeStrengthIndex("close", 14),
+        lambda: RollingMax("close", 7),
+    ],
+)
+def test_streaming_updates_match_batch(ohlc_dataframe, indicator_factory):
+    values = ohlc_dataframe["close"].to_numpy()
+    expected = indicator_factory().update_many(values)
+    indicator = indicator_factory()
+    head = indicator.update_many(values[:300])
+    resumed = indicator_factory()
+    resumed.set_state(json.loads(json.dumps(indicator.get_state())))
+    tail = np.array([resumed.update(v) for v in values[300:].tolist()], dtype="float64")
+    assert np.allclose(np.concatenate((head, tail.reshape(-1, *expected.shape[1:]))), expected, equal_nan=True)
+
+
+def test_indicator_registry_supports_multiple_sources_and_outputs(ohlc_dataframe):
+    indicator_registry = IndicatorRegistry(ohlc_dataframe)
+    bands, _ = indicator_registry.advance(BollingerBands("close", 20), 0, None)
+    average_true_range, _ = indicator_registry.advance(AverageTrueRange(14), 0, None)
+    assert bands.shape == (ohlc_dataframe.shape[0], 3)
+    assert average_true_range.shape == (ohlc_dataframe.shape[0],)
+    assert AverageTrueRange(14).get_key() == ("AverageTrueRange", "high", "low", "close", 14)
@@ -0,0 +1,49 @@
+import json
+import numpy as np
+import pandas as pd
+from trader.indicators import (
+    CumulativeMax,
+    ExponentialMovingAverage,
+    IndicatorRegistry,
+    RollingMean,
+    RollingStandardDeviation,
+)
+
+
+def test_streaming_indicators_match_pandas():
+    values = 30000 + np.cumsum(np.random.default_rng(3).normal(0, 50, 500))
+    series = pd.Series(values)
+    assert np.allclose(RollingMean("close", 20).update_many(values), series.rolling(20).mean(), equal_nan=True)
+    assert np.allclose(
+        RollingStandardDeviation("close", 20).update_many(values), series.rolling(20).std(), equal_nan=True
+    )
+    expected_ema = np.array(series.ewm(span=10, adjust=False).mean())
+    expected_ema[:9] = np.nan
+    assert np.allclose(ExponentialMovingAverage("close", 10).update_many(values), expected_ema, equal_nan=True)
+    assert np.array_equal(CumulativeMax("close").update_many(values), np.maximum.accumulate(values))
+
+
+def test_streaming_indicator_state_round_trip():
+    values = np.random.default_rng(5).normal(100, 5, 300)
+    indicator = RollingStandardDeviation("close", 15)
+    expected = indicator.update_many(values)
+    resumed = RollingStandardDeviation("close", 15)
+    resumed_values = resumed.update_many(values[:200])
+    state = json.loads(json.dumps(resumed.get_state()))
+    resumed = RollingStandardDeviation("close", 15)
+    resumed.set_state(state)
+    resumed_values = np.concatenate((resumed_values, resumed.update_many(values[200:])))
+    assert np.allclose(resumed_values, expected, equal_nan=True)
+
+
+def test_indicator_registry_memoizes_shared_indicators():
+    dataframe = pd.DataFrame({"close": np.random.default_rng(9).normal(100, 5, 100)})
+    indicator_registry = IndicatorRegistry(dataframe)
+    values, state = indicator_registry.advance(RollingMean("close", 10), 0, None)
+    shared_values, shared_state = indicator_registry.advance(RollingMean("close", 10), 0, None)
+    other_values, _ = indicator_registry.advance(RollingMean("close", 20), 0, None)
+    assert shared_values is values
+    assert shared_state is state
+    assert other_values is not values
+    assert not values.flags.writeable
+    assert len(indicator_registry.results) == 2
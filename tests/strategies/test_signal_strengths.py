@@ -0,0 +1,90 @@
+from copy import deepcopy
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+import pytest
+from trader.indicators import IndicatorRegistry
+from trader.strategies.entry.bollinger_bands import BollingerBandsEntryStrategy
+from trader.strategies.exit.base import ExitStrategy
+from trader.strategies.exit.trailing_stop_loss import TrailingStopLossExitStrategy
+
+
+@pytest.fixture
+def ohlcv_dataframe() -> pd.DataFrame:
+    random = np.random.default_rng(7)
+    close = 100 + np.cumsum(random.normal(0, 3, 200))
+    return pd.DataFrame(
+        {
+            "open": close + random.normal(0, 1, 200),
+            "high": close + np.abs(random.normal(0, 2, 200)),
+            "low": close - np.abs(random.normal(0, 2, 200)),
+            "close": close,
+            "volume": np.abs(random.normal(1000, 100, 200)),
+        },
+        index=pd.date_range("2021-01-01", periods=200, freq="1D", tz="UTC"),
+    )
+
+
+def test_bollinger_bands_buy_signal_strengths_match_per_row(ohlcv_dataframe):
+    strategy = BollingerBandsEntryStrategy(1, {"bollinger_bands_period": 10})
+    dataframe = strategy.enhance_data(ohlcv_dataframe)
+    expected = [strategy.get_buy_signal_strength(dataframe, i) for i in range(25, dataframe.shape[0])]
+    strengths = strategy.get_buy_signal_strengths(dataframe, 25)
+    assert strengths.tolist() == expected
+    assert strengths.any()
+
+
+def test_trailing_stop_loss_sell_signal_strengths_match_per_row(ohlcv_dataframe, monkeypatch):
+    monkeypatch.setattr(ExitStrategy, "flag_position_data_modified", lambda self: None)
+    arguments = {"trailing_stop_loss_percentage": 0.1}
+    row_position = SimpleNamespace(bought_price=100.0, data={})
+    row_strategy = TrailingStopLossExitStrategy(1, arguments, row_position)
+    expected = [row_strategy.get_sell_signal_strength(ohlcv_dataframe, i) for i in range(ohlcv_dataframe.shape[0])]
+    position = SimpleNamespace(bought_price=100.0, data={})
+    strategy = TrailingStopLossExitStrategy(1, arguments, position)
+    strengths = strategy.get_sell_signal_strengths(ohlcv_dataframe)
+    assert strengths.tolist() == expected
+    assert position.data == row_position.data
+
+
+def test_bollinger_bands_incremental_enhance_data_matches_full(ohlcv_dataframe):
+    strategy = BollingerBandsEntryStrategy(1, {"bollinger_bands_period": 10})
+    expected = strategy.enhance_data(ohlcv_dataframe)
+    _, indicator_state = strategy.enhance_data_incremental(ohlcv_dataframe.iloc[:150], 0, None)
+    dataframe, indicator_state = strategy.enhance_data_incremental(ohlcv_dataframe, 150, indicator_state)
+    assert np.allclose(dataframe["BB_LOWER"].iloc[150:], expected["BB_LOWER"].iloc[150:])
+    assert dataframe["BB_LOWER"].iloc[:150].isna().all()
+    assert indicator_state["date_open"] == ohlcv_dataframe.index[-1].isoformat()
+    stale_dataframe, _ = strategy.enhance_data_incremental(ohlcv_dataframe, 160, indicator_state)
+    assert np.allclose(stale_dataframe["BB_LOWER"], expected["BB_LOWER"], equal_nan=True)
+
+
+def test_trailing_stop_loss_position_sell_signal_strength_matrix_matches_per_position(ohlcv_dataframe):
+    arguments = {"trailing_stop_loss_percentage": 0.05}
+    positions = [
+        SimpleNamespace(bought_price=100.0, data={}),
+        SimpleNamespace(bought_price=90.0, data={"trailing_stop_loss_encountered_max": 130.0}),
+        SimpleNamespace(bought_price=110.0, data={}),
+    ]
+    start_indices = np.array([0, 120, 200])
+    expected_positions = deepcopy(positions)
+    expected = np.zeros((3, ohlcv_dataframe.shape[0]))
+    for i, (position, start_index) in enumerate(zip(expected_positions, start_indices)):
+        strategy = TrailingStopLossExitStrategy(1, arguments, position)
+        expected[i, start_index:] = strategy.get_sell_signal_strengths(ohlcv_dataframe, start_index)
+    strategy = TrailingStopLossExitStrategy(1, arguments, None)
+    matrix = strategy.get_position_sell_signal_strength_matrix(ohlcv_dataframe, positions, start_indices)
+    assert np.array_equal(matrix, expected)
+    assert [p.data for p in positions] == [p.data for p in expected_positions]
+
+
+def test_bollinger_bands_buy_signal_strengths_share_registry_arrays(ohlcv_dataframe):
+    indicator_registry = IndicatorRegistry(ohlcv_dataframe)
+    strategies = [BollingerBandsEntryStrategy(1, {"bollinger_bands_period": 10}) for _ in range(2)]
+    indicator_values = [s.advance_indicators(indicator_registry, 0, None)[0] for s in strategies]
+    assert indicator_values[0]["BB"] is indicator_values[1]["BB"]
+    assert not indicator_values[0]["BB"].flags.writeable
+    expected = strategies[0].get_buy_signal_strengths(strategies[0].enhance_data(ohlcv_dataframe), 25)
+    strengths = strategies[1].get_buy_signal_strengths_from_indicators(indicator_registry, indicator_values[1], 25)
+    assert np.array_equal(strengths, expected)
+    assert strengths.any()
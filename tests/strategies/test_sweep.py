@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+import numpy as np
+import pandas as pd
+import pytest
+from trader.strategies.entry.base import EntryStrategy
+from trader.strategies.entry.bollinger_bands import BollingerBandsEntryStrategy
+from trader.strategies.exit.base import ExitStrategy
+from trader.strategies.exit.trailing_stop_loss import TrailingStopLossExitStrategy
+from trader.strategies.sweep import sweep_signal_strengths
+
+
+@pytest.fixture
+def ohlcv_dataframe() -> pd.DataFrame:
+    random = np.random.default_rng(11)
+    close = 40000 + np.cumsum(random.normal(0, 800, 300))
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + np.abs(random.normal(0, 300, 300)),
+            "low": close - np.abs(random.normal(0, 300, 300)),
+            "close": close,
+            "volume": np.abs(random.normal(1000, 100, 300)),
+        },
+        index=pd.date_range("2021-01-01", periods=300, freq="1D", tz="UTC"),
+    )
+
+
+def test_bollinger_bands_sweep_matches_per_instance(ohlcv_dataframe):
+    strategy = BollingerBandsEntryStrategy(1, {})
+    arguments_list, matrix = sweep_signal_strengths(strategy, ohlcv_dataframe, start_index=30)
+    assert matrix.shape == (len(BollingerBandsEntryStrategy.PARAMETER_SPACE["bollinger_bands_period"]), 270)
+    expected = EntryStrategy.get_buy_signal_strength_matrix(strategy, ohlcv_dataframe, arguments_list, 30)
+    assert np.array_equal(matrix, expected)
+    assert matrix.any()
+
+
+def test_bollinger_bands_sweep_matches_per_instance_over_wide_dynamic_range(ohlcv_dataframe):
+    random = np.random.default_rng(5)
+    close = np.geomspace(5e4, 1e-4, 300) * np.exp(random.normal(0, 0.3, 300))
+    dataframe = ohlcv_dataframe.assign(open=close, high=close * 1.01, low=close * 0.99, close=close)
+    strategy = BollingerBandsEntryStrategy(1, {})
+    arguments_list, matrix = sweep_signal_strengths(strategy, dataframe)
+    expected = EntryStrategy.get_buy_signal_strength_matrix(strategy, dataframe, arguments_list)
+    assert np.array_equal(matrix, expected)
+    assert matrix.any()
+
+
+def test_trailing_stop_loss_sweep_matches_per_instance(ohlcv_dataframe, monkeypatch):
+    monkeypatch.setattr(ExitStrategy, "flag_position_data_modified", lambda self: None)
+    position = SimpleNamespace(bought_price=40000.0, data={})
+    strategy = TrailingStopLossExitStrategy(1, {}, position)
+    arguments_list, matrix = sweep_signal_strengths(strategy, ohlcv_dataframe)
+    assert matrix.shape == (20, 300)
+    expected = ExitStrategy.get_sell_signal_strength_matrix(strategy, ohlcv_dataframe, arguments_list)
+    assert np.array_equal(matrix, expected)
+    assert position.data == {}
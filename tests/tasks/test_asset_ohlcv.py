@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from dateutil.relativedelta import relativedelta
+import trader.tasks.asset_ohlcv as asset_ohlcv_tasks
+from trader.models.asset_ohlcv import AssetOHLCVGroup
+from trader.models.timeframe import Timeframe
+from trader.utilities.functions.time import datetime_to_ms_timestamp
+
+
+ONE_DAY = SimpleNamespace(id=7, unit="d", amount=1, seconds_length=86400)
+ONE_MONTH = SimpleNamespace(id=8, unit="M", amount=1, seconds_length=None)
+
+
+class FakeQuery:
+    def __init__(self, results):
+        self.results = results
+
+    def get(self, id):
+        return self.results["get"]
+
+    def all(self):
+        return self.results["all"]
+
+    def filter_by(self, **kwargs):
+        return self
+
+    def one_or_none(self):
+        return self.results["one_or_none"]
+
+
+class FakeSession:
+    def __init__(self, results):
+        self.results = results
+
+    def query(self, model):
+        return FakeQuery(self.results[model])
+
+    def commit(self):
+        pass
+
+
+class FakeDerivedRetriever:
+    ranges = []
+
+    def __init__(self, source_asset_ohlcv_group, timeframe, from_inclusive, to_exclusive=None):
+        self.ranges.append((timeframe.id, from_inclusive, to_exclusive))
+
+    def update_asset_ohlcv(self):
+        return 1
+
+
+def test_update_derived_asset_ohlcv_rederives_backfilled_range(monkeypatch):
+    source_asset_ohlcv_group = SimpleNamespace(
+        id=1, source_id=2, base_asset_id=3, quote_asset_id=4, timeframe_id=ONE_DAY.id, timeframe=ONE_DAY
+    )
+    last_date_open = datetime(2021, 6, 1, tzinfo=timezone.utc)
+    derived_asset_ohlcv_group = SimpleNamespace(
+        source_asset_ohlcv_group_id=1,
+        asset_ohlcv_group_watermark=SimpleNamespace(last_date_open=last_date_open),
+    )
+    fake_session = FakeSession(
+        {
+            AssetOHLCVGroup: {"get": source_asset_ohlcv_group, "one_or_none": derived_asset_ohlcv_group},
+            Timeframe: {"all": [ONE_DAY, ONE_MONTH]},
+        }
+    )
+    monkeypatch.setattr(asset_ohlcv_tasks, "session", fake_session)
+    monkeypatch.setattr(asset_ohlcv_tasks, "DerivedAssetOHLCVDataFeedRetriever", FakeDerivedRetriever)
+    FakeDerivedRetriever.ranges = []
+    asset_ohlcv_tasks.update_derived_asset_ohlcv(1)
+    from_inclusive = datetime(2021, 3, 10, tzinfo=timezone.utc)
+    to_exclusive = datetime(2021, 3, 20, tzinfo=timezone.utc)
+    asset_ohlcv_tasks.update_derived_asset_ohlcv(
+        1, datetime_to_ms_timestamp(from_inclusive), datetime_to_ms_timestamp(to_exclusive)
+    )
+    assert FakeDerivedRetriever.ranges == [
+        (ONE_MONTH.id, last_date_open + relativedelta(months=1), None),
+        (ONE_MONTH.id, from_inclusive - relativedelta(months=1), to_exclusive + relativedelta(months=1)),
+    ]
+
+
+class FakeGroup:
+    signatures = []
+
+    def __init__(self, signatures):
+        FakeGroup.signatures = list(signatures)
+
+    def apply_async(self):
+        pass
+
+
+def test_queue_backfill_dispatches_sql_planned_gaps(monkeypatch):
+    from_inclusive = datetime(2021, 3, 10, tzinfo=timezone.utc)
+    to_exclusive = datetime(2021, 3, 20, tzinfo=timezone.utc)
+    calls = []
+    monkeypatch.setattr(asset_ohlcv_tasks, "SOURCE_COIN_MARKET_CAP", SimpleNamespace(fetch_id=lambda: 2))
+    monkeypatch.setattr(asset_ohlcv_tasks, "TIMEFRAME_ONE_DAY", SimpleNamespace(fetch_id=lambda: ONE_DAY.id))
+    monkeypatch.setattr(asset_ohlcv_tasks, "get_asset_us_dollar_id", lambda: 4)
+    monkeypatch.setattr(
+        asset_ohlcv_tasks,
+        "fetch_asset_ohlcv_gaps",
+        lambda *args, **kwargs: calls.append((args, kwargs)) or [(3, from_inclusive, to_exclusive)],
+    )
+    monkeypatch.setattr(asset_ohlcv_tasks, "group", FakeGroup)
+    asset_ohlcv_tasks.queue_backfill_cryptocurrency_one_day_asset_ohlcv_gaps_from_coin_market_cap(coalesce_bars=3)
+    assert calls == [((2, 4, ONE_DAY.id), {"coalesce_bars": 3})]
+    assert [s.args for s in FakeGroup.signatures] == [
+        (3, datetime_to_ms_timestamp(from_inclusive), datetime_to_ms_timestamp(to_exclusive))
+    ]
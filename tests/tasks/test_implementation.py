@@ -0,0 +1,64 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+import pandas as pd
+import trader.tasks.implementation as implementation_tasks
+from trader.strategies.exit.trailing_stop_loss import TrailingStopLossExitStrategy
+from trader.utilities.functions.exit_implementation import OpenPosition
+from trader.utilities.strategy_registry import RegisteredStrategyVersionInstance
+
+
+def test_run_exit_implementations_keeps_state_per_exit_implementation(monkeypatch):
+    index = pd.date_range("2021-01-01", periods=8, freq="1D", tz="UTC")
+    high = [100.0, 300.0, 120.0, 110.0, 130.0, 140.0, 125.0, 118.0]
+    dataframe = pd.DataFrame({"open": high, "high": high, "low": high, "close": high, "volume": 1.0}, index=index)
+    position = OpenPosition(1, 100.0, datetime(2021, 1, 1, tzinfo=timezone.utc), {})
+    implementations = {21: {1: (31, None)}, 22: {1: (32, index[3].to_pydatetime())}}
+    stored_states = []
+    sell_signals = []
+    monkeypatch.setattr(implementation_tasks, "session", SimpleNamespace(commit=lambda: None))
+    monkeypatch.setattr(implementation_tasks, "fetch_open_positions", lambda base_asset_id: [position])
+    monkeypatch.setattr(
+        implementation_tasks,
+        "exit_state_store",
+        SimpleNamespace(
+            load_states=lambda positions: None,
+            store_states=lambda states, maximum_fields: stored_states.append(states),
+        ),
+    )
+    monkeypatch.setattr(
+        implementation_tasks,
+        "ensure_exit_implementations",
+        lambda timeframe_id, strategy_version_instance_id, position_ids: implementations[strategy_version_instance_id],
+    )
+    monkeypatch.setattr(
+        implementation_tasks,
+        "insert_exit_implementation_runs",
+        lambda exit_implementation_ids, start_dates, end_date, extra_fields: {
+            i: i + 100 for i in exit_implementation_ids
+        },
+    )
+    monkeypatch.setattr(
+        implementation_tasks,
+        "insert_sell_signals",
+        lambda run_ids, signal_dates, strengths: sell_signals.extend(zip(run_ids, signal_dates)),
+    )
+    arguments = {"trailing_stop_loss_percentage": 0.2}
+    implementation_tasks.run_exit_implementations(
+        SimpleNamespace(id=7, unit="d", amount=1),
+        1,
+        dataframe,
+        {},
+        [
+            (TrailingStopLossExitStrategy, RegisteredStrategyVersionInstance(21, arguments, None)),
+            (TrailingStopLossExitStrategy, RegisteredStrategyVersionInstance(22, arguments, None)),
+        ],
+    )
+    assert stored_states == [
+        {
+            1: {
+                "31": {"trailing_stop_loss_encountered_max": 300.0},
+                "32": {"trailing_stop_loss_encountered_max": 140.0},
+            }
+        }
+    ]
+    assert {run_id for run_id, _ in sell_signals} == {131}
@@ -0,0 +1,129 @@
+from datetime import datetime, timezone
+import pandas as pd
+import pytest
+from trader.data.initial.timeframe import (
+    TIMEFRAME_EIGHT_MINUTE,
+    TIMEFRAME_FIVE_MINUTE,
+    TIMEFRAME_ONE_DAY,
+    TIMEFRAME_ONE_HOUR,
+    TIMEFRAME_ONE_MINUTE,
+    TIMEFRAME_ONE_MONTH,
+)
+from trader.utilities.functions.asset_ohlcv import (
+    find_asset_ohlcv_gaps,
+    resample_asset_ohlcv_dataframe,
+    timeframe_is_derivable,
+)
+
+
+def test_timeframe_is_derivable():
+    assert timeframe_is_derivable(TIMEFRAME_ONE_MINUTE, TIMEFRAME_EIGHT_MINUTE)
+    assert timeframe_is_derivable(TIMEFRAME_ONE_HOUR, TIMEFRAME_ONE_DAY)
+    assert timeframe_is_derivable(TIMEFRAME_ONE_DAY, TIMEFRAME_ONE_MONTH)
+    assert not timeframe_is_derivable(TIMEFRAME_FIVE_MINUTE, TIMEFRAME_EIGHT_MINUTE)
+    assert not timeframe_is_derivable(TIMEFRAME_ONE_DAY, TIMEFRAME_ONE_HOUR)
+    assert not timeframe_is_derivable(TIMEFRAME_ONE_MONTH, TIMEFRAME_ONE_DAY)
+
+
+def test_resample_asset_ohlcv_dataframe_one_hour():
+    index = pd.date_range("2021-01-01 00:00", periods=90, freq="1min", tz="UTC")
+    dataframe = pd.DataFrame(
+        {
+            "open": range(90),
+            "high": [100.0 if i == 17 else float(i) + 1 for i in range(90)],
+            "low": [-10.0 if i == 42 else float(i) - 1 for i in range(90)],
+            "close": [float(i) + 0.5 for i in range(90)],
+            "volume": 1.0,
+        },
+        index=index,
+    )
+    output = resample_asset_ohlcv_dataframe(dataframe, TIMEFRAME_ONE_MINUTE, TIMEFRAME_ONE_HOUR)
+    assert output.shape[0] == 1
+    row = output.iloc[0]
+    assert output.index[0] == datetime(2021, 1, 1, tzinfo=timezone.utc)
+    assert row["open"] == 0.0
+    assert row["high"] == 100.0
+    assert row["low"] == -10.0
+    assert row["close"] == 59.5
+    assert row["volume"] == 60.0
+    assert row["date_high"] == datetime(2021, 1, 1, 0, 17, tzinfo=timezone.utc)
+    assert row["date_low"] == datetime(2021, 1, 1, 0, 42, tzinfo=timezone.utc)
+    output = resample_asset_ohlcv_dataframe(dataframe, TIMEFRAME_ONE_MINUTE, TIMEFRAME_ONE_HOUR, complete_only=False)
+    assert output.shape[0] == 2
+    assert output.iloc[1]["volume"] == 30.0
+
+
+def test_resample_asset_ohlcv_dataframe_one_month():
+    index = pd.date_range("2021-01-15", "2021-04-30", freq="1D", tz="UTC")
+    dataframe = pd.DataFrame({"open": 1.0, "high": 2.0, "low": 0.5, "close": 1.5, "volume": 1.0}, index=index)
+    dataframe = dataframe.drop(pd.Timestamp("2021-03-10", tz="UTC"))
+    output = resample_asset_ohlcv_dataframe(dataframe, TIMEFRAME_ONE_DAY, TIMEFRAME_ONE_MONTH)
+    assert list(output.index) == [
+        pd.Timestamp("2021-02-01", tz="UTC"),
+        pd.Timestamp("2021-04-01", tz="UTC"),
+    ]
+    assert list(output["volume"]) == [28.0, 30.0]
+
+
+def test_resample_asset_ohlcv_dataframe_with_partly_null_extreme_dates():
+    index = pd.date_range("2021-01-01 00:00", periods=120, freq="1min", tz="UTC")
+    date_highs = [None] * 120
+    date_highs[17] = datetime(2021, 1, 1, 0, 17, 30, tzinfo=timezone.utc)
+    dataframe = pd.DataFrame(
+        {
+            "open": 1.0,
+            "high": [100.0 if i in (17, 77) else 2.0 for i in range(120)],
+            "low": [0.1 if i in (42, 102) else 0.5 for i in range(120)],
+            "close": 1.5,
+            "volume": 1.0,
+            "date_high": date_highs,
+            "date_low": [None] * 120,
+        },
+        index=index,
+    )
+    output = resample_asset_ohlcv_dataframe(dataframe, TIMEFRAME_ONE_MINUTE, TIMEFRAME_ONE_HOUR)
+    assert list(output["date_high"]) == [
+        pd.Timestamp("2021-01-01 00:17:30", tz="UTC"),
+        pd.Timestamp("2021-01-01 01:17", tz="UTC"),
+    ]
+    assert list(output["date_low"]) == [
+        pd.Timestamp("2021-01-01 00:42", tz="UTC"),
+        pd.Timestamp("2021-01-01 01:42", tz="UTC"),
+    ]
+
+
+def test_resample_asset_ohlcv_dataframe_invalid_timeframes():
+    dataframe = pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
+    with pytest.raises(ValueError):
+        resample_asset_ohlcv_dataframe(dataframe, TIMEFRAME_FIVE_MINUTE, TIMEFRAME_EIGHT_MINUTE)
+
+
+def test_find_asset_ohlcv_gaps_one_day():
+    index = pd.date_range("2021-01-01", "2021-02-28", freq="1D", tz="UTC")
+    index = index.drop(pd.DatetimeIndex(["2021-01-05", "2021-01-06", "2021-01-09", "2021-02-10"], tz="UTC"))
+    assert find_asset_ohlcv_gaps(index, TIMEFRAME_ONE_DAY) == [
+        (datetime(2021, 1, 5, tzinfo=timezone.utc), datetime(2021, 1, 7, tzinfo=timezone.utc)),
+        (datetime(2021, 1, 9, tzinfo=timezone.utc), datetime(2021, 1, 10, tzinfo=timezone.utc)),
+        (datetime(2021, 2, 10, tzinfo=timezone.utc), datetime(2021, 2, 11, tzinfo=timezone.utc)),
+    ]
+    assert find_asset_ohlcv_gaps(index, TIMEFRAME_ONE_DAY, coalesce_bars=2) == [
+        (datetime(2021, 1, 5, tzinfo=timezone.utc), datetime(2021, 1, 10, tzinfo=timezone.utc)),
+        (datetime(2021, 2, 10, tzinfo=timezone.utc), datetime(2021, 2, 11, tzinfo=timezone.utc)),
+    ]
+    assert find_asset_ohlcv_gaps(
+        index,
+        TIMEFRAME_ONE_DAY,
+        from_inclusive=datetime(2020, 12, 30, tzinfo=timezone.utc),
+        to_exclusive=datetime(2021, 3, 2, tzinfo=timezone.utc),
+        coalesce_bars=60,
+    ) == [(datetime(2020, 12, 30, tzinfo=timezone.utc), datetime(2021, 3, 2, tzinfo=timezone.utc))]
+
+
+def test_find_asset_ohlcv_gaps_one_month():
+    index = pd.DatetimeIndex(["2020-01-01", "2020-02-01", "2020-05-01"], tz="UTC")
+    assert find_asset_ohlcv_gaps(
+        index, TIMEFRAME_ONE_MONTH, to_exclusive=datetime(2020, 7, 1, tzinfo=timezone.utc)
+    ) == [
+        (datetime(2020, 3, 1, tzinfo=timezone.utc), datetime(2020, 5, 1, tzinfo=timezone.utc)),
+        (datetime(2020, 6, 1, tzinfo=timezone.utc), datetime(2020, 7, 1, tzinfo=timezone.utc)),
+    ]
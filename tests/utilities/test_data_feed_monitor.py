@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+import trader.utilities.data_feed_monitor as data_feed_monitor_module
+from trader.utilities.data_feed_monitor import DataFeedMonitor
+from trader.utilities.functions import generate_data_feed_monitor_value
+
+
+class FakePipeline:
+    def __init__(self, values):
+        self.values = values
+        self.pending = {}
+
+    def set(self, key, value):
+        self.pending[key] = value
+
+    def execute(self):
+        self.values.update({k: v.encode() for k, v in self.pending.items()})
+
+
+class FakeCache:
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def pipeline(self):
+        return FakePipeline(self.values)
+
+
+def test_data_feed_monitor_persists_ready_base_assets_across_restarts(monkeypatch):
+    dispatched = []
+    monkeypatch.setattr(data_feed_monitor_module, "cache", FakeCache())
+    monkeypatch.setattr(
+        data_feed_monitor_module, "fetch_data_feeds_to_strategy_mapping", lambda is_entry: {(1, 2): [object()]}
+    )
+    monkeypatch.setattr(
+        data_feed_monitor_module,
+        "run_implementations_batch",
+        SimpleNamespace(apply_async=lambda args, priority: dispatched.append(args)),
+    )
+    data_feed_monitor = DataFeedMonitor()
+    data_feed_monitor.process_record(generate_data_feed_monitor_value(3, 10, 1).encode())
+    data_feed_monitor.process_record(generate_data_feed_monitor_value(3, 10, 2).encode())
+    data_feed_monitor.process_record(generate_data_feed_monitor_value(3, 11, 1).encode())
+    restarted_data_feed_monitor = DataFeedMonitor()
+    assert restarted_data_feed_monitor.data_feed_load_status == {3: {10: {(1, 2): {1, 2}}, 11: {(1, 2): {2}}}}
+    assert restarted_data_feed_monitor.ready_base_assets == {(3, (1, 2)): [10]}
+    restarted_data_feed_monitor.dispatch_batches()
+    assert dispatched == [(3, [10], (1, 2))]
+    assert DataFeedMonitor().ready_base_assets == {}
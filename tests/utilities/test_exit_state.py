@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+import pytest
+import trader.utilities.exit_state as exit_state_module
+from trader.utilities.exit_state import (
+    PostgresExitStateStore,
+    RedisExitStateStore,
+    get_changed_exit_states,
+    get_exit_state_store,
+)
+from trader.utilities.functions.exit_implementation import OpenPosition
+
+
+def test_get_changed_exit_states():
+    date_opened = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    positions = [
+        OpenPosition(1, 10.0, date_opened, {"5": {"trailing_stop_loss_encountered_max": 12.0}, "6": {"note": "a"}}),
+        OpenPosition(2, 10.0, date_opened, {"5": {"trailing_stop_loss_encountered_max": 11.0}}),
+        OpenPosition(3, 10.0, date_opened, {"trailing_stop_loss_encountered_max": 9.0, "7": {"note": "b"}}),
+    ]
+    previous_datas = [
+        {"5": {"trailing_stop_loss_encountered_max": 11.0}, "6": {"note": "a"}},
+        {"5": {"trailing_stop_loss_encountered_max": 11.0}},
+        {"trailing_stop_loss_encountered_max": 9.0},
+    ]
+    assert get_changed_exit_states(positions, previous_datas) == {
+        1: {"5": {"trailing_stop_loss_encountered_max": 12.0}},
+        3: {"7": {"note": "b"}},
+    }
+
+
+class FakePipeline:
+    def __init__(self, hashes):
+        self.hashes = hashes
+        self.commands = []
+
+    def hgetall(self, key):
+        self.commands.append(key)
+
+    def execute(self):
+        return [self.hashes.get(k, {}) for k in self.commands]
+
+
+class FakeCache:
+    def __init__(self):
+        self.hashes = {}
+
+    def register_script(self, script):
+        def store_script(keys, args, client):
+            fields = self.hashes.setdefault(keys[0], {})
+            for i in range(2, len(args), 3):
+                field = args[i].encode()
+                if not args[i + 2] or field not in fields or float(args[i + 1]) > float(fields[field]):
+                    fields[field] = args[i + 1].encode()
+
+        return store_script
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self.hashes)
+
+
+def test_redis_exit_state_store_keeps_states_per_exit_implementation(monkeypatch):
+    monkeypatch.setattr(exit_state_module, "cache", FakeCache())
+    store = RedisExitStateStore()
+    store.store_states(
+        {
+            1: {
+                "5": {"trailing_stop_loss_encountered_max": 12.0},
+                "6": {"trailing_stop_loss_encountered_max": 15.0, "note": "a"},
+            }
+        },
+        ("trailing_stop_loss_encountered_max",),
+    )
+    store.store_states(
+        {1: {"5": {"trailing_stop_loss_encountered_max": 11.0}}}, ("trailing_stop_loss_encountered_max",)
+    )
+    position = OpenPosition(1, 10.0, datetime(2021, 1, 1, tzinfo=timezone.utc), {"5": {"other": 1}, "legacy": 2.0})
+    store.load_states([position])
+    assert position.data == {
+        "5": {"other": 1, "trailing_stop_loss_encountered_max": 12.0},
+        "6": {"trailing_stop_loss_encountered_max": 15.0, "note": "a"},
+        "legacy": 2.0,
+    }
+
+
+def test_get_exit_state_store():
+    assert isinstance(get_exit_state_store("redis"), RedisExitStateStore)
+    assert isinstance(get_exit_state_store("postgres"), PostgresExitStateStore)
+    with pytest.raises(ValueError):
+        get_exit_state_store("memory")
@@ -0,0 +1,107 @@
+from types import SimpleNamespace
+from trader.strategies.entry.bollinger_bands import BollingerBandsEntryStrategy
+from trader.strategies.exit.trailing_stop_loss import TrailingStopLossExitStrategy
+from trader.utilities import strategy_registry as strategy_registry_module
+from trader.utilities.strategy_registry import (
+    SELECT_ENABLED_STRATEGY_VERSION_INSTANCES_SQL,
+    RegisteredStrategyVersionInstance,
+    StrategyRegistry,
+)
+
+
+class FakePubSub:
+    def __init__(self):
+        self.messages = []
+
+    def subscribe(self, channel):
+        pass
+
+    def get_message(self):
+        return self.messages.pop(0) if self.messages else None
+
+
+class FakeCache:
+    def __init__(self):
+        self.pubsubs = []
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        self.pubsubs.append(FakePubSub())
+        return self.pubsubs[-1]
+
+
+class FakeCursor:
+    def __init__(self, rows, executions):
+        self.rows = rows
+        self.executions = executions
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def execute(self, sql, parameters):
+        self.executions.append((sql, parameters))
+
+    def fetchall(self):
+        return self.rows
+
+
+class FakeSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.executions = []
+
+    def connection(self):
+        return SimpleNamespace(connection=self)
+
+    def cursor(self):
+        return FakeCursor(self.rows, self.executions)
+
+
+def test_strategy_registry_loads_once_until_invalidated(monkeypatch):
+    bollinger_bands = (BollingerBandsEntryStrategy.NAME, True, BollingerBandsEntryStrategy.VERSION)
+    trailing_stop_loss = (TrailingStopLossExitStrategy.NAME, False, TrailingStopLossExitStrategy.VERSION)
+    rows = [
+        (*bollinger_bands, 7, {"bollinger_bands_period": 20}, 1),
+        (BollingerBandsEntryStrategy.NAME, True, "0.0.1", 8, {"bollinger_bands_period": 25}, 1),
+        (*bollinger_bands, 9, {"bollinger_bands_period": 30}, None),
+        (*trailing_stop_loss, 11, {"trailing_stop_loss_percentage": 0.1}, 2),
+    ]
+    fake_cache = FakeCache()
+    fake_session = FakeSession(rows)
+    monkeypatch.setattr(strategy_registry_module, "cache", fake_cache)
+    monkeypatch.setattr(strategy_registry_module, "session", fake_session)
+    monkeypatch.setattr(
+        strategy_registry_module,
+        "fetch_data_feeds_to_strategy_mapping",
+        lambda is_entry: {(1,): [BollingerBandsEntryStrategy if is_entry else TrailingStopLossExitStrategy]},
+    )
+    registry = StrategyRegistry()
+    assert registry.fetch_timeframe_instances(3) == {
+        bollinger_bands: [
+            RegisteredStrategyVersionInstance(7, {"bollinger_bands_period": 20}, 1),
+            RegisteredStrategyVersionInstance(9, {"bollinger_bands_period": 30}, None),
+        ],
+        (BollingerBandsEntryStrategy.NAME, True, "0.0.1"): [
+            RegisteredStrategyVersionInstance(8, {"bollinger_bands_period": 25}, 1)
+        ],
+        trailing_stop_loss: [RegisteredStrategyVersionInstance(11, {"trailing_stop_loss_percentage": 0.1}, 2)],
+    }
+    assert fake_session.executions == [(SELECT_ENABLED_STRATEGY_VERSION_INSTANCES_SQL, {"timeframe_id": 3})]
+    registry.clear()
+    expected_entries = [
+        (BollingerBandsEntryStrategy, RegisteredStrategyVersionInstance(7, {"bollinger_bands_period": 20}, 1)),
+        (BollingerBandsEntryStrategy, RegisteredStrategyVersionInstance(9, {"bollinger_bands_period": 30}, None)),
+    ]
+    expected_exits = [
+        (TrailingStopLossExitStrategy, RegisteredStrategyVersionInstance(11, {"trailing_stop_loss_percentage": 0.1}, 2))
+    ]
+    assert registry.get_enabled_strategy_version_instances(3, True, (1,)) == expected_entries
+    assert registry.get_enabled_strategy_version_instances(3, True, (1,)) == expected_entries
+    assert registry.get_enabled_strategy_version_instances(3, False, (1,)) == expected_exits
+    assert registry.get_enabled_strategy_version_instances(3, True, (2,)) == []
+    assert len(fake_session.executions) == 2
+    fake_cache.pubsubs[-1].messages.append({"type": "message", "data": b"invalidate"})
+    assert registry.get_enabled_strategy_version_instances(3, True, (1,)) == expected_entries
+    assert len(fake_session.executions) == 3
@@ -0,0 +1,23 @@
+import pytest
+import trader.utilities.token_bucket as token_bucket_module
+from trader.utilities.token_bucket import TokenBucket
+
+
+def test_token_bucket_reserve(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(token_bucket_module, "monotonic", lambda: now[0])
+    token_bucket = TokenBucket(2.0, capacity=2.0)
+    assert token_bucket.reserve() == 0.0
+    assert token_bucket.reserve() == 0.0
+    assert token_bucket.reserve() == pytest.approx(0.5)
+    assert token_bucket.reserve() == pytest.approx(1.0)
+    now[0] += 1.5
+    assert token_bucket.reserve() == 0.0
+    now[0] += 10.0
+    assert token_bucket.reserve() == 0.0
+    assert token_bucket.reserve() == 0.0
+    assert token_bucket.reserve() == pytest.approx(0.5)
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+    with pytest.raises(ValueError):
+        TokenBucket(1.0, capacity=0.5)
@@ -0,0 +1,32 @@
+import os
+import pathlib
+import sys
+
+
+sys.path.append(os.path.split(pathlib.Path(__file__).parent.absolute())[0])
+
+
+from textwrap import dedent
+from trader.connections.database import database
+from trader.models.entry_implementation import EntryImplementation
+from trader.utilities.logging import logger
+
+
+ADD_ENTRY_IMPLEMENTATION_INDICATOR_STATE_SQL = dedent(
+    """
+    ALTER TABLE public.{entry_implementation_table}
+    ADD COLUMN IF NOT EXISTS indicator_state JSONB NULL
+    """.format(
+        entry_implementation_table=EntryImplementation.__tablename__
+    )
+).strip()
+
+
+def main():
+    with database.begin() as connection:
+        logger.debug("Adding entry implementation indicator state column")
+        connection.exec_driver_sql(ADD_ENTRY_IMPLEMENTATION_INDICATOR_STATE_SQL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+import os
+import pathlib
+import sys
+
+
+sys.path.append(os.path.split(pathlib.Path(__file__).parent.absolute())[0])
+
+
+from textwrap import dedent
+from trader.connections.database import database
+from trader.models.position import Position
+from trader.utilities.logging import logger
+
+
+ADD_POSITION_DATE_CLOSED_SQL = dedent(
+    """
+    ALTER TABLE public.{position_table}
+    ADD COLUMN IF NOT EXISTS date_closed TIMESTAMP WITH TIME ZONE NULL
+    """.format(
+        position_table=Position.__tablename__
+    )
+).strip()
+
+
+def main():
+    with database.begin() as connection:
+        logger.debug("Adding position date closed column")
+        connection.exec_driver_sql(ADD_POSITION_DATE_CLOSED_SQL)
+
+
+if __name__ == "__main__":
+    main()
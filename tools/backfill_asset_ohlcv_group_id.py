@@ -0,0 +1,94 @@
+import os
+import pathlib
+import sys
+
+
+sys.path.append(os.path.split(pathlib.Path(__file__).parent.absolute())[0])
+
+
+from textwrap import dedent
+from trader.connections.database import database
+from trader.models.asset_ohlcv import AssetOHLCV, AssetOHLCVGroup, AssetOHLCVPull
+from trader.utilities.logging import logger
+
+
+ADD_ASSET_OHLCV_GROUP_ID_SQL = dedent(
+    """
+    ALTER TABLE public.{asset_ohlcv_table}
+    ADD COLUMN IF NOT EXISTS asset_ohlcv_group_id INTEGER NULL REFERENCES public.{asset_ohlcv_group_table} (id)
+    """.format(
+        asset_ohlcv_table=AssetOHLCV.__tablename__,
+        asset_ohlcv_group_table=AssetOHLCVGroup.__tablename__,
+    )
+).strip()
+
+
+BACKFILL_ASSET_OHLCV_GROUP_ID_SQL = dedent(
+    """
+    UPDATE public.{asset_ohlcv_table} a
+    SET asset_ohlcv_group_id = ap.asset_ohlcv_group_id
+    FROM public.{asset_ohlcv_pull_table} ap
+    WHERE
+        a.asset_ohlcv_pull_id = ap.id
+        AND a.asset_ohlcv_group_id IS NULL
+    """.format(
+        asset_ohlcv_table=AssetOHLCV.__tablename__,
+        asset_ohlcv_pull_table=AssetOHLCVPull.__tablename__,
+    )
+).strip()
+
+
+DELETE_DUPLICATE_ASSET_OHLCV_SQL = dedent(
+    """
+    DELETE FROM public.{asset_ohlcv_table} a
+    USING public.{asset_ohlcv_table} b
+    WHERE
+        a.asset_ohlcv_group_id = b.asset_ohlcv_group_id
+        AND a.date_open = b.date_open
+        AND a.id > b.id
+    """.format(asset_ohlcv_table=AssetOHLCV.__tablename__)
+).strip()
+
+
+CONSTRAIN_ASSET_OHLCV_GROUP_ID_SQL = dedent(
+    """
+    ALTER TABLE public.{asset_ohlcv_table}
+    ALTER COLUMN asset_ohlcv_group_id SET NOT NULL
+    """.format(asset_ohlcv_table=AssetOHLCV.__tablename__)
+).strip()
+
+
+ADD_ASSET_OHLCV_GROUP_ID_DATE_OPEN_UNIQUE_SQL = dedent(
+    """
+    DO $$
+    BEGIN
+        IF NOT EXISTS (
+            SELECT 1
+            FROM pg_constraint
+            WHERE conname = '{asset_ohlcv_table}_asset_ohlcv_group_id_date_open_key'
+        ) THEN
+            ALTER TABLE public.{asset_ohlcv_table}
+            ADD CONSTRAINT {asset_ohlcv_table}_asset_ohlcv_group_id_date_open_key
+            UNIQUE (asset_ohlcv_group_id, date_open);
+        END IF;
+    END
+    $$
+    """.format(asset_ohlcv_table=AssetOHLCV.__tablename__)
+).strip()
+
+
+def main():
+    with database.begin() as connection:
+        logger.debug("Adding asset OHLCV group id column")
+        connection.exec_driver_sql(ADD_ASSET_OHLCV_GROUP_ID_SQL)
+        logger.debug("Backfilling asset OHLCV group id from asset OHLCV pulls")
+        connection.exec_driver_sql(BACKFILL_ASSET_OHLCV_GROUP_ID_SQL)
+        logger.debug("Deleting duplicate asset OHLCV records")
+        connection.exec_driver_sql(DELETE_DUPLICATE_ASSET_OHLCV_SQL)
+        logger.debug("Constraining asset OHLCV group id")
+        connection.exec_driver_sql(CONSTRAIN_ASSET_OHLCV_GROUP_ID_SQL)
+        connection.exec_driver_sql(ADD_ASSET_OHLCV_GROUP_ID_DATE_OPEN_UNIQUE_SQL)
+
+
+if __name__ == "__main__":
+    main()
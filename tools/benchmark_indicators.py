@@ -0,0 +1,121 @@
+import os
+import pathlib
+import sys
+
+
+sys.path.append(os.path.split(pathlib.Path(__file__).parent.absolute())[0])
+
+
+from timeit import repeat
+from typing import Callable, Dict, Tuple
+from finta import TA
+import numpy as np
+import pandas as pd
+from trader.indicators import (
+    AverageTrueRange,
+    BollingerBands,
+    ExponentialMovingAverage,
+    MovingAverageConvergenceDivergence,
+    RelativeStrengthIndex,
+    RollingMax,
+    RollingMean,
+    RollingMin,
+    RollingStandardDeviation,
+)
+from trader.utilities.logging import logger
+
+
+BENCHMARK_BAR_COUNTS = (500, 5000, 50000)
+BENCHMARK_REPEATS = 7
+
+
+def generate_ohlc_dataframe(bar_count: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 30000 + np.cumsum(rng.normal(0, 50, bar_count))
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 10, bar_count),
+            "high": close + rng.uniform(0, 40, bar_count),
+            "low": close - rng.uniform(0, 40, bar_count),
+            "close": close,
+            "volume": rng.uniform(1, 100, bar_count),
+        }
+    )
+
+
+def get_benchmark_pairs(
+    dataframe: pd.DataFrame,
+) -> Dict[str, Tuple[Callable[[], np.ndarray], Callable[[], np.ndarray]]]:
+    close = dataframe["close"].to_numpy(dtype="float64")
+    high = dataframe["high"].to_numpy(dtype="float64")
+    low = dataframe["low"].to_numpy(dtype="float64")
+    return {
+        "SMA": (
+            lambda: TA.SMA(dataframe, 20).to_numpy(),
+            lambda: RollingMean("close", 20).update_many(close),
+        ),
+        "EMA": (
+            lambda: TA.EMA(dataframe, 9, adjust=False).to_numpy(),
+            lambda: ExponentialMovingAverage("close", 9).update_many(close),
+        ),
+        "STD": (
+            lambda: dataframe["close"].rolling(20).std().to_numpy(),
+            lambda: RollingStandardDeviation("close", 20).update_many(close),
+        ),
+        "BBANDS": (
+            lambda: TA.BBANDS(dataframe, 20)["BB_LOWER"].to_numpy(),
+            lambda: BollingerBands("close", 20).update_many(close)[:, 2],
+        ),
+        "ATR": (
+            lambda: TA.ATR(dataframe, 14).to_numpy(),
+            lambda: AverageTrueRange(14).update_many(high, low, close),
+        ),
+        "RSI": (
+            lambda: TA.RSI(dataframe, 14, adjust=False).to_numpy(),
+            lambda: RelativeStrengthIndex("close", 14).update_many(close),
+        ),
+        "MACD": (
+            lambda: TA.MACD(dataframe, adjust=False)["MACD"].to_numpy(),
+            lambda: MovingAverageConvergenceDivergence("close").update_many(close)[:, 0],
+        ),
+        "MAX": (
+            lambda: dataframe["high"].rolling(20).max().to_numpy(),
+            lambda: RollingMax("high", 20).update_many(high),
+        ),
+        "MIN": (
+            lambda: dataframe["low"].rolling(20).min().to_numpy(),
+            lambda: RollingMin("low", 20).update_many(low),
+        ),
+    }
+
+
+def time_function(function: Callable[[], np.ndarray]) -> float:
+    return min(repeat(function, number=1, repeat=BENCHMARK_REPEATS))
+
+
+def get_max_difference(expected: np.ndarray, output: np.ndarray) -> float:
+    is_compared = ~np.isnan(expected) & ~np.isnan(output)
+    if not is_compared.any():
+        return np.nan
+    return float(np.abs(expected[is_compared] - output[is_compared]).max())
+
+
+def main():
+    for bar_count in BENCHMARK_BAR_COUNTS:
+        dataframe = generate_ohlc_dataframe(bar_count)
+        for name, (reference_function, function) in get_benchmark_pairs(dataframe).items():
+            reference_seconds = time_function(reference_function)
+            seconds = time_function(function)
+            logger.info(
+                "%s bars | %s | reference %.3f ms | native %.3f ms | speedup %.1fx | max difference %.2e",
+                bar_count,
+                name,
+                reference_seconds * 1000,
+                seconds * 1000,
+                reference_seconds / seconds,
+                get_max_difference(np.asarray(reference_function(), dtype="float64"), function()),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import os
+import pathlib
+import sys
+
+
+sys.path.append(os.path.split(pathlib.Path(__file__).parent.absolute())[0])
+
+
+from textwrap import dedent
+from trader.connections.database import database
+from trader.models.asset_ohlcv import AssetOHLCV, AssetOHLCVGroup
+from trader.models.partitions import initialize_partitions
+from trader.models.partitions.asset_ohlcv import create_asset_ohlcv_partitions
+from trader.models.timeframe import Timeframe
+from trader.models.views import initialize_views
+from trader.utilities.logging import logger
+
+
+UNPARTITIONED_ASSET_OHLCV_TABLE = f"{AssetOHLCV.__tablename__}_unpartitioned"
+
+
+RENAME_ASSET_OHLCV_SQL = dedent(
+    """
+    DROP VIEW IF EXISTS public.asset_ohlcv_view;
+    ALTER TABLE public.{asset_ohlcv_table} RENAME TO {unpartitioned_table};
+    ALTER INDEX public.{asset_ohlcv_table}_pkey RENAME TO {unpartitioned_table}_pkey;
+    ALTER SEQUENCE public.{asset_ohlcv_table}_id_seq RENAME TO {unpartitioned_table}_id_seq
+    """.format(
+        asset_ohlcv_table=AssetOHLCV.__tablename__,
+        unpartitioned_table=UNPARTITIONED_ASSET_OHLCV_TABLE,
+    )
+).strip()
+
+
+FETCH_ASSET_OHLCV_PARTITION_RANGES_SQL = dedent(
+    """
+    SELECT
+        t.id
+        ,t.unit
+        ,MIN(a.date_open)
+        ,MAX(a.date_open) + INTERVAL '1 microsecond'
+    FROM public.{unpartitioned_table} a
+        INNER JOIN public.{asset_ohlcv_group_table} ag ON
+            a.asset_ohlcv_group_id = ag.id
+        INNER JOIN public.{timeframe_table} t ON
+            ag.timeframe_id = t.id
+    GROUP BY
+        t.id
+        ,t.unit
+    """.format(
+        unpartitioned_table=UNPARTITIONED_ASSET_OHLCV_TABLE,
+        asset_ohlcv_group_table=AssetOHLCVGroup.__tablename__,
+        timeframe_table=Timeframe.__tablename__,
+    )
+).strip()
+
+
+COPY_ASSET_OHLCV_SQL = dedent(
+    """
+    INSERT INTO public.{asset_ohlcv_table} (
+        id, asset_ohlcv_group_id, timeframe_id, asset_ohlcv_pull_id, date_open, open, high, low, close, volume
+        ,date_high, date_low
+    )
+    SELECT
+        a.id
+        ,a.asset_ohlcv_group_id
+        ,ag.timeframe_id
+        ,a.asset_ohlcv_pull_id
+        ,a.date_open
+        ,a.open
+        ,a.high
+        ,a.low
+        ,a.close
+        ,a.volume
+        ,a.date_high
+        ,a.date_low
+    FROM public.{unpartitioned_table} a
+        INNER JOIN public.{asset_ohlcv_group_table} ag ON
+            a.asset_ohlcv_group_id = ag.id
+    """.format(
+        asset_ohlcv_table=AssetOHLCV.__tablename__,
+        unpartitioned_table=UNPARTITIONED_ASSET_OHLCV_TABLE,
+        asset_ohlcv_group_table=AssetOHLCVGroup.__tablename__,
+    )
+).strip()
+
+
+RESET_ASSET_OHLCV_ID_SEQUENCE_SQL = dedent(
+    """
+    SELECT setval(pg_get_serial_sequence('public.{asset_ohlcv_table}', 'id'), COALESCE(MAX(id), 0) + 1, false)
+    FROM public.{asset_ohlcv_table}
+    """.format(
+        asset_ohlcv_table=AssetOHLCV.__tablename__
+    )
+).strip()
+
+
+def main():
+    with database.begin() as connection:
+        logger.debug("Renaming unpartitioned asset OHLCV table")
+        connection.exec_driver_sql(RENAME_ASSET_OHLCV_SQL)
+        logger.debug("Creating partitioned asset OHLCV table")
+        AssetOHLCV.__table__.create(connection)
+        for timeframe_id, timeframe_unit, from_inclusive, to_exclusive in connection.exec_driver_sql(
+            FETCH_ASSET_OHLCV_PARTITION_RANGES_SQL
+        ).fetchall():
+            logger.debug("Creating asset OHLCV partitions for timeframe %s", timeframe_id)
+            create_asset_ohlcv_partitions(connection, timeframe_id, timeframe_unit, from_inclusive, to_exclusive)
+        logger.debug("Copying asset OHLCV records into partitions")
+        connection.exec_driver_sql(COPY_ASSET_OHLCV_SQL)
+        connection.exec_driver_sql(RESET_ASSET_OHLCV_ID_SEQUENCE_SQL)
+        connection.exec_driver_sql(f"DROP TABLE public.{UNPARTITIONED_ASSET_OHLCV_TABLE}")
+    initialize_partitions()
+    initialize_views()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from trader.data.enabled_cryptocurrency_exchange import set_initial_enabled_cryp
 from trader.data.enabled_quote_asset import set_initial_enabled_quote_assets
 from trader.data.enabled_strategy_version_instance import set_initial_enabled_strategy_version_instances
 from trader.models import initialize_models
+from trader.models.partitions import initialize_partitions
 from trader.models.views import initialize_views
 from trader.strategies import initialize_strategies
 from trader.tasks.asset_ohlcv import queue_update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap
@@ -25,10 +26,11 @@ from trader.utilities.logging import logger
 
 
 def main():
-    logger.debug("Initializing tables, views, and base data")
+    logger.debug("Initializing tables, views, base data, and partitions")
     initialize_models()
     initialize_views()
     initialize_data()
+    initialize_partitions()
     logger.debug("Loading ISO countries")
     update_countries_from_iso.apply()
     logger.debug("Loading ISO standard currencies")
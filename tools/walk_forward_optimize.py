@@ -0,0 +1,56 @@
+import os
+import pathlib
+import sys
+
+
+sys.path.append(os.path.split(pathlib.Path(__file__).parent.absolute())[0])
+
+
+from trader.backtest import fetch_backtest_panel
+from trader.backtest.walk_forward import run_walk_forward_optimization
+from trader.connections.database import session
+from trader.data.initial.source import SOURCE_COIN_MARKET_CAP
+from trader.models.asset_ohlcv import AssetOHLCVGroup
+from trader.strategies.entry import ENTRY_STRATEGIES
+from trader.strategies.exit import EXIT_STRATEGIES
+from trader.utilities.functions import get_asset_us_dollar_id
+from trader.utilities.initial_enabled_data import INITIAL_ENTRY_ENABLED_STRATEGY_VERSION_INSTANCES
+from trader.utilities.logging import logger
+
+
+WALK_FORWARD_TRAIN_BARS = 365
+WALK_FORWARD_TEST_BARS = 90
+
+
+def main():
+    source_id = SOURCE_COIN_MARKET_CAP.fetch_id()
+    us_dollar_id = get_asset_us_dollar_id()
+    for timeframe in INITIAL_ENTRY_ENABLED_STRATEGY_VERSION_INSTANCES.keys():
+        timeframe_id = timeframe.fetch_id()
+        base_asset_ids = [
+            r[0]
+            for r in session.query(AssetOHLCVGroup.base_asset_id)
+            .filter_by(source_id=source_id, quote_asset_id=us_dollar_id, timeframe_id=timeframe_id)
+            .all()
+        ]
+        logger.info("Loading OHLCV for %s base assets at timeframe %s", len(base_asset_ids), timeframe.base_label)
+        panel = fetch_backtest_panel(timeframe_id, base_asset_ids, source_id=source_id, quote_asset_id=us_dollar_id)
+        for entry_strategy in ENTRY_STRATEGIES:
+            for exit_strategy in EXIT_STRATEGIES:
+                result = run_walk_forward_optimization(
+                    panel, entry_strategy, exit_strategy, WALK_FORWARD_TRAIN_BARS, WALK_FORWARD_TEST_BARS
+                )
+                logger.info(
+                    "Timeframe %s | %s %s | %s %s | mean out-of-sample log growth %.4f over %s windows",
+                    timeframe.base_label,
+                    entry_strategy.NAME,
+                    result.entry_arguments,
+                    exit_strategy.NAME,
+                    result.exit_arguments,
+                    result.test_score,
+                    len(result.windows),
+                )
+
+
+if __name__ == "__main__":
+    main()
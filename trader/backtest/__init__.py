@@ -0,0 +1,67 @@
+from datetime import datetime
+from typing import Dict, Optional, Sequence
+import numpy as np
+import pandas as pd
+from trader.backtest.engine import (
+    BACKTEST_DEFAULT_FEE_RATE,
+    BACKTEST_DEFAULT_SLIPPAGE_RATE,
+    BacktestPosition,
+    BacktestResult,
+    BacktestTrade,
+    backtest_dataframe,
+    backtest_panel,
+)
+from trader.connections.database import session
+from trader.data.initial.source import SOURCE_COIN_MARKET_CAP
+from trader.models.strategy import StrategyVersionInstance
+from trader.utilities.functions import get_asset_us_dollar_id
+from trader.utilities.functions.implementation import fetch_cached_asset_ohlcv_panel
+from trader.utilities.functions.strategy import get_strategy_from_strategy_version
+
+
+def fetch_backtest_panel(
+    timeframe_id: int,
+    base_asset_ids: Sequence[int],
+    from_inclusive: Optional[datetime] = None,
+    to_exclusive: Optional[datetime] = None,
+    source_id: Optional[int] = None,
+    quote_asset_id: Optional[int] = None,
+) -> pd.DataFrame:
+    source_id = source_id if source_id is not None else SOURCE_COIN_MARKET_CAP.fetch_id()
+    quote_asset_id = quote_asset_id if quote_asset_id is not None else get_asset_us_dollar_id()
+    panel = fetch_cached_asset_ohlcv_panel(source_id, base_asset_ids, quote_asset_id, timeframe_id)
+    date_opens = panel.index.get_level_values("date_open")
+    mask = np.ones(panel.shape[0], dtype=bool)
+    if from_inclusive:
+        mask &= date_opens >= pd.Timestamp(from_inclusive)
+    if to_exclusive:
+        mask &= date_opens < pd.Timestamp(to_exclusive)
+    return panel[mask]
+
+
+def backtest_strategy_version_instances(
+    entry_strategy_version_instance_id: int,
+    exit_strategy_version_instance_id: int,
+    timeframe_id: int,
+    base_asset_ids: Sequence[int],
+    from_inclusive: Optional[datetime] = None,
+    to_exclusive: Optional[datetime] = None,
+    fee_rate: float = BACKTEST_DEFAULT_FEE_RATE,
+    slippage_rate: float = BACKTEST_DEFAULT_SLIPPAGE_RATE,
+) -> Dict[int, BacktestResult]:
+    entry_strategy_version_instance = session.query(StrategyVersionInstance).get(entry_strategy_version_instance_id)
+    exit_strategy_version_instance = session.query(StrategyVersionInstance).get(exit_strategy_version_instance_id)
+    entry_strategy = get_strategy_from_strategy_version(entry_strategy_version_instance.strategy_version)
+    exit_strategy = get_strategy_from_strategy_version(exit_strategy_version_instance.strategy_version)
+    if not entry_strategy.IS_ENTRY or exit_strategy.IS_ENTRY:
+        raise ValueError("Backtest requires an entry and an exit strategy version instance")
+    panel = fetch_backtest_panel(timeframe_id, base_asset_ids, from_inclusive=from_inclusive, to_exclusive=to_exclusive)
+    return backtest_panel(
+        panel,
+        entry_strategy,
+        entry_strategy_version_instance.arguments,
+        exit_strategy,
+        exit_strategy_version_instance.arguments,
+        fee_rate=fee_rate,
+        slippage_rate=slippage_rate,
+    )
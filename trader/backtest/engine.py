@@ -0,0 +1,171 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Type
+import numpy as np
+import pandas as pd
+from trader.strategies.entry.base import EntryStrategy
+from trader.strategies.exit.base import ExitStrategy
+
+
+BACKTEST_DEFAULT_FEE_RATE = 0.001
+BACKTEST_DEFAULT_SLIPPAGE_RATE = 0.0005
+
+
+@dataclass
+class BacktestPosition:
+    bought_price: float
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BacktestTrade:
+    entry_signal_date: datetime
+    entry_date: datetime
+    entry_price: float
+    exit_signal_date: Optional[datetime]
+    exit_date: Optional[datetime]
+    exit_price: float
+    net_return: float
+
+
+@dataclass
+class BacktestResult:
+    base_asset_id: int
+    trades: List[BacktestTrade]
+    equity: pd.Series
+    total_return: float
+    max_drawdown: float
+    exposure: float
+
+
+def calculate_max_drawdown(equity: np.ndarray) -> float:
+    if equity.shape[0] == 0:
+        return 0.0
+    return float(np.max(1 - equity / np.maximum.accumulate(equity)))
+
+
+def simulate_trades(
+    base_asset_id: int,
+    dataframe: pd.DataFrame,
+    buy_signal_strengths: np.ndarray,
+    exit_strategy: Type[ExitStrategy],
+    exit_arguments: Dict[str, Any],
+    fee_rate: float = BACKTEST_DEFAULT_FEE_RATE,
+    slippage_rate: float = BACKTEST_DEFAULT_SLIPPAGE_RATE,
+    exit_dataframe: Optional[pd.DataFrame] = None,
+) -> BacktestResult:
+    open_prices = dataframe["open"].to_numpy(dtype="float64")
+    close_prices = dataframe["close"].to_numpy(dtype="float64")
+    bar_count = close_prices.shape[0]
+    entry_signal_indices = np.flatnonzero(buy_signal_strengths)
+    if exit_dataframe is None:
+        exit_dataframe = exit_strategy(base_asset_id, exit_arguments, BacktestPosition(0.0)).enhance_data(dataframe)
+    log_returns = np.zeros(bar_count, dtype="float64")
+    log_returns[1:] = np.diff(np.log(close_prices))
+    held = np.zeros(bar_count, dtype=bool)
+    adjustments = np.zeros(bar_count, dtype="float64")
+    fee_log = np.log1p(-fee_rate)
+    trades: List[BacktestTrade] = []
+    signal_position = 0
+    while signal_position < entry_signal_indices.shape[0]:
+        entry_signal_index = int(entry_signal_indices[signal_position])
+        entry_index = entry_signal_index + 1
+        if entry_index >= bar_count:
+            break
+        entry_price = open_prices[entry_index] * (1 + slippage_rate)
+        adjustments[entry_index] += np.log(close_prices[entry_index] / entry_price) + fee_log
+        units = (1 - fee_rate) / entry_price
+        position = BacktestPosition(entry_price)
+        sell_signal_offsets = np.flatnonzero(
+            exit_strategy(base_asset_id, exit_arguments, position).get_sell_signal_strengths(
+                exit_dataframe, entry_index
+            )
+        )
+        if sell_signal_offsets.shape[0] == 0 or entry_index + sell_signal_offsets[0] + 1 >= bar_count:
+            held[entry_index:] = True
+            trades.append(
+                BacktestTrade(
+                    entry_signal_date=dataframe.index[entry_signal_index].to_pydatetime(),
+                    entry_date=dataframe.index[entry_index].to_pydatetime(),
+                    entry_price=float(entry_price),
+                    exit_signal_date=None,
+                    exit_date=None,
+                    exit_price=float(close_prices[-1]),
+                    net_return=float(units * close_prices[-1] - 1),
+                )
+            )
+            break
+        exit_signal_index = entry_index + int(sell_signal_offsets[0])
+        exit_index = exit_signal_index + 1
+        exit_price = open_prices[exit_index] * (1 - slippage_rate)
+        held[entry_index:exit_index] = True
+        adjustments[exit_index] += np.log(exit_price / close_prices[exit_index - 1]) + fee_log
+        trades.append(
+            BacktestTrade(
+                entry_signal_date=dataframe.index[entry_signal_index].to_pydatetime(),
+                entry_date=dataframe.index[entry_index].to_pydatetime(),
+                entry_price=float(entry_price),
+                exit_signal_date=dataframe.index[exit_signal_index].to_pydatetime(),
+                exit_date=dataframe.index[exit_index].to_pydatetime(),
+                exit_price=float(exit_price),
+                net_return=float(units * (1 - fee_rate) * exit_price - 1),
+            )
+        )
+        signal_position = int(np.searchsorted(entry_signal_indices, exit_index))
+    held_through = np.zeros(bar_count, dtype=bool)
+    held_through[1:] = held[1:] & held[:-1]
+    equity = np.exp(np.cumsum(np.where(held_through, log_returns, 0.0) + adjustments))
+    return BacktestResult(
+        base_asset_id=base_asset_id,
+        trades=trades,
+        equity=pd.Series(equity, index=dataframe.index, name="equity"),
+        total_return=float(equity[-1] - 1) if bar_count else 0.0,
+        max_drawdown=calculate_max_drawdown(equity),
+        exposure=float(held.mean()) if bar_count else 0.0,
+    )
+
+
+def backtest_dataframe(
+    base_asset_id: int,
+    dataframe: pd.DataFrame,
+    entry_strategy: Type[EntryStrategy],
+    entry_arguments: Dict[str, Any],
+    exit_strategy: Type[ExitStrategy],
+    exit_arguments: Dict[str, Any],
+    fee_rate: float = BACKTEST_DEFAULT_FEE_RATE,
+    slippage_rate: float = BACKTEST_DEFAULT_SLIPPAGE_RATE,
+) -> BacktestResult:
+    entry_strategy_object = entry_strategy(base_asset_id, entry_arguments)
+    return simulate_trades(
+        base_asset_id,
+        dataframe,
+        entry_strategy_object.get_buy_signal_strengths(entry_strategy_object.enhance_data(dataframe)),
+        exit_strategy,
+        exit_arguments,
+        fee_rate=fee_rate,
+        slippage_rate=slippage_rate,
+    )
+
+
+def backtest_panel(
+    panel: pd.DataFrame,
+    entry_strategy: Type[EntryStrategy],
+    entry_arguments: Dict[str, Any],
+    exit_strategy: Type[ExitStrategy],
+    exit_arguments: Dict[str, Any],
+    fee_rate: float = BACKTEST_DEFAULT_FEE_RATE,
+    slippage_rate: float = BACKTEST_DEFAULT_SLIPPAGE_RATE,
+) -> Dict[int, BacktestResult]:
+    output: Dict[int, BacktestResult] = {}
+    for base_asset_id, dataframe in panel.groupby(level="base_asset_id", sort=True):
+        output[int(base_asset_id)] = backtest_dataframe(
+            int(base_asset_id),
+            dataframe.droplevel("base_asset_id"),
+            entry_strategy,
+            entry_arguments,
+            exit_strategy,
+            exit_arguments,
+            fee_rate=fee_rate,
+            slippage_rate=slippage_rate,
+        )
+    return output
@@ -0,0 +1,141 @@
+from dataclasses import asdict, dataclass
+from multiprocessing import Pool
+from multiprocessing.sharedctypes import RawArray
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+import numpy as np
+import pandas as pd
+from trader.backtest.engine import BACKTEST_DEFAULT_FEE_RATE, BACKTEST_DEFAULT_SLIPPAGE_RATE, simulate_trades
+from trader.strategies import parameter_space_to_arguments_dict
+from trader.strategies.entry.base import EntryStrategy
+from trader.strategies.exit.base import ExitStrategy
+
+
+BACKTEST_PANEL_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass
+class BacktestJob:
+    base_asset_id: int
+    start: int
+    stop: int
+    entry_strategy: Type[EntryStrategy]
+    entry_arguments_list: List[Dict[str, Any]]
+    exit_strategy: Type[ExitStrategy]
+    exit_arguments_list: List[Dict[str, Any]]
+    fee_rate: float
+    slippage_rate: float
+
+
+@dataclass
+class BacktestSummary:
+    base_asset_id: int
+    entry_arguments: Dict[str, Any]
+    exit_arguments: Dict[str, Any]
+    total_return: float
+    max_drawdown: float
+    exposure: float
+    trade_count: int
+
+
+worker_panel: Dict[str, np.ndarray] = {}
+
+
+def pack_backtest_panel(panel: pd.DataFrame) -> Tuple[Any, Any, Dict[int, Tuple[int, int]]]:
+    panel = panel.sort_index(level=("base_asset_id", "date_open"))
+    bar_count = panel.shape[0]
+    values = RawArray("d", len(BACKTEST_PANEL_COLUMNS) * bar_count)
+    date_opens = RawArray("q", bar_count)
+    values_view = np.frombuffer(values, dtype="float64").reshape(len(BACKTEST_PANEL_COLUMNS), bar_count)
+    for i, column in enumerate(BACKTEST_PANEL_COLUMNS):
+        values_view[i] = panel[column].to_numpy(dtype="float64")
+    np.frombuffer(date_opens, dtype="int64")[:] = (
+        panel.index.get_level_values("date_open").to_numpy(dtype="datetime64[ns]").astype("int64")
+    )
+    base_asset_ids = panel.index.get_level_values("base_asset_id").to_numpy()
+    unique_base_asset_ids, starts = np.unique(base_asset_ids, return_index=True)
+    stops = np.append(starts[1:], bar_count)
+    ranges = {int(b): (int(start), int(stop)) for b, start, stop in zip(unique_base_asset_ids, starts, stops)}
+    return values, date_opens, ranges
+
+
+def initialize_backtest_worker(values: Any, date_opens: Any) -> None:
+    bar_count = len(date_opens)
+    worker_panel["values"] = np.frombuffer(values, dtype="float64").reshape(len(BACKTEST_PANEL_COLUMNS), bar_count)
+    worker_panel["date_opens"] = np.frombuffer(date_opens, dtype="int64")
+
+
+def get_worker_dataframe(start: int, stop: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {c: worker_panel["values"][i, start:stop] for i, c in enumerate(BACKTEST_PANEL_COLUMNS)},
+        index=pd.DatetimeIndex(pd.to_datetime(worker_panel["date_opens"][start:stop], utc=True), name="date_open"),
+    )
+
+
+def run_backtest_job(job: BacktestJob) -> List[BacktestSummary]:
+    dataframe = get_worker_dataframe(job.start, job.stop)
+    buy_signal_strength_matrix = job.entry_strategy(job.base_asset_id, {}).get_buy_signal_strength_matrix(
+        dataframe, job.entry_arguments_list
+    )
+    output: List[BacktestSummary] = []
+    for entry_arguments, buy_signal_strengths in zip(job.entry_arguments_list, buy_signal_strength_matrix):
+        for exit_arguments in job.exit_arguments_list:
+            result = simulate_trades(
+                job.base_asset_id,
+                dataframe,
+                buy_signal_strengths,
+                job.exit_strategy,
+                exit_arguments,
+                fee_rate=job.fee_rate,
+                slippage_rate=job.slippage_rate,
+            )
+            output.append(
+                BacktestSummary(
+                    base_asset_id=job.base_asset_id,
+                    entry_arguments=entry_arguments,
+                    exit_arguments=exit_arguments,
+                    total_return=result.total_return,
+                    max_drawdown=result.max_drawdown,
+                    exposure=result.exposure,
+                    trade_count=len(result.trades),
+                )
+            )
+    return output
+
+
+def run_parallel_backtests(
+    panel: pd.DataFrame,
+    entry_strategy: Type[EntryStrategy],
+    exit_strategy: Type[ExitStrategy],
+    entry_arguments_list: Optional[Sequence[Dict[str, Any]]] = None,
+    exit_arguments_list: Optional[Sequence[Dict[str, Any]]] = None,
+    processes: Optional[int] = None,
+    fee_rate: float = BACKTEST_DEFAULT_FEE_RATE,
+    slippage_rate: float = BACKTEST_DEFAULT_SLIPPAGE_RATE,
+) -> pd.DataFrame:
+    if entry_arguments_list is None:
+        entry_arguments_list = parameter_space_to_arguments_dict(entry_strategy)
+    if exit_arguments_list is None:
+        exit_arguments_list = parameter_space_to_arguments_dict(exit_strategy)
+    values, date_opens, ranges = pack_backtest_panel(panel)
+    jobs = [
+        BacktestJob(
+            base_asset_id=base_asset_id,
+            start=start,
+            stop=stop,
+            entry_strategy=entry_strategy,
+            entry_arguments_list=list(entry_arguments_list),
+            exit_strategy=exit_strategy,
+            exit_arguments_list=list(exit_arguments_list),
+            fee_rate=fee_rate,
+            slippage_rate=slippage_rate,
+        )
+        for base_asset_id, (start, stop) in ranges.items()
+    ]
+    processes = processes or os.cpu_count() or 1
+    chunk_size = max(1, len(jobs) // (processes * 4))
+    summaries: List[BacktestSummary] = []
+    with Pool(processes=processes, initializer=initialize_backtest_worker, initargs=(values, date_opens)) as pool:
+        for job_summaries in pool.imap(run_backtest_job, jobs, chunksize=chunk_size):
+            summaries.extend(job_summaries)
+    return pd.DataFrame([asdict(s) for s in summaries])
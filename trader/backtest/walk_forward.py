@@ -0,0 +1,193 @@
+from dataclasses import dataclass
+from datetime import datetime
+from multiprocessing import Pool
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+import numpy as np
+import pandas as pd
+from trader.backtest.engine import (
+    BACKTEST_DEFAULT_FEE_RATE,
+    BACKTEST_DEFAULT_SLIPPAGE_RATE,
+    BacktestPosition,
+    simulate_trades,
+)
+from trader.backtest.runner import (
+    get_worker_dataframe,
+    initialize_backtest_worker,
+    pack_backtest_panel,
+    worker_panel,
+)
+from trader.strategies import parameter_space_to_arguments_dict
+from trader.strategies.entry.base import EntryStrategy
+from trader.strategies.exit.base import ExitStrategy
+
+
+WALK_FORWARD_MINIMUM_TRAIN_BAR_RATIO = 0.5
+
+
+@dataclass
+class WalkForwardJob:
+    base_asset_id: int
+    start: int
+    stop: int
+    window_bounds: np.ndarray
+    minimum_train_bars: int
+    entry_strategy: Type[EntryStrategy]
+    entry_arguments_list: List[Dict[str, Any]]
+    exit_strategy: Type[ExitStrategy]
+    exit_arguments_list: List[Dict[str, Any]]
+    fee_rate: float
+    slippage_rate: float
+
+
+@dataclass
+class WalkForwardWindow:
+    train_start: datetime
+    test_start: datetime
+    test_end: datetime
+    entry_arguments: Dict[str, Any]
+    exit_arguments: Dict[str, Any]
+    train_score: float
+    test_score: float
+
+
+@dataclass
+class WalkForwardResult:
+    entry_strategy: Type[EntryStrategy]
+    exit_strategy: Type[ExitStrategy]
+    windows: List[WalkForwardWindow]
+    entry_arguments: Dict[str, Any]
+    exit_arguments: Dict[str, Any]
+    test_score: float
+
+
+def generate_walk_forward_window_bounds(
+    date_opens: np.ndarray, train_bars: int, test_bars: int, step_bars: Optional[int] = None
+) -> np.ndarray:
+    step_bars = step_bars or test_bars
+    date_opens = np.unique(date_opens)
+    output: List[Tuple[int, int, int]] = []
+    for i in range(0, date_opens.shape[0] - train_bars - test_bars + 1, step_bars):
+        test_end = i + train_bars + test_bars
+        output.append(
+            (
+                date_opens[i],
+                date_opens[i + train_bars],
+                date_opens[test_end] if test_end < date_opens.shape[0] else 2 * date_opens[-1] - date_opens[-2],
+            )
+        )
+    return np.array(output, dtype="int64").reshape(-1, 3)
+
+
+def score_total_returns(total_returns: np.ndarray) -> np.ndarray:
+    is_scored = ~np.isnan(total_returns)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        log_growth = np.where(is_scored, np.log1p(total_returns), 0.0)
+    counts = is_scored.sum(axis=0)
+    return np.where(counts > 0, log_growth.sum(axis=0) / np.maximum(counts, 1), np.nan)
+
+
+def run_walk_forward_job(job: WalkForwardJob) -> Tuple[np.ndarray, np.ndarray]:
+    dataframe = get_worker_dataframe(job.start, job.stop)
+    buy_signal_strength_matrix = job.entry_strategy(job.base_asset_id, {}).get_buy_signal_strength_matrix(
+        dataframe, job.entry_arguments_list
+    )
+    exit_dataframes = [
+        job.exit_strategy(job.base_asset_id, a, BacktestPosition(0.0)).enhance_data(dataframe)
+        for a in job.exit_arguments_list
+    ]
+    bounds = np.searchsorted(worker_panel["date_opens"][job.start : job.stop], job.window_bounds)
+    shape = (bounds.shape[0], len(job.entry_arguments_list), len(job.exit_arguments_list))
+    train_returns = np.full(shape, np.nan, dtype="float64")
+    test_returns = np.full(shape, np.nan, dtype="float64")
+    for w, (train_start, test_start, test_end) in enumerate(bounds):
+        if test_start - train_start < job.minimum_train_bars or test_end <= test_start:
+            continue
+        for phase_returns, phase_start, phase_end in (
+            (train_returns, train_start, test_start),
+            (test_returns, test_start, test_end),
+        ):
+            phase_dataframe = dataframe.iloc[phase_start:phase_end]
+            for e, buy_signal_strengths in enumerate(buy_signal_strength_matrix):
+                for x, exit_arguments in enumerate(job.exit_arguments_list):
+                    phase_returns[w, e, x] = simulate_trades(
+                        job.base_asset_id,
+                        phase_dataframe,
+                        buy_signal_strengths[phase_start:phase_end],
+                        job.exit_strategy,
+                        exit_arguments,
+                        fee_rate=job.fee_rate,
+                        slippage_rate=job.slippage_rate,
+                        exit_dataframe=exit_dataframes[x].iloc[phase_start:phase_end],
+                    ).total_return
+    return train_returns, test_returns
+
+
+def run_walk_forward_optimization(
+    panel: pd.DataFrame,
+    entry_strategy: Type[EntryStrategy],
+    exit_strategy: Type[ExitStrategy],
+    train_bars: int,
+    test_bars: int,
+    step_bars: Optional[int] = None,
+    entry_arguments_list: Optional[Sequence[Dict[str, Any]]] = None,
+    exit_arguments_list: Optional[Sequence[Dict[str, Any]]] = None,
+    processes: Optional[int] = None,
+    fee_rate: float = BACKTEST_DEFAULT_FEE_RATE,
+    slippage_rate: float = BACKTEST_DEFAULT_SLIPPAGE_RATE,
+) -> WalkForwardResult:
+    entry_arguments_list = list(entry_arguments_list or parameter_space_to_arguments_dict(entry_strategy))
+    exit_arguments_list = list(exit_arguments_list or parameter_space_to_arguments_dict(exit_strategy))
+    values, date_opens, ranges = pack_backtest_panel(panel)
+    window_bounds = generate_walk_forward_window_bounds(
+        np.frombuffer(date_opens, dtype="int64"), train_bars, test_bars, step_bars=step_bars
+    )
+    if window_bounds.shape[0] == 0:
+        raise ValueError("Not enough OHLCV history for a single walk-forward window")
+    jobs = [
+        WalkForwardJob(
+            base_asset_id=base_asset_id,
+            start=start,
+            stop=stop,
+            window_bounds=window_bounds,
+            minimum_train_bars=int(train_bars * WALK_FORWARD_MINIMUM_TRAIN_BAR_RATIO),
+            entry_strategy=entry_strategy,
+            entry_arguments_list=entry_arguments_list,
+            exit_strategy=exit_strategy,
+            exit_arguments_list=exit_arguments_list,
+            fee_rate=fee_rate,
+            slippage_rate=slippage_rate,
+        )
+        for base_asset_id, (start, stop) in ranges.items()
+    ]
+    processes = processes or os.cpu_count() or 1
+    with Pool(processes=processes, initializer=initialize_backtest_worker, initargs=(values, date_opens)) as pool:
+        job_returns = pool.map(run_walk_forward_job, jobs, chunksize=max(1, len(jobs) // (processes * 4)))
+    train_scores = score_total_returns(np.stack([r[0] for r in job_returns]))
+    test_scores = score_total_returns(np.stack([r[1] for r in job_returns]))
+    windows: List[WalkForwardWindow] = []
+    for w, (train_start, test_start, test_end) in enumerate(window_bounds):
+        if np.all(np.isnan(train_scores[w])):
+            continue
+        e, x = np.unravel_index(np.nanargmax(train_scores[w]), train_scores[w].shape)
+        windows.append(
+            WalkForwardWindow(
+                train_start=pd.Timestamp(train_start, tz="UTC").to_pydatetime(),
+                test_start=pd.Timestamp(test_start, tz="UTC").to_pydatetime(),
+                test_end=pd.Timestamp(test_end, tz="UTC").to_pydatetime(),
+                entry_arguments=entry_arguments_list[e],
+                exit_arguments=exit_arguments_list[x],
+                train_score=float(train_scores[w, e, x]),
+                test_score=float(test_scores[w, e, x]),
+            )
+        )
+    if not windows:
+        raise ValueError("No walk-forward window had enough OHLCV history to score")
+    return WalkForwardResult(
+        entry_strategy=entry_strategy,
+        exit_strategy=exit_strategy,
+        windows=windows,
+        entry_arguments=windows[-1].entry_arguments,
+        exit_arguments=windows[-1].exit_arguments,
+        test_score=float(np.nanmean([w.test_score for w in windows])),
+    )
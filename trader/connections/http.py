@@ -0,0 +1,196 @@
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+import random
+import tempfile
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+from trader.utilities.environment import (
+    HTTP_CACHE_DIRECTORY,
+    HTTP_CACHE_MODE,
+    HTTP_CACHE_TTL_SECONDS,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_RETRY_BACKOFF_FACTOR,
+    HTTP_RETRY_BACKOFF_MAX_SECONDS,
+    HTTP_RETRY_TOTAL,
+    HTTP_TIMEOUT_SECONDS,
+)
+
+
+HTTP_CACHE_MODE_OFF = "off"
+HTTP_CACHE_MODE_CACHE = "cache"
+HTTP_CACHE_MODE_REPLAY = "replay"
+HTTP_CACHE_MODES = (HTTP_CACHE_MODE_OFF, HTTP_CACHE_MODE_CACHE, HTTP_CACHE_MODE_REPLAY)
+HTTP_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class HTTPCacheMissError(LookupError):
+    pass
+
+
+class JitteredRetry(Retry):
+    def __init__(self, *args: Any, backoff_max_seconds: float = HTTP_RETRY_BACKOFF_MAX_SECONDS, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.backoff_max_seconds = backoff_max_seconds
+
+    def new(self, **kwargs: Any) -> "JitteredRetry":
+        retry = super().new(**kwargs)
+        retry.backoff_max_seconds = self.backoff_max_seconds
+        return retry
+
+    def get_backoff_time(self) -> float:
+        backoff_time = super().get_backoff_time()
+        if backoff_time <= 0:
+            return 0
+        return random.uniform(0, min(self.backoff_max_seconds, backoff_time))
+
+
+def create_session(
+    pool_connections: int = HTTP_POOL_CONNECTIONS,
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+    retry_total: int = HTTP_RETRY_TOTAL,
+    retry_backoff_factor: float = HTTP_RETRY_BACKOFF_FACTOR,
+) -> requests.Session:
+    retry = JitteredRetry(
+        total=retry_total,
+        backoff_factor=retry_backoff_factor,
+        status_forcelist=HTTP_RETRY_STATUS_CODES,
+        allowed_methods=frozenset(("GET", "HEAD", "OPTIONS")),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def canonicalize_url(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    scheme, netloc, path, query, _ = urlsplit(url)
+    query_items = parse_qsl(query, keep_blank_values=True)
+    if params:
+        query_items.extend((str(k), str(v)) for k, v in params.items())
+    return urlunsplit((scheme.lower(), netloc.lower(), path, urlencode(sorted(query_items)), ""))
+
+
+class HTTPClient:
+    def __init__(
+        self,
+        directory: str,
+        mode: str = HTTP_CACHE_MODE_OFF,
+        ttl_seconds: int = 0,
+        timeout_seconds: float = HTTP_TIMEOUT_SECONDS,
+    ):
+        if mode not in HTTP_CACHE_MODES:
+            raise ValueError(f"HTTP cache mode must be one of {', '.join(HTTP_CACHE_MODES)}")
+        self.directory = directory
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.timeout_seconds = timeout_seconds
+        self._session: Optional[requests.Session] = None
+        self._session_pid: Optional[int] = None
+
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None or self._session_pid != os.getpid():
+            self._session = create_session()
+            self._session_pid = os.getpid()
+        return self._session
+
+    def get_entry_paths(self, canonical_url: str) -> Tuple[str, str]:
+        key = hashlib.sha256(f"GET {canonical_url}".encode("utf-8")).hexdigest()
+        entry_directory = os.path.join(self.directory, key[:2])
+        return os.path.join(entry_directory, f"{key}.json"), os.path.join(entry_directory, f"{key}.body")
+
+    def entry_is_expired(self, metadata: Dict[str, Any]) -> bool:
+        age = datetime.now(timezone.utc).timestamp() - metadata["date_cached"]
+        return age >= self.ttl_seconds
+
+    def read_entry(self, canonical_url: str) -> Optional[requests.Response]:
+        metadata_path, body_path = self.get_entry_paths(canonical_url)
+        try:
+            with open(metadata_path, "r") as metadata_file:
+                metadata = json.load(metadata_file)
+            with open(body_path, "rb") as body_file:
+                body = body_file.read()
+        except (FileNotFoundError, ValueError):
+            return None
+        if self.mode != HTTP_CACHE_MODE_REPLAY and self.entry_is_expired(metadata):
+            self.delete_entry(metadata_path, body_path)
+            return None
+        response = requests.Response()
+        response.status_code = metadata["status_code"]
+        response.url = metadata["url"]
+        response.headers = CaseInsensitiveDict(metadata["headers"])
+        response.encoding = metadata["encoding"]
+        response._content = body
+        return response
+
+    def write_entry(self, canonical_url: str, response: requests.Response) -> None:
+        metadata_path, body_path = self.get_entry_paths(canonical_url)
+        metadata = {
+            "url": response.url,
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+            "encoding": response.encoding,
+            "date_cached": datetime.now(timezone.utc).timestamp(),
+        }
+        entry_directory = os.path.dirname(metadata_path)
+        os.makedirs(entry_directory, exist_ok=True)
+        for path, content in ((body_path, response.content), (metadata_path, json.dumps(metadata).encode("utf-8"))):
+            file_descriptor, temporary_path = tempfile.mkstemp(dir=entry_directory)
+            with os.fdopen(file_descriptor, "wb") as temporary_file:
+                temporary_file.write(content)
+            os.replace(temporary_path, path)
+
+    @staticmethod
+    def delete_entry(metadata_path: str, body_path: str) -> None:
+        for path in (metadata_path, body_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def evict_expired(self) -> int:
+        evicted = 0
+        if not os.path.isdir(self.directory):
+            return evicted
+        for entry_directory, _, file_names in os.walk(self.directory):
+            for file_name in file_names:
+                if not file_name.endswith(".json"):
+                    continue
+                metadata_path = os.path.join(entry_directory, file_name)
+                body_path = metadata_path[: -len(".json")] + ".body"
+                try:
+                    with open(metadata_path, "r") as metadata_file:
+                        metadata = json.load(metadata_file)
+                except (FileNotFoundError, ValueError):
+                    continue
+                if self.entry_is_expired(metadata):
+                    self.delete_entry(metadata_path, body_path)
+                    evicted += 1
+        return evicted
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        if self.mode == HTTP_CACHE_MODE_OFF:
+            return self.session.get(url, params=params, timeout=self.timeout_seconds)
+        canonical_url = canonicalize_url(url, params)
+        response = self.read_entry(canonical_url)
+        if response is not None:
+            return response
+        if self.mode == HTTP_CACHE_MODE_REPLAY:
+            raise HTTPCacheMissError(f"No recorded response for {canonical_url}")
+        response = self.session.get(url, params=params, timeout=self.timeout_seconds)
+        if response.status_code == 200:
+            self.write_entry(canonical_url, response)
+        return response
+
+
+http_client = HTTPClient(HTTP_CACHE_DIRECTORY, mode=HTTP_CACHE_MODE, ttl_seconds=HTTP_CACHE_TTL_SECONDS)
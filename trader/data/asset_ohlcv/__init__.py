@@ -1,14 +1,259 @@
 from abc import ABC, abstractmethod
+import csv
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from io import StringIO
+from textwrap import dedent
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from trader.connections.database import session
 from trader.data.initial.source import SourceData
 from trader.data.initial.source_type import SourceTypeData
 from trader.models.asset import Asset
-from trader.models.asset_ohlcv import AssetOHLCV, AssetOHLCVGroup, AssetOHLCVPull
+from trader.models.asset_ohlcv import AssetOHLCV, AssetOHLCVGroup, AssetOHLCVGroupWatermark, AssetOHLCVPull
+from trader.models.partitions.asset_ohlcv import ensure_asset_ohlcv_partitions
 from trader.models.source import Source
 from trader.models.timeframe import Timeframe
-from trader.utilities.functions.time import clean_range_cap
+from trader.utilities.functions.time import TIMEFRAME_UNIT_TO_DELTA_FUNCTION, clean_range_cap
+
+
+ASSET_OHLCV_STAGING_COLUMNS = ("date_open", "open", "high", "low", "close", "volume", "date_high", "date_low")
+
+
+CREATE_ASSET_OHLCV_STAGING_SQL = dedent(
+    """
+    CREATE TEMPORARY TABLE asset_ohlcv_staging (
+        date_open TIMESTAMP WITH TIME ZONE NOT NULL
+        ,open NUMERIC NOT NULL
+        ,high NUMERIC NOT NULL
+        ,low NUMERIC NOT NULL
+        ,close NUMERIC NOT NULL
+        ,volume NUMERIC NOT NULL
+        ,date_high TIMESTAMP WITH TIME ZONE NULL
+        ,date_low TIMESTAMP WITH TIME ZONE NULL
+    ) ON COMMIT DROP
+    """
+).strip()
+
+
+COPY_ASSET_OHLCV_STAGING_SQL = "COPY asset_ohlcv_staging ({columns}) FROM STDIN WITH (FORMAT CSV)".format(
+    columns=", ".join(ASSET_OHLCV_STAGING_COLUMNS)
+)
+
+
+INSERT_ASSET_OHLCV_FROM_STAGING_SQL = dedent(
+    """
+    WITH inserted AS (
+        INSERT INTO public.{asset_ohlcv_table} (asset_ohlcv_group_id, timeframe_id, asset_ohlcv_pull_id, {columns})
+        SELECT DISTINCT ON (s.date_open)
+            %(asset_ohlcv_group_id)s
+            ,%(timeframe_id)s
+            ,%(asset_ohlcv_pull_id)s
+            ,{staging_columns}
+        FROM asset_ohlcv_staging s
+        ORDER BY s.date_open
+        ON CONFLICT (asset_ohlcv_group_id, timeframe_id, date_open) DO NOTHING
+        RETURNING date_open
+    )
+    SELECT
+        COUNT(*)
+        ,MAX(date_open)
+    FROM inserted
+    """.format(
+        asset_ohlcv_table=AssetOHLCV.__tablename__,
+        columns=", ".join(ASSET_OHLCV_STAGING_COLUMNS),
+        staging_columns="\n            ,".join(f"s.{c}" for c in ASSET_OHLCV_STAGING_COLUMNS),
+    )
+).strip()
+
+
+SEED_ASSET_OHLCV_GROUP_WATERMARK_SQL = dedent(
+    """
+    INSERT INTO public.{asset_ohlcv_group_watermark_table} (
+        asset_ohlcv_group_id, last_date_open, bar_count, last_asset_ohlcv_pull_id
+    )
+    SELECT
+        %(asset_ohlcv_group_id)s
+        ,MAX(a.date_open)
+        ,COUNT(a.id)
+        ,MAX(a.asset_ohlcv_pull_id)
+    FROM public.{asset_ohlcv_table} a
+    WHERE
+        a.asset_ohlcv_group_id = %(asset_ohlcv_group_id)s
+        AND a.timeframe_id = %(timeframe_id)s
+    ON CONFLICT (asset_ohlcv_group_id) DO NOTHING
+    """.format(
+        asset_ohlcv_group_watermark_table=AssetOHLCVGroupWatermark.__tablename__,
+        asset_ohlcv_table=AssetOHLCV.__tablename__,
+    )
+).strip()
+
+
+UPDATE_ASSET_OHLCV_GROUP_WATERMARK_SQL = dedent(
+    """
+    INSERT INTO public.{asset_ohlcv_group_watermark_table} AS w (
+        asset_ohlcv_group_id, last_date_open, bar_count, last_asset_ohlcv_pull_id
+    )
+    VALUES (%(asset_ohlcv_group_id)s, %(last_date_open)s, %(bar_count)s, %(asset_ohlcv_pull_id)s)
+    ON CONFLICT (asset_ohlcv_group_id) DO UPDATE SET
+        last_date_open = GREATEST(w.last_date_open, EXCLUDED.last_date_open)
+        ,bar_count = w.bar_count + EXCLUDED.bar_count
+        ,last_asset_ohlcv_pull_id = EXCLUDED.last_asset_ohlcv_pull_id
+    """.format(asset_ohlcv_group_watermark_table=AssetOHLCVGroupWatermark.__tablename__)
+).strip()
+
+
+SELECT_ASSET_OHLCV_GAPS_SQL = dedent(
+    """
+    WITH gapped_groups AS (
+        SELECT
+            g.id
+            ,g.base_asset_id
+            ,g.timeframe_id
+            ,CASE
+                WHEN t.seconds_length IS NULL THEN MAKE_INTERVAL(months => t.amount)
+                ELSE MAKE_INTERVAL(secs => t.seconds_length)
+            END AS width
+        FROM public.{asset_ohlcv_group_table} g
+            INNER JOIN public.{timeframe_table} t ON
+                g.timeframe_id = t.id
+            INNER JOIN public.{asset_ohlcv_group_watermark_table} w ON
+                g.id = w.asset_ohlcv_group_id
+        WHERE
+            g.source_id = %(source_id)s
+            AND g.quote_asset_id = %(quote_asset_id)s
+            AND g.timeframe_id = %(timeframe_id)s
+            AND g.source_asset_ohlcv_group_id IS NULL
+            AND w.last_date_open IS NOT NULL
+            AND (
+                t.seconds_length IS NULL
+                OR w.bar_count <> 1 + EXTRACT(EPOCH FROM w.last_date_open - (
+                    SELECT MIN(a.date_open)
+                    FROM public.{asset_ohlcv_table} a
+                    WHERE
+                        a.asset_ohlcv_group_id = g.id
+                        AND a.timeframe_id = g.timeframe_id
+                )) / t.seconds_length
+            )
+    )
+    ,bars AS (
+        SELECT
+            gg.id AS asset_ohlcv_group_id
+            ,gg.base_asset_id
+            ,gg.width
+            ,a.date_open
+            ,(
+                (LAG(a.date_open) OVER (PARTITION BY gg.id ORDER BY a.date_open) AT TIME ZONE 'UTC') + gg.width
+            ) AT TIME ZONE 'UTC' AS expected_date_open
+        FROM gapped_groups gg
+            INNER JOIN public.{asset_ohlcv_table} a ON
+                gg.id = a.asset_ohlcv_group_id
+                AND gg.timeframe_id = a.timeframe_id
+    )
+    ,gaps AS (
+        SELECT
+            b.asset_ohlcv_group_id
+            ,b.base_asset_id
+            ,b.width
+            ,b.expected_date_open AS from_inclusive
+            ,b.date_open AS to_exclusive
+            ,LAG(b.date_open) OVER (PARTITION BY b.asset_ohlcv_group_id ORDER BY b.date_open) AS previous_to_exclusive
+        FROM bars b
+        WHERE b.date_open > b.expected_date_open
+    )
+    ,islands AS (
+        SELECT
+            g.asset_ohlcv_group_id
+            ,g.base_asset_id
+            ,g.from_inclusive
+            ,g.to_exclusive
+            ,SUM(
+                CASE WHEN g.from_inclusive - g.previous_to_exclusive <= g.width * %(coalesce_bars)s THEN 0 ELSE 1 END
+            ) OVER (PARTITION BY g.asset_ohlcv_group_id ORDER BY g.from_inclusive) AS island
+        FROM gaps g
+    )
+    SELECT
+        i.base_asset_id
+        ,MIN(i.from_inclusive)
+        ,MAX(i.to_exclusive)
+    FROM islands i
+    GROUP BY
+        i.asset_ohlcv_group_id
+        ,i.base_asset_id
+        ,i.island
+    ORDER BY
+        i.asset_ohlcv_group_id
+        ,MIN(i.from_inclusive)
+    """.format(
+        asset_ohlcv_group_table=AssetOHLCVGroup.__tablename__,
+        timeframe_table=Timeframe.__tablename__,
+        asset_ohlcv_group_watermark_table=AssetOHLCVGroupWatermark.__tablename__,
+        asset_ohlcv_table=AssetOHLCV.__tablename__,
+    )
+).strip()
+
+def seed_asset_ohlcv_group_watermark(asset_ohlcv_group_id: int, timeframe_id: int) -> None:
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            SEED_ASSET_OHLCV_GROUP_WATERMARK_SQL,
+            {"asset_ohlcv_group_id": asset_ohlcv_group_id, "timeframe_id": timeframe_id},
+        )
+
+
+
+def fetch_asset_ohlcv_gaps(
+    source_id: int, quote_asset_id: int, timeframe_id: int, coalesce_bars: int = 0
+) -> List[Tuple[int, datetime, datetime]]:
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            SELECT_ASSET_OHLCV_GAPS_SQL,
+            {
+                "source_id": source_id,
+                "quote_asset_id": quote_asset_id,
+                "timeframe_id": timeframe_id,
+                "coalesce_bars": coalesce_bars,
+            },
+        )
+        return [tuple(r) for r in cursor.fetchall()]
+
+def insert_asset_ohlcv_records(
+    asset_ohlcv_group_id: int,
+    asset_ohlcv_pull_id: int,
+    timeframe: Timeframe,
+    data: Sequence[Dict[str, Optional[Union[datetime, int, float]]]],
+) -> int:
+    if not data:
+        return 0
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    for record in data:
+        writer.writerow(tuple(record.get(c) for c in ASSET_OHLCV_STAGING_COLUMNS))
+    buffer.seek(0)
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        cursor.execute(CREATE_ASSET_OHLCV_STAGING_SQL)
+        cursor.copy_expert(COPY_ASSET_OHLCV_STAGING_SQL, buffer)
+        cursor.execute(
+            INSERT_ASSET_OHLCV_FROM_STAGING_SQL,
+            {
+                "asset_ohlcv_group_id": asset_ohlcv_group_id,
+                "timeframe_id": timeframe.id,
+                "asset_ohlcv_pull_id": asset_ohlcv_pull_id,
+            },
+        )
+        new_records_inserted, last_date_open = cursor.fetchone()
+        cursor.execute("DROP TABLE asset_ohlcv_staging")
+        if new_records_inserted:
+            cursor.execute(
+                UPDATE_ASSET_OHLCV_GROUP_WATERMARK_SQL,
+                {
+                    "asset_ohlcv_group_id": asset_ohlcv_group_id,
+                    "last_date_open": last_date_open,
+                    "bar_count": new_records_inserted,
+                    "asset_ohlcv_pull_id": asset_ohlcv_pull_id,
+                },
+            )
+    return new_records_inserted
 
 
 class AssetOHLCVDataFeedRetriever(ABC):
@@ -26,6 +271,7 @@ class AssetOHLCVDataFeedRetriever(ABC):
         self.from_inclusive = clean_range_cap(from_inclusive, timeframe.unit)
         self.to_exclusive = clean_range_cap(self.get_to_exclusive(to_exclusive), timeframe.unit)
         self._source_id = None
+        self.asset_ohlcv_group_id: Optional[int] = None
         self.validate_attributes()
 
     @property
@@ -56,8 +302,25 @@ class AssetOHLCVDataFeedRetriever(ABC):
     def retrieve_asset_ohlcv(self) -> List[Dict[str, Optional[Union[datetime, int, float]]]]:
         ...
 
+    def create_asset_ohlcv_group(self) -> AssetOHLCVGroup:
+        return AssetOHLCVGroup(
+            source_id=self.source_id,
+            base_asset_id=self.base_asset.id,
+            quote_asset_id=self.quote_asset.id,
+            timeframe_id=self.timeframe.id,
+        )
+
     def update_asset_ohlcv(self) -> int:
         data = self.retrieve_asset_ohlcv()
+        session.commit()
+        if data:
+            date_opens = [r["date_open"] for r in data]
+            ensure_asset_ohlcv_partitions(
+                self.timeframe.id,
+                self.timeframe.unit,
+                min(date_opens),
+                max(date_opens) + TIMEFRAME_UNIT_TO_DELTA_FUNCTION[self.timeframe.unit](self.timeframe.amount),
+            )
         asset_ohlcv_group = (
             session.query(AssetOHLCVGroup)
             .filter_by(
@@ -69,14 +332,12 @@ class AssetOHLCVDataFeedRetriever(ABC):
             .one_or_none()
         )
         if not asset_ohlcv_group:
-            asset_ohlcv_group = AssetOHLCVGroup(
-                source_id=self.source_id,
-                base_asset_id=self.base_asset.id,
-                quote_asset_id=self.quote_asset.id,
-                timeframe_id=self.timeframe.id,
-            )
+            asset_ohlcv_group = self.create_asset_ohlcv_group()
             session.add(asset_ohlcv_group)
             session.flush()
+        self.asset_ohlcv_group_id = asset_ohlcv_group.id
+        if not asset_ohlcv_group.asset_ohlcv_group_watermark:
+            seed_asset_ohlcv_group_watermark(asset_ohlcv_group.id, self.timeframe.id)
         asset_ohlcv_pull = AssetOHLCVPull(
             asset_ohlcv_group_id=asset_ohlcv_group.id,
             from_inclusive=self.from_inclusive,
@@ -84,27 +345,8 @@ class AssetOHLCVDataFeedRetriever(ABC):
         )
         session.add(asset_ohlcv_pull)
         session.flush()
-        new_records_inserted = 0
-        if data:
-            existing_records = (
-                session.query(AssetOHLCV)
-                .join(AssetOHLCVPull)
-                .join(AssetOHLCVGroup)
-                .filter(
-                    AssetOHLCVGroup.source_id == self.source_id,
-                    AssetOHLCVGroup.base_asset_id == self.base_asset.id,
-                    AssetOHLCVGroup.quote_asset_id == self.quote_asset.id,
-                    AssetOHLCVGroup.timeframe_id == self.timeframe.id,
-                    AssetOHLCV.date_open >= data[0]["date_open"],
-                    AssetOHLCV.date_open <= data[-1]["date_open"],
-                )
-                .all()
-            )
-            existing_date_opens = set(r.date_open for r in existing_records)
-            for record in data:
-                if record["date_open"] not in existing_date_opens:
-                    asset_ohlcv = AssetOHLCV(asset_ohlcv_pull_id=asset_ohlcv_pull.id, **record)
-                    session.add(asset_ohlcv)
-                    new_records_inserted += 1
+        new_records_inserted = insert_asset_ohlcv_records(
+            asset_ohlcv_group.id, asset_ohlcv_pull.id, self.timeframe, data
+        )
         session.commit()
         return new_records_inserted
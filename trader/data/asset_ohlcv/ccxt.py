@@ -1,8 +1,11 @@
 from abc import abstractmethod
+import asyncio
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import ccxt
+import ccxt.async_support as ccxt_async
 from ccxt.base.exchange import Exchange
+from trader.connections.http import http_client
 from trader.data.asset_ohlcv import AssetOHLCVDataFeedRetriever
 from trader.data.initial.asset_type import ASSET_TYPE_CRYPTOCURRENCY
 from trader.models.asset import Asset
@@ -12,9 +15,21 @@ from trader.utilities.functions.time import (
     ms_timestamp_to_datetime,
     TIMEFRAME_UNIT_TO_DELTA_FUNCTION,
 )
+from trader.utilities.token_bucket import TokenBucket
+
+
+CCXT_EXCHANGE_TOKEN_BUCKETS: Dict[str, TokenBucket] = {}
+
+
+def get_ccxt_exchange_token_bucket(exchange: Exchange) -> TokenBucket:
+    if exchange.id not in CCXT_EXCHANGE_TOKEN_BUCKETS:
+        CCXT_EXCHANGE_TOKEN_BUCKETS[exchange.id] = TokenBucket(1000 / exchange.rateLimit)
+    return CCXT_EXCHANGE_TOKEN_BUCKETS[exchange.id]
 
 
 class CCXTAssetOHLCVDataFeedRetriever(AssetOHLCVDataFeedRetriever):
+    OHLCV_PAGE_LIMIT = 500
+
     def __init__(
         self,
         base_asset: Asset,
@@ -35,7 +50,7 @@ class CCXTAssetOHLCVDataFeedRetriever(AssetOHLCVDataFeedRetriever):
     def exchange(self) -> Exchange:
         if self._exchange is None:
             exchange_class = getattr(ccxt, self.CCXT_EXCHANGE_ID)
-            self._exchange = exchange_class()
+            self._exchange = exchange_class({"session": http_client.session})
         return self._exchange
 
     def get_to_exclusive(self, to_exclusive: Optional[datetime]) -> datetime:
@@ -48,8 +63,71 @@ class CCXTAssetOHLCVDataFeedRetriever(AssetOHLCVDataFeedRetriever):
             raise ValueError("From inclusive value must be less than the to exclusive value")
         return True
 
-    def retrieve_asset_ohlcv(self) -> List[Dict[str, Optional[Union[datetime, int, float]]]]:
-        symbol = f"{self.base_asset.symbol}/{self.quote_asset.symbol}"
+    @property
+    def symbol(self) -> str:
+        return f"{self.base_asset.symbol}/{self.quote_asset.symbol}"
+
+    @staticmethod
+    def ohlcv_record_to_dict(record: Sequence[Any]) -> Dict[str, Union[datetime, float]]:
+        return {
+            "date_open": ms_timestamp_to_datetime(record[0]),
+            "open": record[1],
+            "high": record[2],
+            "low": record[3],
+            "close": record[4],
+            "volume": record[5],
+        }
+
+    def generate_windows(self) -> List[Tuple[datetime, datetime]]:
+        window_delta = TIMEFRAME_UNIT_TO_DELTA_FUNCTION[self.timeframe.unit](
+            self.timeframe.amount * self.OHLCV_PAGE_LIMIT
+        )
+        output: List[Tuple[datetime, datetime]] = []
+        window_start = self.from_inclusive
+        while window_start < self.to_exclusive:
+            window_end = min(window_start + window_delta, self.to_exclusive)
+            output.append((window_start, window_end))
+            window_start = window_end
+        return output
+
+    async def retrieve_window_asset_ohlcv(
+        self, exchange: Exchange, token_bucket: TokenBucket, window_start: datetime, window_end: datetime
+    ) -> List[Dict[str, Union[datetime, float]]]:
+        since = datetime_to_ms_timestamp(window_start)
+        end = datetime_to_ms_timestamp(window_end)
+        delta = TIMEFRAME_UNIT_TO_DELTA_FUNCTION[self.timeframe.unit](self.timeframe.amount)
+        output: List[Dict[str, Union[datetime, float]]] = []
+        while since < end:
+            await token_bucket.acquire()
+            data = await exchange.fetch_ohlcv(
+                self.symbol, timeframe=self.timeframe.ccxt_label, since=since, limit=self.OHLCV_PAGE_LIMIT
+            )
+            records = [r for r in data if since <= r[0] < end]
+            output.extend(self.ohlcv_record_to_dict(r) for r in records)
+            if not records or data[-1][0] >= end:
+                break
+            since = datetime_to_ms_timestamp(ms_timestamp_to_datetime(records[-1][0]) + delta)
+        return output
+
+    async def retrieve_asset_ohlcv_asynchronously(self) -> List[Dict[str, Optional[Union[datetime, int, float]]]]:
+        exchange_class = getattr(ccxt_async, self.CCXT_EXCHANGE_ID)
+        exchange = exchange_class({"enableRateLimit": False})
+        try:
+            token_bucket = get_ccxt_exchange_token_bucket(exchange)
+            windows_data = await asyncio.gather(
+                *(self.retrieve_window_asset_ohlcv(exchange, token_bucket, s, e) for s, e in self.generate_windows())
+            )
+        finally:
+            await exchange.close()
+        output: List[Dict[str, Union[datetime, float]]] = []
+        for window_data in windows_data:
+            for record in window_data:
+                if not output or record["date_open"] > output[-1]["date_open"]:
+                    output.append(record)
+        return output
+
+    def retrieve_asset_ohlcv_synchronously(self) -> List[Dict[str, Optional[Union[datetime, int, float]]]]:
+        symbol = self.symbol
         since = datetime_to_ms_timestamp(self.from_inclusive)
         end = datetime_to_ms_timestamp(self.to_exclusive)
         output: List[Dict[str, Union[datetime, float]]] = []
@@ -66,16 +144,7 @@ class CCXTAssetOHLCVDataFeedRetriever(AssetOHLCVDataFeedRetriever):
                 for record in data:
                     if record[0] >= end:
                         break
-                    output.append(
-                        {
-                            "date_open": ms_timestamp_to_datetime(record[0]),
-                            "open": record[1],
-                            "high": record[2],
-                            "low": record[3],
-                            "close": record[4],
-                            "volume": record[5],
-                        }
-                    )
+                    output.append(self.ohlcv_record_to_dict(record))
                 else:
                     since = datetime_to_ms_timestamp(
                         ms_timestamp_to_datetime(data[-1][0])
@@ -84,3 +153,8 @@ class CCXTAssetOHLCVDataFeedRetriever(AssetOHLCVDataFeedRetriever):
                     continue
                 break
         return output
+
+    def retrieve_asset_ohlcv(self) -> List[Dict[str, Optional[Union[datetime, int, float]]]]:
+        if len(self.generate_windows()) > 1:
+            return asyncio.run(self.retrieve_asset_ohlcv_asynchronously())
+        return self.retrieve_asset_ohlcv_synchronously()
@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional, Union
 from urllib.parse import urlencode
-import requests
+from trader.connections.http import http_client
 from trader.data.initial.asset_type import ASSET_TYPE_CRYPTOCURRENCY, ASSET_TYPE_STANDARD_CURRENCY
 from trader.data.initial.source import SOURCE_COIN_MARKET_CAP
 from trader.data.initial.timeframe import TIMEFRAME_ONE_DAY
@@ -43,7 +43,9 @@ class CoinMarketCapAssetOHLCVDataFeedRetriever(AssetOHLCVDataFeedRetriever):
                 "timeEnd": to_timestamp,
             }
         )
-        response = requests.get(f"https://api.coinmarketcap.com/data-api/v3/cryptocurrency/historical?{query_string}")
+        response = http_client.get(
+            f"https://api.coinmarketcap.com/data-api/v3/cryptocurrency/historical?{query_string}"
+        )
         data = response.json()
         output: List[Dict[str, Union[datetime, float]]] = []
         for record in data["data"]["quotes"]:
@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Union
+import pandas as pd
+from trader.connections.database import session
+from trader.data.asset_ohlcv import AssetOHLCVDataFeedRetriever
+from trader.models.asset_ohlcv import AssetOHLCV, AssetOHLCVGroup
+from trader.models.timeframe import Timeframe
+from trader.utilities.functions.asset_ohlcv import resample_asset_ohlcv_dataframe, timeframe_is_derivable
+
+
+class DerivedAssetOHLCVDataFeedRetriever(AssetOHLCVDataFeedRetriever):
+    SOURCE = None
+
+    def __init__(
+        self,
+        source_asset_ohlcv_group: AssetOHLCVGroup,
+        timeframe: Timeframe,
+        from_inclusive: datetime,
+        to_exclusive: Optional[datetime] = None,
+    ):
+        self.source_asset_ohlcv_group = source_asset_ohlcv_group
+        super().__init__(
+            source_asset_ohlcv_group.base_asset,
+            source_asset_ohlcv_group.quote_asset,
+            timeframe,
+            from_inclusive,
+            to_exclusive=to_exclusive,
+        )
+
+    @property
+    def source_id(self) -> int:
+        return self.source_asset_ohlcv_group.source_id
+
+    def get_to_exclusive(self, to_exclusive: Optional[datetime]) -> datetime:
+        return min(to_exclusive, datetime.now(timezone.utc)) if to_exclusive else datetime.now(timezone.utc)
+
+    def validate_attributes(self) -> bool:
+        if not timeframe_is_derivable(self.source_asset_ohlcv_group.timeframe, self.timeframe):
+            raise ValueError("Timeframe cannot be derived from the source asset OHLCV group timeframe")
+        if not self.from_inclusive < self.to_exclusive:
+            raise ValueError("From inclusive value must be less than the to exclusive value")
+        return True
+
+    def create_asset_ohlcv_group(self) -> AssetOHLCVGroup:
+        asset_ohlcv_group = super().create_asset_ohlcv_group()
+        asset_ohlcv_group.source_asset_ohlcv_group_id = self.source_asset_ohlcv_group.id
+        return asset_ohlcv_group
+
+    def retrieve_asset_ohlcv(self) -> List[Dict[str, Optional[Union[datetime, int, float]]]]:
+        records = (
+            session.query(
+                AssetOHLCV.date_open,
+                AssetOHLCV.open,
+                AssetOHLCV.high,
+                AssetOHLCV.low,
+                AssetOHLCV.close,
+                AssetOHLCV.volume,
+                AssetOHLCV.date_high,
+                AssetOHLCV.date_low,
+            )
+            .filter(
+                AssetOHLCV.asset_ohlcv_group_id == self.source_asset_ohlcv_group.id,
+                AssetOHLCV.timeframe_id == self.source_asset_ohlcv_group.timeframe_id,
+                AssetOHLCV.date_open >= self.from_inclusive,
+                AssetOHLCV.date_open < self.to_exclusive,
+            )
+            .order_by(AssetOHLCV.date_open.asc())
+            .all()
+        )
+        if not records:
+            return []
+        dataframe = pd.DataFrame.from_records(
+            records,
+            columns=("date_open", "open", "high", "low", "close", "volume", "date_high", "date_low"),
+            index="date_open",
+        )
+        resampled = resample_asset_ohlcv_dataframe(dataframe, self.source_asset_ohlcv_group.timeframe, self.timeframe)
+        output: List[Dict[str, Optional[Union[datetime, int, float]]]] = []
+        for date_open, row in zip(resampled.index, resampled.itertuples(index=False)):
+            output.append(
+                {
+                    "date_open": date_open.to_pydatetime(),
+                    "open": row.open,
+                    "high": row.high,
+                    "low": row.low,
+                    "close": row.close,
+                    "volume": row.volume,
+                    "date_high": row.date_high.to_pydatetime(),
+                    "date_low": row.date_low.to_pydatetime(),
+                }
+            )
+        return output
@@ -9,6 +9,7 @@ from trader.utilities.initial_enabled_data import (
     INITIAL_ENTRY_ENABLED_STRATEGY_VERSION_INSTANCES,
     INITIAL_EXIT_ENABLED_STRATEGY_VERSION_INSTANCES,
 )
+from trader.utilities.strategy_registry import publish_strategy_registry_invalidation
 
 
 def set_initial_enabled_strategy_version_instances() -> None:
@@ -57,3 +58,4 @@ def set_initial_enabled_strategy_version_instances() -> None:
                 )
                 session.add(enabled_strategy_version_instance_history)
     session.commit()
+    publish_strategy_registry_invalidation()
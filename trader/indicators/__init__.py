@@ -0,0 +1,7 @@
+from trader.indicators.base import Indicator
+from trader.indicators.cumulative import CumulativeMax, CumulativeMin
+from trader.indicators.exponential import ExponentialMovingAverage
+from trader.indicators.momentum import MovingAverageConvergenceDivergence, RelativeStrengthIndex
+from trader.indicators.registry import IndicatorRegistry
+from trader.indicators.rolling import RollingMax, RollingMean, RollingMin, RollingStandardDeviation
+from trader.indicators.volatility import AverageTrueRange, BollingerBands
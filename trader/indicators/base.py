@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Tuple
+import numpy as np
+
+
+class Indicator(ABC):
+    PARAMETERS: Tuple[str, ...] = ()
+    OUTPUTS: Tuple[str, ...] = ()
+
+    def __init__(self, source: str):
+        self.source = source
+
+    def get_sources(self) -> Tuple[str, ...]:
+        return (self.source,)
+
+    def get_key(self) -> Tuple[Any, ...]:
+        return (type(self).__name__, *self.get_sources(), *(getattr(self, p) for p in self.PARAMETERS))
+
+    @abstractmethod
+    def update(self, *values: float) -> Any:
+        ...
+
+    @abstractmethod
+    def get_state(self) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def set_state(self, state: Dict[str, Any]) -> None:
+        ...
+
+    def update_many(self, *values: np.ndarray) -> np.ndarray:
+        rows = [self.update(*r) for r in zip(*(v.tolist() for v in values))]
+        if self.OUTPUTS:
+            return np.array(rows, dtype="float64").reshape(len(rows), len(self.OUTPUTS))
+        return np.array(rows, dtype="float64")
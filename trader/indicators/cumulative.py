@@ -0,0 +1,61 @@
+from typing import Any, Dict, Optional
+import numpy as np
+from trader.indicators.base import Indicator
+
+
+class CumulativeMax(Indicator):
+    PARAMETERS = ("initial",)
+
+    def __init__(self, source: str, initial: Optional[float] = None):
+        super().__init__(source)
+        self.initial = initial
+        self.value = initial
+
+    def update(self, value: float) -> float:
+        if self.value is None or value > self.value:
+            self.value = value
+        return self.value
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        if values.shape[0] == 0:
+            return np.empty(0, dtype="float64")
+        output = np.maximum.accumulate(values.astype("float64"))
+        if self.value is not None:
+            output = np.maximum(output, self.value)
+        self.value = float(output[-1])
+        return output
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"value": self.value}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.value = state["value"]
+
+
+class CumulativeMin(Indicator):
+    PARAMETERS = ("initial",)
+
+    def __init__(self, source: str, initial: Optional[float] = None):
+        super().__init__(source)
+        self.initial = initial
+        self.value = initial
+
+    def update(self, value: float) -> float:
+        if self.value is None or value < self.value:
+            self.value = value
+        return self.value
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        if values.shape[0] == 0:
+            return np.empty(0, dtype="float64")
+        output = np.minimum.accumulate(values.astype("float64"))
+        if self.value is not None:
+            output = np.minimum(output, self.value)
+        self.value = float(output[-1])
+        return output
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"value": self.value}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.value = state["value"]
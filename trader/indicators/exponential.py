@@ -0,0 +1,40 @@
+from math import nan
+from typing import Any, Dict, Optional
+import numpy as np
+from trader.indicators.base import Indicator
+from trader.indicators.functions import exponential_smoothing
+
+
+class ExponentialMovingAverage(Indicator):
+    PARAMETERS = ("period",)
+
+    def __init__(self, source: str, period: int):
+        super().__init__(source)
+        if period < 1:
+            raise ValueError("Exponential moving average period must be at least 1")
+        self.period = period
+        self.alpha = 2 / (period + 1)
+        self.value: Optional[float] = None
+        self.count = 0
+
+    def update(self, value: float) -> float:
+        self.value = value if self.value is None else self.value + self.alpha * (value - self.value)
+        self.count += 1
+        if self.count < self.period:
+            return nan
+        return self.value
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        output = exponential_smoothing(values, self.alpha, self.value)
+        if output.shape[0]:
+            self.value = float(output[-1])
+        output[: max(self.period - 1 - self.count, 0)] = np.nan
+        self.count += output.shape[0]
+        return output
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"value": self.value, "count": self.count}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.value = state["value"]
+        self.count = state["count"]
@@ -0,0 +1,96 @@
+from math import log
+from typing import Iterator, Optional, Tuple
+import numpy as np
+
+
+ROLLING_WINDOW_CHUNK_SIZE = 1 << 20
+EXPONENTIAL_SMOOTHING_MAX_SCALE_LOG = 300.0
+
+
+def generate_rolling_windows(values: np.ndarray, period: int) -> Iterator[Tuple[int, np.ndarray]]:
+    if values.shape[0] < period:
+        return
+    windows = np.lib.stride_tricks.sliding_window_view(values, period)
+    chunk_size = max(1, ROLLING_WINDOW_CHUNK_SIZE // period)
+    for start in range(0, windows.shape[0], chunk_size):
+        yield start + period - 1, windows[start : start + chunk_size]
+
+
+def rolling_mean(values: np.ndarray, period: int) -> np.ndarray:
+    output = np.full(values.shape[0], np.nan, dtype="float64")
+    for start, windows in generate_rolling_windows(values, period):
+        output[start : start + windows.shape[0]] = windows.mean(axis=1)
+    return output
+
+
+def rolling_standard_deviation(values: np.ndarray, period: int, degrees_of_freedom: int = 1) -> np.ndarray:
+    output = np.full(values.shape[0], np.nan, dtype="float64")
+    for start, windows in generate_rolling_windows(values, period):
+        deviations = windows - windows.mean(axis=1, keepdims=True)
+        output[start : start + windows.shape[0]] = np.sqrt((deviations**2).sum(axis=1) / (period - degrees_of_freedom))
+    return output
+
+
+def rolling_mean_and_standard_deviation_matrix(
+    values: np.ndarray, periods: np.ndarray, start_index: int = 0, degrees_of_freedom: int = 1
+) -> Tuple[np.ndarray, np.ndarray]:
+    periods = np.asarray(periods, dtype="int64")
+    maximum_period = int(periods.max())
+    means = np.full((periods.shape[0], max(values.shape[0] - start_index, 0)), np.nan, dtype="float64")
+    standard_deviations = means.copy()
+    padded = np.concatenate((np.zeros(maximum_period - 1, dtype="float64"), values))
+    windows = np.lib.stride_tricks.sliding_window_view(padded, maximum_period)[start_index:, ::-1]
+    chunk_size = max(1, ROLLING_WINDOW_CHUNK_SIZE // maximum_period)
+    for start in range(0, windows.shape[0], chunk_size):
+        chunk = windows[start : start + chunk_size]
+        centred = chunk - chunk[:, :1]
+        sums = np.cumsum(centred, axis=1)[:, periods - 1]
+        squared_deviations = np.cumsum(centred**2, axis=1)[:, periods - 1] - sums**2 / periods
+        means[:, start : start + chunk.shape[0]] = (sums / periods + chunk[:, :1]).T
+        standard_deviations[:, start : start + chunk.shape[0]] = np.sqrt(
+            np.maximum(squared_deviations, 0) / (periods - degrees_of_freedom)
+        ).T
+    is_complete = np.arange(start_index, values.shape[0])[None, :] >= periods[:, None] - 1
+    means[~is_complete] = np.nan
+    standard_deviations[~is_complete] = np.nan
+    return means, standard_deviations
+
+
+def rolling_extreme(values: np.ndarray, period: int, function: np.ufunc) -> np.ndarray:
+    output = np.full(values.shape[0], np.nan, dtype="float64")
+    if values.shape[0] < period:
+        return output
+    blocks = np.concatenate((values, np.zeros(-values.shape[0] % period))).reshape(-1, period)
+    prefixes = function.accumulate(blocks, axis=1).ravel()
+    suffixes = function.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    output[period - 1 :] = function(suffixes[: values.shape[0] - period + 1], prefixes[period - 1 : values.shape[0]])
+    return output
+
+
+def rolling_max(values: np.ndarray, period: int) -> np.ndarray:
+    return rolling_extreme(values, period, np.maximum)
+
+
+def rolling_min(values: np.ndarray, period: int) -> np.ndarray:
+    return rolling_extreme(values, period, np.minimum)
+
+
+def exponential_smoothing(values: np.ndarray, alpha: float, initial: Optional[float] = None) -> np.ndarray:
+    output = np.empty(values.shape[0], dtype="float64")
+    if values.shape[0] == 0:
+        return output
+    if initial is None:
+        initial = float(values[0])
+    decay = 1 - alpha
+    if decay <= 0:
+        output[:] = values
+        return output
+    block_size = max(1, min(values.shape[0], int(EXPONENTIAL_SMOOTHING_MAX_SCALE_LOG / -log(decay))))
+    powers = decay ** np.arange(block_size + 1)
+    carry = initial
+    for i in range(0, values.shape[0], block_size):
+        block = values[i : i + block_size]
+        block_powers = powers[1 : block.shape[0] + 1]
+        output[i : i + block.shape[0]] = block_powers * (carry + alpha * np.cumsum(block / block_powers))
+        carry = float(output[i + block.shape[0] - 1])
+    return output
@@ -0,0 +1,91 @@
+from typing import Any, Dict, Optional
+import numpy as np
+from trader.indicators.base import Indicator
+from trader.indicators.exponential import ExponentialMovingAverage
+from trader.indicators.functions import exponential_smoothing
+
+
+class RelativeStrengthIndex(Indicator):
+    PARAMETERS = ("period",)
+
+    def __init__(self, source: str, period: int = 14):
+        super().__init__(source)
+        if period < 1:
+            raise ValueError("Relative strength index period must be at least 1")
+        self.period = period
+        self.alpha = 1 / period
+        self.previous_value: Optional[float] = None
+        self.average_gain: Optional[float] = None
+        self.average_loss: Optional[float] = None
+        self.count = 0
+
+    def update(self, value: float) -> float:
+        return float(self.update_many(np.array([value], dtype="float64"))[0])
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        output = np.full(values.shape[0], np.nan, dtype="float64")
+        history = values if self.previous_value is None else np.concatenate(([self.previous_value], values))
+        if history.shape[0] == 0:
+            return output
+        self.previous_value = float(history[-1])
+        deltas = np.diff(history)
+        if deltas.shape[0] == 0:
+            return output
+        average_gains = exponential_smoothing(np.maximum(deltas, 0), self.alpha, self.average_gain)
+        average_losses = exponential_smoothing(np.maximum(-deltas, 0), self.alpha, self.average_loss)
+        self.average_gain = float(average_gains[-1])
+        self.average_loss = float(average_losses[-1])
+        with np.errstate(divide="ignore", invalid="ignore"):
+            strengths = 100 * average_gains / (average_gains + average_losses)
+        strengths[: max(self.period - 1 - self.count, 0)] = np.nan
+        self.count += deltas.shape[0]
+        output[values.shape[0] - deltas.shape[0] :] = strengths
+        return output
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "previous_value": self.previous_value,
+            "average_gain": self.average_gain,
+            "average_loss": self.average_loss,
+            "count": self.count,
+        }
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.previous_value = state["previous_value"]
+        self.average_gain = state["average_gain"]
+        self.average_loss = state["average_loss"]
+        self.count = state["count"]
+
+
+class MovingAverageConvergenceDivergence(Indicator):
+    PARAMETERS = ("fast_period", "slow_period", "signal_period")
+    OUTPUTS = ("macd", "signal", "histogram")
+
+    def __init__(self, source: str, fast_period: int = 12, slow_period: int = 26, signal_period: int = 9):
+        super().__init__(source)
+        if fast_period >= slow_period:
+            raise ValueError("Moving average convergence divergence fast period must be less than its slow period")
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+        self.signal_period = signal_period
+        self.fast = ExponentialMovingAverage(source, fast_period)
+        self.slow = ExponentialMovingAverage(source, slow_period)
+        self.signal = ExponentialMovingAverage("macd", signal_period)
+
+    def update(self, value: float) -> np.ndarray:
+        return self.update_many(np.array([value], dtype="float64"))[0]
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        macd = self.fast.update_many(values) - self.slow.update_many(values)
+        is_valid = ~np.isnan(macd)
+        signal = np.full(values.shape[0], np.nan, dtype="float64")
+        signal[is_valid] = self.signal.update_many(macd[is_valid])
+        return np.stack((macd, signal, macd - signal), axis=1)
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"fast": self.fast.get_state(), "slow": self.slow.get_state(), "signal": self.signal.get_state()}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.fast.set_state(state["fast"])
+        self.slow.set_state(state["slow"])
+        self.signal.set_state(state["signal"])
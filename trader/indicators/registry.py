@@ -0,0 +1,33 @@
+import json
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
+from trader.indicators.base import Indicator
+
+
+class IndicatorRegistry:
+    def __init__(self, dataframe: pd.DataFrame):
+        self.dataframe = dataframe
+        self.sources: Dict[str, np.ndarray] = {}
+        self.results: Dict[Tuple[Any, ...], Tuple[np.ndarray, Dict[str, Any]]] = {}
+
+    def get_source(self, source: str) -> np.ndarray:
+        if source not in self.sources:
+            values = self.dataframe[source].to_numpy(dtype="float64")
+            values.flags.writeable = False
+            self.sources[source] = values
+        return self.sources[source]
+
+    def advance(
+        self, indicator: Indicator, start_index: int, state: Optional[Dict[str, Any]]
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        key = (*indicator.get_key(), start_index, json.dumps(state, sort_keys=True))
+        if key not in self.results:
+            if state is not None:
+                indicator.set_state(state)
+            output = indicator.update_many(*(self.get_source(s)[start_index:] for s in indicator.get_sources()))
+            values = np.full((self.dataframe.shape[0], *output.shape[1:]), np.nan, dtype="float64")
+            values[start_index:] = output
+            values.flags.writeable = False
+            self.results[key] = (values, indicator.get_state())
+        return self.results[key]
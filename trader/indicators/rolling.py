@@ -0,0 +1,121 @@
+from collections import deque
+from math import fsum, nan, sqrt
+from typing import Any, Deque, Dict
+import numpy as np
+from trader.indicators.base import Indicator
+from trader.indicators.functions import rolling_max, rolling_mean, rolling_min, rolling_standard_deviation
+
+
+class RollingMean(Indicator):
+    PARAMETERS = ("period",)
+
+    def __init__(self, source: str, period: int):
+        super().__init__(source)
+        if period < 1:
+            raise ValueError("Rolling mean period must be at least 1")
+        self.period = period
+        self.window: Deque[float] = deque(maxlen=period)
+
+    def update(self, value: float) -> float:
+        self.window.append(value)
+        if len(self.window) < self.period:
+            return nan
+        return fsum(self.window) / self.period
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        history = np.concatenate((np.array(self.window, dtype="float64"), values))
+        self.window.extend(values[-self.period :].tolist())
+        return rolling_mean(history, self.period)[history.shape[0] - values.shape[0] :]
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"window": list(self.window)}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.window = deque(state["window"], maxlen=self.period)
+
+
+class RollingStandardDeviation(Indicator):
+    PARAMETERS = ("period", "degrees_of_freedom")
+
+    def __init__(self, source: str, period: int, degrees_of_freedom: int = 1):
+        super().__init__(source)
+        if period <= degrees_of_freedom:
+            raise ValueError("Rolling standard deviation period must be greater than its degrees of freedom")
+        self.period = period
+        self.degrees_of_freedom = degrees_of_freedom
+        self.window: Deque[float] = deque(maxlen=period)
+
+    def update(self, value: float) -> float:
+        self.window.append(value)
+        if len(self.window) < self.period:
+            return nan
+        mean = fsum(self.window) / self.period
+        return sqrt(fsum((v - mean) ** 2 for v in self.window) / (self.period - self.degrees_of_freedom))
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        history = np.concatenate((np.array(self.window, dtype="float64"), values))
+        self.window.extend(values[-self.period :].tolist())
+        output = rolling_standard_deviation(history, self.period, self.degrees_of_freedom)
+        return output[history.shape[0] - values.shape[0] :]
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"window": list(self.window)}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.window = deque(state["window"], maxlen=self.period)
+
+
+class RollingMax(Indicator):
+    PARAMETERS = ("period",)
+
+    def __init__(self, source: str, period: int):
+        super().__init__(source)
+        if period < 1:
+            raise ValueError("Rolling max period must be at least 1")
+        self.period = period
+        self.window: Deque[float] = deque(maxlen=period)
+
+    def update(self, value: float) -> float:
+        self.window.append(value)
+        if len(self.window) < self.period:
+            return nan
+        return max(self.window)
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        history = np.concatenate((np.array(self.window, dtype="float64"), values))
+        self.window.extend(values[-self.period :].tolist())
+        return rolling_max(history, self.period)[history.shape[0] - values.shape[0] :]
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"window": list(self.window)}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.window = deque(state["window"], maxlen=self.period)
+
+
+class RollingMin(Indicator):
+    PARAMETERS = ("period",)
+
+    def __init__(self, source: str, period: int):
+        super().__init__(source)
+        if period < 1:
+            raise ValueError("Rolling min period must be at least 1")
+        self.period = period
+        self.window: Deque[float] = deque(maxlen=period)
+
+    def update(self, value: float) -> float:
+        self.window.append(value)
+        if len(self.window) < self.period:
+            return nan
+        return min(self.window)
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        history = np.concatenate((np.array(self.window, dtype="float64"), values))
+        self.window.extend(values[-self.period :].tolist())
+        return rolling_min(history, self.period)[history.shape[0] - values.shape[0] :]
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"window": list(self.window)}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.window = deque(state["window"], maxlen=self.period)
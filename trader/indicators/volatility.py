@@ -0,0 +1,73 @@
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+import numpy as np
+from trader.indicators.base import Indicator
+from trader.indicators.functions import rolling_mean, rolling_standard_deviation
+from trader.indicators.rolling import RollingMean
+
+
+class BollingerBands(Indicator):
+    PARAMETERS = ("period", "multiplier")
+    OUTPUTS = ("upper", "middle", "lower")
+
+    def __init__(self, source: str, period: int, multiplier: float = 2.0):
+        super().__init__(source)
+        if period < 2:
+            raise ValueError("Bollinger bands period must be at least 2")
+        self.period = period
+        self.multiplier = multiplier
+        self.window: Deque[float] = deque(maxlen=period)
+
+    def update(self, value: float) -> np.ndarray:
+        return self.update_many(np.array([value], dtype="float64"))[0]
+
+    def update_many(self, values: np.ndarray) -> np.ndarray:
+        history = np.concatenate((np.array(self.window, dtype="float64"), values))
+        self.window.extend(values[-self.period :].tolist())
+        offset = history.shape[0] - values.shape[0]
+        middle = rolling_mean(history, self.period)[offset:]
+        band_width = rolling_standard_deviation(history, self.period)[offset:] * self.multiplier
+        return np.stack((middle + band_width, middle, middle - band_width), axis=1)
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"window": list(self.window)}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.window = deque(state["window"], maxlen=self.period)
+
+
+class AverageTrueRange(Indicator):
+    PARAMETERS = ("period",)
+
+    def __init__(self, period: int, high: str = "high", low: str = "low", close: str = "close"):
+        super().__init__(close)
+        self.period = period
+        self.high = high
+        self.low = low
+        self.previous_close: Optional[float] = None
+        self.true_range_mean = RollingMean("true_range", period)
+
+    def get_sources(self) -> Tuple[str, ...]:
+        return (self.high, self.low, self.source)
+
+    def update(self, high: float, low: float, close: float) -> float:
+        return float(
+            self.update_many(
+                np.array([high], dtype="float64"), np.array([low], dtype="float64"), np.array([close], dtype="float64")
+            )[0]
+        )
+
+    def update_many(self, high: np.ndarray, low: np.ndarray, close: np.ndarray) -> np.ndarray:
+        if close.shape[0] == 0:
+            return np.empty(0, dtype="float64")
+        previous_close = np.concatenate(([np.nan if self.previous_close is None else self.previous_close], close[:-1]))
+        true_range = np.fmax(high - low, np.fmax(np.abs(high - previous_close), np.abs(previous_close - low)))
+        self.previous_close = float(close[-1])
+        return self.true_range_mean.update_many(true_range)
+
+    def get_state(self) -> Dict[str, Any]:
+        return {"previous_close": self.previous_close, "true_range": self.true_range_mean.get_state()}
+
+    def set_state(self, state: Dict[str, Any]) -> None:
+        self.previous_close = state["previous_close"]
+        self.true_range_mean.set_state(state["true_range"])
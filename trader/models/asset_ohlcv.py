@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, Numeric, UniqueConstraint
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, Numeric, UniqueConstraint
 from sqlalchemy.orm import backref, relationship
 from sqlalchemy.sql import func
 from trader.models.base import Base
@@ -12,10 +12,20 @@ class AssetOHLCVGroup(Base):
     base_asset_id = Column(Integer, ForeignKey("asset.id"), nullable=False)
     quote_asset_id = Column(Integer, ForeignKey("asset.id"), nullable=False)
     timeframe_id = Column(Integer, ForeignKey("timeframe.id"), nullable=False)
+    source_asset_ohlcv_group_id = Column(Integer, ForeignKey("asset_ohlcv_group.id"), nullable=True)
     date_created = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
+    # One to one
+    asset_ohlcv_group_watermark = relationship(
+        "AssetOHLCVGroupWatermark", lazy=False, backref=backref(__tablename__, lazy=False), uselist=False
+    )
+
     # One to many
+    asset_ohlcvs = relationship("AssetOHLCV", lazy=True, backref=backref(__tablename__, lazy=True))
     asset_ohlcv_pulls = relationship("AssetOHLCVPull", lazy=True, backref=backref(__tablename__, lazy=False))
+    derived_asset_ohlcv_groups = relationship(
+        "AssetOHLCVGroup", lazy=True, backref=backref(f"source_{__tablename__}", lazy=True, remote_side=[id])
+    )
 
     # Many to one
     base_asset = relationship(
@@ -28,6 +38,17 @@ class AssetOHLCVGroup(Base):
     __table_args__ = (UniqueConstraint("source_id", "base_asset_id", "quote_asset_id", "timeframe_id"),)
 
 
+class AssetOHLCVGroupWatermark(Base):
+    __tablename__ = "asset_ohlcv_group_watermark"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    asset_ohlcv_group_id = Column(Integer, ForeignKey("asset_ohlcv_group.id"), nullable=False, unique=True)
+    last_date_open = Column(DateTime(timezone=True), nullable=True)
+    bar_count = Column(Integer, nullable=False, default=0)
+    last_asset_ohlcv_pull_id = Column(Integer, ForeignKey("asset_ohlcv_pull.id"), nullable=True)
+    date_created = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
 class AssetOHLCVPull(Base):
     __tablename__ = "asset_ohlcv_pull"
 
@@ -44,9 +65,11 @@ class AssetOHLCVPull(Base):
 class AssetOHLCV(Base):
     __tablename__ = "asset_ohlcv"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    asset_ohlcv_group_id = Column(Integer, ForeignKey("asset_ohlcv_group.id"), nullable=False)
+    timeframe_id = Column(Integer, ForeignKey("timeframe.id"), primary_key=True)
     asset_ohlcv_pull_id = Column(Integer, ForeignKey("asset_ohlcv_pull.id"), nullable=False)
-    date_open = Column(DateTime(timezone=True), nullable=False)
+    date_open = Column(DateTime(timezone=True), primary_key=True)
     open = Column(Numeric, nullable=False)
     high = Column(Numeric, nullable=False)
     low = Column(Numeric, nullable=False)
@@ -54,3 +77,8 @@ class AssetOHLCV(Base):
     volume = Column(Numeric, nullable=False)
     date_high = Column(DateTime(timezone=True), nullable=True)
     date_low = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("asset_ohlcv_group_id", "timeframe_id", "date_open"),
+        {"postgresql_partition_by": "LIST (timeframe_id)"},
+    )
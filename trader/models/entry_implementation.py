@@ -12,6 +12,7 @@ class EntryImplementation(Base):
     timeframe_id = Column(Integer, ForeignKey("timeframe.id"), nullable=False)
     base_asset_id = Column(Integer, ForeignKey("asset.id"), nullable=False)
     strategy_version_instance_id = Column(Integer, ForeignKey("strategy_version_instance.id"), nullable=False)
+    indicator_state = Column(JSONB, nullable=True)
     date_created = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # One to many
@@ -0,0 +1,8 @@
+from trader.connections.database import session
+from trader.models.partitions.asset_ohlcv import create_upcoming_asset_ohlcv_partitions
+from trader.models.timeframe import Timeframe
+
+
+def initialize_partitions() -> None:
+    timeframes = session.query(Timeframe.id, Timeframe.unit).all()
+    create_upcoming_asset_ohlcv_partitions(timeframes)
@@ -0,0 +1,114 @@
+from datetime import datetime, timezone
+from textwrap import dedent
+from typing import List, Set, Tuple
+from sqlalchemy.engine import Connection
+from trader.connections.database import database
+from trader.models.asset_ohlcv import AssetOHLCV
+from trader.utilities.functions.time import TIMEFRAME_UNIT_TO_DELTA_FUNCTION, clean_range_cap
+
+
+ASSET_OHLCV_PARTITION_LOCK_KEY = 7_310_001
+ASSET_OHLCV_MONTHLY_PARTITION_TIMEFRAME_UNITS = {"s", "m", "h"}
+ASSET_OHLCV_PARTITION_LOOKAHEAD = 3
+
+
+CREATE_ASSET_OHLCV_TIMEFRAME_PARTITION_SQL = dedent(
+    """
+    CREATE TABLE IF NOT EXISTS public.{partition_table}
+    PARTITION OF public.{asset_ohlcv_table}
+    FOR VALUES IN ({timeframe_id})
+    PARTITION BY RANGE (date_open)
+    """
+).strip()
+
+
+CREATE_ASSET_OHLCV_DATE_PARTITION_SQL = dedent(
+    """
+    CREATE TABLE IF NOT EXISTS public.{partition_table}
+    PARTITION OF public.{timeframe_partition_table}
+    FOR VALUES FROM ('{from_inclusive}') TO ('{to_exclusive}')
+    """
+).strip()
+
+
+created_asset_ohlcv_partitions: Set[Tuple[int, datetime]] = set()
+
+
+def get_asset_ohlcv_partition_unit(timeframe_unit: str) -> str:
+    return "M" if timeframe_unit in ASSET_OHLCV_MONTHLY_PARTITION_TIMEFRAME_UNITS else "y"
+
+
+def get_asset_ohlcv_timeframe_partition_table(timeframe_id: int) -> str:
+    return f"{AssetOHLCV.__tablename__}_{timeframe_id}"
+
+
+def get_asset_ohlcv_date_partition_table(timeframe_id: int, partition_unit: str, from_inclusive: datetime) -> str:
+    suffix = from_inclusive.strftime("%Y%m") if partition_unit == "M" else from_inclusive.strftime("%Y")
+    return f"{get_asset_ohlcv_timeframe_partition_table(timeframe_id)}_{suffix}"
+
+
+def generate_asset_ohlcv_partition_ranges(
+    timeframe_unit: str, from_inclusive: datetime, to_exclusive: datetime
+) -> List[Tuple[datetime, datetime]]:
+    partition_unit = get_asset_ohlcv_partition_unit(timeframe_unit)
+    delta = TIMEFRAME_UNIT_TO_DELTA_FUNCTION[partition_unit](1)
+    start = clean_range_cap(from_inclusive.astimezone(timezone.utc), partition_unit)
+    to_exclusive = to_exclusive.astimezone(timezone.utc)
+    output: List[Tuple[datetime, datetime]] = []
+    while start < to_exclusive:
+        output.append((start, start + delta))
+        start += delta
+    return output
+
+
+def create_asset_ohlcv_partitions(
+    connection: Connection, timeframe_id: int, timeframe_unit: str, from_inclusive: datetime, to_exclusive: datetime
+) -> None:
+    partition_unit = get_asset_ohlcv_partition_unit(timeframe_unit)
+    timeframe_partition_table = get_asset_ohlcv_timeframe_partition_table(timeframe_id)
+    connection.exec_driver_sql("SELECT pg_advisory_xact_lock(%s)", (ASSET_OHLCV_PARTITION_LOCK_KEY,))
+    connection.exec_driver_sql(
+        CREATE_ASSET_OHLCV_TIMEFRAME_PARTITION_SQL.format(
+            partition_table=timeframe_partition_table,
+            asset_ohlcv_table=AssetOHLCV.__tablename__,
+            timeframe_id=int(timeframe_id),
+        )
+    )
+    for partition_from_inclusive, partition_to_exclusive in generate_asset_ohlcv_partition_ranges(
+        timeframe_unit, from_inclusive, to_exclusive
+    ):
+        connection.exec_driver_sql(
+            CREATE_ASSET_OHLCV_DATE_PARTITION_SQL.format(
+                partition_table=get_asset_ohlcv_date_partition_table(
+                    timeframe_id, partition_unit, partition_from_inclusive
+                ),
+                timeframe_partition_table=timeframe_partition_table,
+                from_inclusive=partition_from_inclusive.isoformat(),
+                to_exclusive=partition_to_exclusive.isoformat(),
+            )
+        )
+
+
+def ensure_asset_ohlcv_partitions(
+    timeframe_id: int, timeframe_unit: str, from_inclusive: datetime, to_exclusive: datetime
+) -> None:
+    missing_ranges = [
+        r
+        for r in generate_asset_ohlcv_partition_ranges(timeframe_unit, from_inclusive, to_exclusive)
+        if (timeframe_id, r[0]) not in created_asset_ohlcv_partitions
+    ]
+    if not missing_ranges:
+        return
+    with database.begin() as connection:
+        create_asset_ohlcv_partitions(
+            connection, timeframe_id, timeframe_unit, missing_ranges[0][0], missing_ranges[-1][1]
+        )
+    created_asset_ohlcv_partitions.update((timeframe_id, r[0]) for r in missing_ranges)
+
+
+def create_upcoming_asset_ohlcv_partitions(timeframes: List[Tuple[int, str]]) -> None:
+    now = datetime.now(timezone.utc)
+    for timeframe_id, timeframe_unit in timeframes:
+        partition_unit = get_asset_ohlcv_partition_unit(timeframe_unit)
+        to_exclusive = now + TIMEFRAME_UNIT_TO_DELTA_FUNCTION[partition_unit](ASSET_OHLCV_PARTITION_LOOKAHEAD)
+        ensure_asset_ohlcv_partitions(timeframe_id, timeframe_unit, now, to_exclusive)
@@ -13,6 +13,7 @@ class Position(Base):
     asset_id = Column(Integer, ForeignKey("asset.id"), nullable=False)
     data = Column(JSONB, nullable=True)
     is_demo = Column(Boolean, nullable=False, default=False)
+    date_closed = Column(DateTime(timezone=True), nullable=True)
     date_created = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
 
     # One to many
@@ -18,7 +18,7 @@ ASSET_OHLCV_SQL = dedent(
         ,a.volume
         ,a.date_high
         ,a.date_low
-        ,ap.asset_ohlcv_group_id
+        ,a.asset_ohlcv_group_id
         ,ag.source_id
         ,s.name AS source_name
         ,ag.base_asset_id
@@ -38,7 +38,7 @@ ASSET_OHLCV_SQL = dedent(
         INNER JOIN public.{asset_ohlcv_pull_table} ap ON
             a.asset_ohlcv_pull_id = ap.id
         INNER JOIN public.{asset_ohlcv_group_table} ag ON
-            ap.asset_ohlcv_group_id = ag.id
+            a.asset_ohlcv_group_id = ag.id
         INNER JOIN public.{source_table} s ON
             ag.source_id = s.id
         INNER JOIN public.{asset_table} ba ON
@@ -1,8 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Sequence, Tuple
+from typing import Any, Dict, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 from trader.connections.database import session
 from trader.data.initial.data_feed import DataFeedData
+from trader.indicators.base import Indicator
+from trader.indicators.registry import IndicatorRegistry
 from trader.models.asset import Asset
 from trader.models.strategy import Strategy as StrategyModel, StrategyVersion
 
@@ -59,3 +62,48 @@ class Strategy(ABC):
     @abstractmethod
     def enhance_data(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         ...
+
+    def get_indicators(self) -> Dict[str, Indicator]:
+        return {}
+
+    def enhance_data_from_indicators(
+        self, dataframe: pd.DataFrame, indicator_values: Dict[str, np.ndarray]
+    ) -> pd.DataFrame:
+        return dataframe.assign(**indicator_values)
+
+    def advance_indicators(
+        self, indicator_registry: IndicatorRegistry, start_index: int, indicator_state: Optional[Dict[str, Any]]
+    ) -> Tuple[Dict[str, np.ndarray], Optional[Dict[str, Any]]]:
+        indicators = self.get_indicators()
+        if not indicators:
+            return {}, None
+        dataframe = indicator_registry.dataframe
+        if (
+            not indicator_state
+            or start_index == 0
+            or indicator_state["date_open"] != dataframe.index[start_index - 1].isoformat()
+            or indicator_state["indicators"].keys() != indicators.keys()
+        ):
+            start_index = 0
+            indicator_state = None
+        indicator_values: Dict[str, np.ndarray] = {}
+        indicator_states: Dict[str, Dict[str, Any]] = {}
+        for name, indicator in indicators.items():
+            indicator_values[name], indicator_states[name] = indicator_registry.advance(
+                indicator, start_index, indicator_state["indicators"][name] if indicator_state else None
+            )
+        return indicator_values, {"date_open": dataframe.index[-1].isoformat(), "indicators": indicator_states}
+
+    def enhance_data_incremental(
+        self,
+        dataframe: pd.DataFrame,
+        start_index: int,
+        indicator_state: Optional[Dict[str, Any]],
+        indicator_registry: Optional[IndicatorRegistry] = None,
+    ) -> Tuple[pd.DataFrame, Optional[Dict[str, Any]]]:
+        if not self.get_indicators():
+            return self.enhance_data(dataframe), None
+        if indicator_registry is None or indicator_registry.dataframe is not dataframe:
+            indicator_registry = IndicatorRegistry(dataframe)
+        indicator_values, indicator_state = self.advance_indicators(indicator_registry, start_index, indicator_state)
+        return self.enhance_data_from_indicators(dataframe, indicator_values), indicator_state
@@ -1,5 +1,8 @@
 from abc import abstractmethod
+from typing import Any, Dict, Sequence
+import numpy as np
 import pandas as pd
+from trader.indicators.registry import IndicatorRegistry
 from trader.strategies.base import Strategy
 
 
@@ -9,3 +12,27 @@ class EntryStrategy(Strategy):
     @abstractmethod
     def get_buy_signal_strength(self, dataframe: pd.DataFrame, row_index: int) -> float:
         ...
+
+    def get_buy_signal_strengths(self, dataframe: pd.DataFrame, start_index: int = 0) -> np.ndarray:
+        return np.array(
+            [self.get_buy_signal_strength(dataframe, i) for i in range(start_index, dataframe.shape[0])],
+            dtype="float64",
+        )
+
+    def get_buy_signal_strengths_from_indicators(
+        self, indicator_registry: IndicatorRegistry, indicator_values: Dict[str, np.ndarray], start_index: int = 0
+    ) -> np.ndarray:
+        if indicator_values:
+            dataframe = self.enhance_data_from_indicators(indicator_registry.dataframe, indicator_values)
+        else:
+            dataframe = self.enhance_data(indicator_registry.dataframe)
+        return self.get_buy_signal_strengths(dataframe, start_index)
+
+    def get_buy_signal_strength_matrix(
+        self, dataframe: pd.DataFrame, arguments_list: Sequence[Dict[str, Any]], start_index: int = 0
+    ) -> np.ndarray:
+        output = np.zeros((len(arguments_list), max(dataframe.shape[0] - start_index, 0)), dtype="float64")
+        for i, arguments in enumerate(arguments_list):
+            strategy = type(self)(self.base_asset, arguments)
+            output[i] = strategy.get_buy_signal_strengths(strategy.enhance_data(dataframe), start_index)
+        return output
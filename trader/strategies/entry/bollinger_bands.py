@@ -1,12 +1,15 @@
-from finta import TA
+from typing import Any, Dict, Sequence
+import numpy as np
 import pandas as pd
 from trader.data.initial.data_feed import DATA_FEED_ASSET_OHLCV
+from trader.indicators import BollingerBands, Indicator, IndicatorRegistry
+from trader.indicators.functions import rolling_mean_and_standard_deviation_matrix
 from trader.strategies.entry.base import EntryStrategy
 
 
 class BollingerBandsEntryStrategy(EntryStrategy):
     NAME = "Bollinger Bands"
-    VERSION = "1.0.0"
+    VERSION = "1.3.3"
     DATA_FEEDS = (DATA_FEED_ASSET_OHLCV,)
     PARAMETER_SPACE = {"bollinger_bands_period": range(5, 45, 5)}
 
@@ -14,8 +17,18 @@ class BollingerBandsEntryStrategy(EntryStrategy):
     def bollinger_bands_period(self) -> int:
         return self.arguments.get("bollinger_bands_period", 20)
 
+    def get_indicators(self) -> Dict[str, Indicator]:
+        return {"BB": BollingerBands("close", self.bollinger_bands_period)}
+
+    def enhance_data_from_indicators(
+        self, dataframe: pd.DataFrame, indicator_values: Dict[str, np.ndarray]
+    ) -> pd.DataFrame:
+        bands = indicator_values["BB"]
+        return dataframe.assign(BB_UPPER=bands[:, 0], BB_MIDDLE=bands[:, 1], BB_LOWER=bands[:, 2])
+
     def enhance_data(self, dataframe: pd.DataFrame) -> pd.DataFrame:
-        return dataframe.join(TA.BBANDS(dataframe, self.bollinger_bands_period))
+        enhanced_dataframe, _ = self.enhance_data_incremental(dataframe, 0, None)
+        return enhanced_dataframe
 
     def get_buy_signal_strength(self, dataframe: pd.DataFrame, row_index: int) -> float:
         row = dataframe.iloc[row_index]
@@ -24,3 +37,30 @@ class BollingerBandsEntryStrategy(EntryStrategy):
         if row["close"] < row["BB_LOWER"]:
             return 1.0
         return 0.0
+
+    def get_buy_signal_strengths(self, dataframe: pd.DataFrame, start_index: int = 0) -> np.ndarray:
+        close = dataframe["close"].to_numpy(dtype="float64")[start_index:]
+        lower = dataframe["BB_LOWER"].to_numpy(dtype="float64")[start_index:]
+        with np.errstate(invalid="ignore"):
+            return np.where(close < lower, 1.0, 0.0)
+
+    def get_buy_signal_strengths_from_indicators(
+        self, indicator_registry: IndicatorRegistry, indicator_values: Dict[str, np.ndarray], start_index: int = 0
+    ) -> np.ndarray:
+        close = indicator_registry.get_source("close")[start_index:]
+        lower = indicator_values["BB"][start_index:, 2]
+        with np.errstate(invalid="ignore"):
+            return np.where(close < lower, 1.0, 0.0)
+
+    def get_buy_signal_strength_matrix(
+        self, dataframe: pd.DataFrame, arguments_list: Sequence[Dict[str, Any]], start_index: int = 0
+    ) -> np.ndarray:
+        close = dataframe["close"].to_numpy(dtype="float64")
+        if close.shape[0] <= start_index:
+            return np.zeros((len(arguments_list), 0), dtype="float64")
+        periods = np.array(
+            [type(self)(self.base_asset, a).bollinger_bands_period for a in arguments_list], dtype="int64"
+        )
+        means, standard_deviations = rolling_mean_and_standard_deviation_matrix(close, periods, start_index)
+        with np.errstate(invalid="ignore"):
+            return np.where(close[None, start_index:] < means - standard_deviations * 2, 1.0, 0.0)
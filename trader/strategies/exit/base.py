@@ -1,5 +1,7 @@
 from abc import abstractmethod
-from typing import Any, Dict
+from copy import deepcopy
+from typing import Any, Dict, Sequence, Tuple
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm.attributes import flag_modified
 from trader.models.asset import Asset
@@ -9,14 +11,47 @@ from trader.strategies.base import Strategy
 
 class ExitStrategy(Strategy):
     IS_ENTRY = False
+    MAXIMUM_STATE_FIELDS: Tuple[str, ...] = ()
 
     def __init__(self, base_asset: Asset, arguments: Dict[str, Any], position: Position):
         super().__init__(base_asset, arguments)
         self.position = position
 
     def flag_position_data_modified(self) -> None:
-        flag_modified(self.position, "data")
+        if isinstance(self.position, Position):
+            flag_modified(self.position, "data")
 
     @abstractmethod
     def get_sell_signal_strength(self, dataframe: pd.DataFrame, row_index: int) -> float:
         ...
+
+    def get_sell_signal_strengths(self, dataframe: pd.DataFrame, start_index: int = 0) -> np.ndarray:
+        return np.array(
+            [self.get_sell_signal_strength(dataframe, i) for i in range(start_index, dataframe.shape[0])],
+            dtype="float64",
+        )
+
+    def get_sell_signal_strength_matrix(
+        self, dataframe: pd.DataFrame, arguments_list: Sequence[Dict[str, Any]], start_index: int = 0
+    ) -> np.ndarray:
+        output = np.zeros((len(arguments_list), max(dataframe.shape[0] - start_index, 0)), dtype="float64")
+        position_data = self.position.data
+        try:
+            for i, arguments in enumerate(arguments_list):
+                self.position.data = deepcopy(position_data)
+                strategy = type(self)(self.base_asset, arguments, self.position)
+                output[i] = strategy.get_sell_signal_strengths(strategy.enhance_data(dataframe), start_index)
+        finally:
+            self.position.data = position_data
+        return output
+
+    def get_position_sell_signal_strength_matrix(
+        self, dataframe: pd.DataFrame, positions: Sequence[Any], start_indices: np.ndarray
+    ) -> np.ndarray:
+        output = np.zeros((len(positions), dataframe.shape[0]), dtype="float64")
+        for i, (position, start_index) in enumerate(zip(positions, start_indices.tolist())):
+            if start_index >= dataframe.shape[0]:
+                continue
+            strategy = type(self)(self.base_asset, self.arguments, position)
+            output[i, start_index:] = strategy.get_sell_signal_strengths(dataframe, start_index)
+        return output
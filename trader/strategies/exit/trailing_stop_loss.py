@@ -1,3 +1,5 @@
+from typing import Any, Dict, Sequence
+import numpy as np
 import pandas as pd
 from trader.data.initial.data_feed import DATA_FEED_ASSET_OHLCV
 from trader.strategies.exit.base import ExitStrategy
@@ -5,9 +7,10 @@ from trader.strategies.exit.base import ExitStrategy
 
 class TrailingStopLossExitStrategy(ExitStrategy):
     NAME = "Trailing Stop Loss"
-    VERSION = "1.0.0"
+    VERSION = "1.3.0"
     DATA_FEEDS = (DATA_FEED_ASSET_OHLCV,)
     PARAMETER_SPACE = {"trailing_stop_loss_percentage": [i * 0.01 for i in range(2, 42, 2)]}
+    MAXIMUM_STATE_FIELDS = ("trailing_stop_loss_encountered_max",)
 
     @property
     def trailing_stop_loss_percentage(self) -> float:
@@ -30,3 +33,48 @@ class TrailingStopLossExitStrategy(ExitStrategy):
         ):
             return 1.0
         return 0.0
+
+    def get_sell_signal_strengths(self, dataframe: pd.DataFrame, start_index: int = 0) -> np.ndarray:
+        high = dataframe["high"].to_numpy(dtype="float64")[start_index:]
+        close = dataframe["close"].to_numpy(dtype="float64")[start_index:]
+        if high.shape[0] == 0:
+            return np.empty(0, dtype="float64")
+        encountered_max = np.maximum.accumulate(
+            np.maximum(high, self.position.data.get("trailing_stop_loss_encountered_max", self.position.bought_price))
+        )
+        self.position.data["trailing_stop_loss_encountered_max"] = float(encountered_max[-1])
+        self.flag_position_data_modified()
+        return np.where(close <= encountered_max * (1 - self.trailing_stop_loss_percentage), 1.0, 0.0)
+
+    def get_sell_signal_strength_matrix(
+        self, dataframe: pd.DataFrame, arguments_list: Sequence[Dict[str, Any]], start_index: int = 0
+    ) -> np.ndarray:
+        high = dataframe["high"].to_numpy(dtype="float64")[start_index:]
+        close = dataframe["close"].to_numpy(dtype="float64")[start_index:]
+        percentages = np.array(
+            [type(self)(self.base_asset, a, self.position).trailing_stop_loss_percentage for a in arguments_list],
+            dtype="float64",
+        )[:, None]
+        encountered_max = np.maximum.accumulate(
+            np.maximum(high, self.position.data.get("trailing_stop_loss_encountered_max", self.position.bought_price))
+        )
+        return np.where(close[None, :] <= encountered_max[None, :] * (1 - percentages), 1.0, 0.0)
+
+    def get_position_sell_signal_strength_matrix(
+        self, dataframe: pd.DataFrame, positions: Sequence[Any], start_indices: np.ndarray
+    ) -> np.ndarray:
+        high = dataframe["high"].to_numpy(dtype="float64")
+        close = dataframe["close"].to_numpy(dtype="float64")
+        is_evaluated = np.arange(high.shape[0])[None, :] >= start_indices[:, None]
+        initial_max = np.array(
+            [p.data.get("trailing_stop_loss_encountered_max", p.bought_price) for p in positions], dtype="float64"
+        )
+        encountered_max = np.maximum(
+            np.maximum.accumulate(np.where(is_evaluated, high[None, :], -np.inf), axis=1), initial_max[:, None]
+        )
+        for position, position_max, start_index in zip(positions, encountered_max[:, -1], start_indices.tolist()):
+            if start_index < high.shape[0]:
+                position.data["trailing_stop_loss_encountered_max"] = float(position_max)
+        return np.where(
+            is_evaluated & (close[None, :] <= encountered_max * (1 - self.trailing_stop_loss_percentage)), 1.0, 0.0
+        )
@@ -0,0 +1,18 @@
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from trader.strategies import parameter_space_to_arguments_dict
+from trader.strategies.base import Strategy
+
+
+def sweep_signal_strengths(
+    strategy: Strategy,
+    dataframe: pd.DataFrame,
+    arguments_list: Optional[List[Dict[str, Any]]] = None,
+    start_index: int = 0,
+) -> Tuple[List[Dict[str, Any]], np.ndarray]:
+    if arguments_list is None:
+        arguments_list = parameter_space_to_arguments_dict(type(strategy))
+    if strategy.IS_ENTRY:
+        return arguments_list, strategy.get_buy_signal_strength_matrix(dataframe, arguments_list, start_index)
+    return arguments_list, strategy.get_sell_signal_strength_matrix(dataframe, arguments_list, start_index)
@@ -50,6 +50,34 @@ app.conf.beat_schedule = {
             "priority": 1,
         },
     },
+    dasherize("create_asset_ohlcv_partitions"): {
+        "task": "trader.tasks.asset_ohlcv.create_asset_ohlcv_partitions",
+        "schedule": crontab(minute=0, hour=1),
+        "options": {
+            "priority": 1,
+        },
+    },
+    dasherize("evict_expired_http_cache_entries"): {
+        "task": "trader.tasks.http_cache.evict_expired_http_cache_entries",
+        "schedule": crontab(minute=30, hour=0),
+        "options": {
+            "priority": 1,
+        },
+    },
+    dasherize("checkpoint_exit_states"): {
+        "task": "trader.tasks.exit_state.checkpoint_exit_states",
+        "schedule": crontab(minute="*/5"),
+        "options": {
+            "priority": 2,
+        },
+    },
+    dasherize("queue_backfill_cryptocurrency_one_day_asset_ohlcv_gaps_from_coin_market_cap"): {
+        "task": "trader.tasks.asset_ohlcv.queue_backfill_cryptocurrency_one_day_asset_ohlcv_gaps_from_coin_market_cap",
+        "schedule": crontab(minute=0, hour=3, day_of_week="mon"),
+        "options": {
+            "priority": 4,
+        },
+    },
     dasherize("queue_update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap"): {
         "task": "trader.tasks.asset_ohlcv.queue_update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap",
         "schedule": crontab(minute=0, hour=2),
@@ -61,9 +89,13 @@ app.conf.beat_schedule = {
 
 
 from trader.tasks.asset_ohlcv import (
+    create_asset_ohlcv_partitions,
+    queue_backfill_cryptocurrency_one_day_asset_ohlcv_gaps_from_coin_market_cap,
     queue_update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap,
     update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap,
+    update_derived_asset_ohlcv,
 )
+from trader.tasks.buy_signal import handle_buy_signal, handle_buy_signals
 from trader.tasks.country import update_countries_from_iso
 from trader.tasks.cryptocurrency_exchange_market_stat import (
     queue_update_cryptocurrency_exchange_market_stats_from_coin_market_cap,
@@ -71,5 +103,7 @@ from trader.tasks.cryptocurrency_exchange_market_stat import (
 )
 from trader.tasks.cryptocurrency_exchange_rank import update_cryptocurrency_exchange_ranks_from_coin_market_cap
 from trader.tasks.cryptocurrency_rank import update_current_cryptocurrency_ranks_from_coin_market_cap
-from trader.tasks.implementation import run_implementations
+from trader.tasks.exit_state import checkpoint_exit_states
+from trader.tasks.http_cache import evict_expired_http_cache_entries
+from trader.tasks.implementation import run_implementations, run_implementations_batch
 from trader.tasks.standard_currency import update_standard_currencies_from_iso
@@ -1,27 +1,91 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional, Tuple
+from celery import group
+from sqlalchemy import and_
 from sqlalchemy.sql import func
 from trader.connections.cache import cache
 from trader.connections.database import session
+from trader.data.asset_ohlcv import fetch_asset_ohlcv_gaps
 from trader.data.asset_ohlcv.coin_market_cap import CoinMarketCapAssetOHLCVDataFeedRetriever
+from trader.data.asset_ohlcv.derived import DerivedAssetOHLCVDataFeedRetriever
 from trader.data.initial.data_feed import DATA_FEED_ASSET_OHLCV
 from trader.data.initial.source import SOURCE_COIN_MARKET_CAP
 from trader.data.initial.timeframe import TIMEFRAME_ONE_DAY
 from trader.models.asset import Asset
-from trader.models.asset_ohlcv import AssetOHLCV, AssetOHLCVGroup, AssetOHLCVPull
-from trader.models.enabled_cryptocurrency_exchange import EnabledCryptocurrencyExchange
+from trader.models.asset_ohlcv import AssetOHLCV, AssetOHLCVGroup, AssetOHLCVGroupWatermark
+from trader.models.cryptocurrency import Cryptocurrency
+from trader.models.partitions.asset_ohlcv import create_upcoming_asset_ohlcv_partitions
+from trader.models.timeframe import Timeframe
 from trader.tasks import app
 from trader.utilities.constants import DATA_DEFAULT_FLOOR, DATA_FEED_MONITOR_QUEUE_KEY
 from trader.utilities.functions import generate_data_feed_monitor_value, get_asset_us_dollar, get_asset_us_dollar_id
+from trader.utilities.functions.asset_ohlcv import timeframe_is_derivable
 from trader.utilities.functions.time import (
     clean_range_cap,
     datetime_to_ms_timestamp,
     ms_timestamp_to_datetime,
     TIMEFRAME_UNIT_TO_DELTA_FUNCTION,
 )
-from trader.utilities.functions.cryptocurrency_exchange import (
-    fetch_enabled_base_asset_ids_for_cryptocurrency_exchanges,
-)
+from trader.utilities.functions.cryptocurrency_exchange import fetch_enabled_base_asset_ids_subquery
+
+
+@app.task
+def create_asset_ohlcv_partitions() -> None:
+    timeframes = session.query(Timeframe.id, Timeframe.unit).all()
+    create_upcoming_asset_ohlcv_partitions(timeframes)
+
+
+@app.task
+def update_derived_asset_ohlcv(
+    source_asset_ohlcv_group_id: int,
+    from_inclusive_ms_timestamp: Optional[int] = None,
+    to_exclusive_ms_timestamp: Optional[int] = None,
+) -> None:
+    source_asset_ohlcv_group = session.query(AssetOHLCVGroup).get(source_asset_ohlcv_group_id)
+    if not source_asset_ohlcv_group:
+        raise ValueError("Asset OHLCV group does not exist with that ID")
+    for timeframe in session.query(Timeframe).all():
+        if not timeframe_is_derivable(source_asset_ohlcv_group.timeframe, timeframe):
+            continue
+        asset_ohlcv_group = (
+            session.query(AssetOHLCVGroup)
+            .filter_by(
+                source_id=source_asset_ohlcv_group.source_id,
+                base_asset_id=source_asset_ohlcv_group.base_asset_id,
+                quote_asset_id=source_asset_ohlcv_group.quote_asset_id,
+                timeframe_id=timeframe.id,
+            )
+            .one_or_none()
+        )
+        if asset_ohlcv_group and asset_ohlcv_group.source_asset_ohlcv_group_id != source_asset_ohlcv_group.id:
+            continue
+        timedelta = TIMEFRAME_UNIT_TO_DELTA_FUNCTION[timeframe.unit](timeframe.amount)
+        to_exclusive = None
+        if asset_ohlcv_group and from_inclusive_ms_timestamp is not None:
+            from_inclusive = ms_timestamp_to_datetime(from_inclusive_ms_timestamp) - timedelta
+            if to_exclusive_ms_timestamp is not None:
+                to_exclusive = ms_timestamp_to_datetime(to_exclusive_ms_timestamp) + timedelta
+        elif (
+            asset_ohlcv_group
+            and asset_ohlcv_group.asset_ohlcv_group_watermark
+            and asset_ohlcv_group.asset_ohlcv_group_watermark.last_date_open
+        ):
+            from_inclusive = asset_ohlcv_group.asset_ohlcv_group_watermark.last_date_open + timedelta
+        else:
+            from_inclusive = (
+                session.query(func.min(AssetOHLCV.date_open))
+                .filter(
+                    AssetOHLCV.asset_ohlcv_group_id == source_asset_ohlcv_group.id,
+                    AssetOHLCV.timeframe_id == source_asset_ohlcv_group.timeframe_id,
+                )
+                .scalar()
+            )
+        if from_inclusive is None or datetime.now(timezone.utc) < from_inclusive + timedelta:
+            continue
+        data_retriever = DerivedAssetOHLCVDataFeedRetriever(
+            source_asset_ohlcv_group, timeframe, from_inclusive, to_exclusive=to_exclusive
+        )
+        data_retriever.update_asset_ohlcv()
 
 
 @app.task
@@ -38,41 +102,76 @@ def update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap(
     )
     new_records_inserted = data_retriever.update_asset_ohlcv()
     if new_records_inserted:
+        if to_exclusive_ms_timestamp:
+            derive_args = (data_retriever.asset_ohlcv_group_id, from_inclusive_ms_timestamp, to_exclusive_ms_timestamp)
+        else:
+            derive_args = (data_retriever.asset_ohlcv_group_id,)
+        update_derived_asset_ohlcv.apply_async(args=derive_args, priority=3)
         value = generate_data_feed_monitor_value(one_day.id, base_asset_id, DATA_FEED_ASSET_OHLCV.fetch_id())
         cache.rpush(DATA_FEED_MONITOR_QUEUE_KEY, value)
 
 
+def plan_update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap() -> List[Tuple[int, int]]:
+    coin_market_cap_id = SOURCE_COIN_MARKET_CAP.fetch_id()
+    us_dollar_id = get_asset_us_dollar_id()
+    one_day_id = TIMEFRAME_ONE_DAY.fetch_id()
+    enabled_base_asset_ids = fetch_enabled_base_asset_ids_subquery()
+    records = (
+        session.query(
+            Cryptocurrency.asset_id,
+            Cryptocurrency.coin_market_cap_date_added,
+            AssetOHLCVGroupWatermark.last_date_open,
+        )
+        .join(enabled_base_asset_ids, enabled_base_asset_ids.c.base_asset_id == Cryptocurrency.asset_id)
+        .outerjoin(
+            AssetOHLCVGroup,
+            and_(
+                AssetOHLCVGroup.base_asset_id == Cryptocurrency.asset_id,
+                AssetOHLCVGroup.source_id == coin_market_cap_id,
+                AssetOHLCVGroup.quote_asset_id == us_dollar_id,
+                AssetOHLCVGroup.timeframe_id == one_day_id,
+            ),
+        )
+        .outerjoin(AssetOHLCVGroupWatermark)
+        .filter(Cryptocurrency.coin_market_cap_id.isnot(None))
+        .all()
+    )
+    timedelta = TIMEFRAME_UNIT_TO_DELTA_FUNCTION[TIMEFRAME_ONE_DAY.unit](TIMEFRAME_ONE_DAY.amount)
+    now = datetime.now(timezone.utc)
+    output: List[Tuple[int, int]] = []
+    for base_asset_id, coin_market_cap_date_added, last_date in records:
+        if last_date:
+            target_date = last_date + timedelta
+        else:
+            target_date = coin_market_cap_date_added or DATA_DEFAULT_FLOOR
+        if now - clean_range_cap(target_date, TIMEFRAME_ONE_DAY.unit) >= timedelta:
+            output.append((base_asset_id, datetime_to_ms_timestamp(target_date)))
+    return output
+
+
 @app.task
 def queue_update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap() -> None:
-    enabled_cryptocurrency_exchanges = session.query(EnabledCryptocurrencyExchange).all()
-    base_asset_ids = fetch_enabled_base_asset_ids_for_cryptocurrency_exchanges(
-        (e.cryptocurrency_exchange for e in enabled_cryptocurrency_exchanges if e.history[0].is_enabled)
+    targets = plan_update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap()
+    if targets:
+        group(
+            update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap.signature(args=t, priority=3)
+            for t in targets
+        ).apply_async()
+
+
+@app.task
+def queue_backfill_cryptocurrency_one_day_asset_ohlcv_gaps_from_coin_market_cap(coalesce_bars: int = 7) -> None:
+    gaps = fetch_asset_ohlcv_gaps(
+        SOURCE_COIN_MARKET_CAP.fetch_id(),
+        get_asset_us_dollar_id(),
+        TIMEFRAME_ONE_DAY.fetch_id(),
+        coalesce_bars=coalesce_bars,
     )
-    us_dollar_id = get_asset_us_dollar_id()
-    coin_market_cap_id = SOURCE_COIN_MARKET_CAP.fetch_id()
-    one_day_id = TIMEFRAME_ONE_DAY.fetch_id()
-    for base_asset_id in base_asset_ids:
-        base_asset = session.query(Asset).get(base_asset_id)
-        if base_asset and base_asset.cryptocurrency and base_asset.cryptocurrency.coin_market_cap_id:
-            last_date = (
-                session.query(func.max(AssetOHLCV.date_open))
-                .select_from(AssetOHLCV)
-                .join(AssetOHLCVPull)
-                .join(AssetOHLCVGroup)
-                .filter(
-                    AssetOHLCVGroup.source_id == coin_market_cap_id,
-                    AssetOHLCVGroup.base_asset_id == base_asset.id,
-                    AssetOHLCVGroup.quote_asset_id == us_dollar_id,
-                    AssetOHLCVGroup.timeframe_id == one_day_id,
-                )
-                .one_or_none()
+    if gaps:
+        group(
+            update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap.signature(
+                args=(base_asset_id, datetime_to_ms_timestamp(from_inclusive), datetime_to_ms_timestamp(to_exclusive)),
+                priority=3,
             )
-            timedelta = TIMEFRAME_UNIT_TO_DELTA_FUNCTION[TIMEFRAME_ONE_DAY.unit](TIMEFRAME_ONE_DAY.amount)
-            if last_date[0]:
-                target_date = last_date[0] + timedelta
-            else:
-                target_date = base_asset.cryptocurrency.coin_market_cap_date_added or DATA_DEFAULT_FLOOR
-            if datetime.now(timezone.utc) - clean_range_cap(target_date, TIMEFRAME_ONE_DAY.unit) >= timedelta:
-                update_cryptocurrency_one_day_asset_ohlcv_from_coin_market_cap.apply_async(
-                    args=(base_asset.id, datetime_to_ms_timestamp(target_date)), priority=3
-                )
+            for base_asset_id, from_inclusive, to_exclusive in gaps
+        ).apply_async()
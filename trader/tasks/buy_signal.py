@@ -1,6 +1,13 @@
+from typing import Sequence
 from trader.tasks import app
 
 
 @app.task
 def handle_buy_signal(buy_signal_id: int) -> None:
     pass
+
+
+@app.task
+def handle_buy_signals(buy_signal_ids: Sequence[int]) -> None:
+    for buy_signal_id in buy_signal_ids:
+        handle_buy_signal(buy_signal_id)
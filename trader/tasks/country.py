@@ -1,6 +1,6 @@
 from bs4 import BeautifulSoup
-import requests
 from trader.connections.database import session
+from trader.connections.http import http_client
 from trader.data.initial.source import SOURCE_ISO
 from trader.models.country import Country
 from trader.tasks import app
@@ -9,7 +9,7 @@ from trader.tasks import app
 @app.task
 def update_countries_from_iso() -> None:
     iso_id = SOURCE_ISO.fetch_id()
-    response = requests.get("https://en.wikipedia.org/wiki/List_of_ISO_3166_country_codes")
+    response = http_client.get("https://en.wikipedia.org/wiki/List_of_ISO_3166_country_codes")
     soup = BeautifulSoup(response.text, "lxml")
     table_h2 = soup.select("span#Current_ISO_3166_country_codes")[0]
     table_body_rows = table_h2.parent.next_sibling.next_sibling.next_sibling.next_sibling.find_all("tr")[2:]
@@ -1,7 +1,7 @@
 from urllib.parse import urlencode
 from typing import Dict, List, Tuple, Union
-import requests
 from trader.connections.database import session
+from trader.connections.http import http_client
 from trader.data.initial.asset_type import (
     ASSET_TYPE_CRYPTOCURRENCY,
     ASSET_TYPE_STANDARD_CURRENCY,
@@ -55,7 +55,7 @@ def update_cryptocurrency_exchange_market_stats_from_coin_market_cap(cryptocurre
                 "category": "all",
             }
         )
-        response = requests.get(
+        response = http_client.get(
             f"https://api.coinmarketcap.com/data-api/v3/exchange/market-pairs/latest?{query_string}"
         )
         data = response.json()
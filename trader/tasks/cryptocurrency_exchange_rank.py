@@ -1,8 +1,8 @@
 import json
 from typing import Dict
 from bs4 import BeautifulSoup
-import requests
 from trader.connections.database import session
+from trader.connections.http import http_client
 from trader.data.initial.source import SOURCE_COIN_MARKET_CAP
 from trader.data.initial.source_type import SOURCE_TYPE_CRYPTOCURRENCY_EXCHANGE
 from trader.models.asset import Asset
@@ -23,7 +23,7 @@ from trader.utilities.functions.time import iso_time_string_to_datetime
 def update_cryptocurrency_exchange_ranks_from_coin_market_cap() -> None:
     coin_market_cap_id = SOURCE_COIN_MARKET_CAP.fetch_id()
     cryptocurrency_exchange_id = SOURCE_TYPE_CRYPTOCURRENCY_EXCHANGE.fetch_id()
-    response = requests.get("https://coinmarketcap.com/rankings/exchanges/")
+    response = http_client.get("https://coinmarketcap.com/rankings/exchanges/")
     soup = BeautifulSoup(response.text, "lxml")
     data = json.loads(soup.select("script#__NEXT_DATA__")[0].string)
     cryptocurrency_exchange_ranks = data["props"]["initialProps"]["pageProps"]["exchange"]
@@ -3,8 +3,8 @@ from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urlencode
 from bs4 import BeautifulSoup
-import requests
 from trader.connections.database import session
+from trader.connections.http import http_client
 from trader.data.initial.asset_type import ASSET_TYPE_CRYPTOCURRENCY, ASSET_TYPE_UNKNOWN_CURRENCY
 from trader.data.initial.source import SOURCE_COIN_MARKET_CAP
 from trader.models.asset import AssetTag, AssetXAssetTag, Asset
@@ -156,7 +156,7 @@ def insert_cryptocurrency_ranks(
 
 
 def retrieve_historical_snapshot_list_from_coin_market_cap() -> List[datetime]:
-    response = requests.get("https://coinmarketcap.com/historical/")
+    response = http_client.get("https://coinmarketcap.com/historical/")
     soup = BeautifulSoup(response.text, "lxml")
     table_wrapper = soup.select("div.cmc-bottom-margin-2x")[0]
     year_rows = table_wrapper.find_all("div", recursive=False)[:-1]
@@ -188,7 +188,9 @@ def retrieve_historical_cryptocurrency_ranks_from_coin_market_cap(
             "convert": "USD,USD",
         }
     )
-    response = requests.get(f"https://web-api.coinmarketcap.com/v1/cryptocurrency/listings/historical?{query_string}")
+    response = http_client.get(
+        f"https://web-api.coinmarketcap.com/v1/cryptocurrency/listings/historical?{query_string}"
+    )
     data = response.json()
     output: List[CryptocurrencyRankRecord] = []
     for currency in data["data"]:
@@ -240,7 +242,7 @@ def retrieve_current_cryptocurrency_ranks_from_coin_market_cap(limit: int) -> Li
             "audited": "false",
         }
     )
-    response = requests.get(f"https://api.coinmarketcap.com/data-api/v3/cryptocurrency/listing?{query_string}")
+    response = http_client.get(f"https://api.coinmarketcap.com/data-api/v3/cryptocurrency/listing?{query_string}")
     data = response.json()
     output: List[CryptocurrencyRankRecord] = []
     for currency in data["data"]["cryptoCurrencyList"]:
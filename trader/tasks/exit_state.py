@@ -0,0 +1,10 @@
+from trader.tasks import app
+from trader.utilities.exit_state import exit_state_store
+from trader.utilities.logging import logger
+
+
+@app.task
+def checkpoint_exit_states() -> None:
+    checkpointed = exit_state_store.checkpoint()
+    if checkpointed:
+        logger.debug("Checkpointed exit state for %s positions", checkpointed)
@@ -0,0 +1,8 @@
+from trader.connections.http import HTTP_CACHE_MODE_CACHE, http_client
+from trader.tasks import app
+
+
+@app.task
+def evict_expired_http_cache_entries() -> None:
+    if http_client.mode == HTTP_CACHE_MODE_CACHE:
+        http_client.evict_expired()
@@ -1,24 +1,37 @@
-from typing import Any, Callable, Dict, List, Sequence, Tuple
+from copy import deepcopy
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type
+import numpy as np
 import pandas as pd
 from sqlalchemy.sql import func
-from trader.connections.cache import cache
 from trader.connections.database import session
 from trader.data.initial.data_feed import DATA_FEED_ASSET_OHLCV
 from trader.data.initial.source import SOURCE_COIN_MARKET_CAP
 from trader.data.initial.timeframe import TIMEFRAME_ONE_DAY
-from trader.models.buy_signal import BuySignal
+from trader.indicators.registry import IndicatorRegistry
 from trader.models.entry_implementation import EntryImplementation, EntryImplementationRun
-from trader.models.exit_implementation import ExitImplementation, ExitImplementationRun
-from trader.models.position import Position
-from trader.models.strategy import StrategyVersionInstance
 from trader.models.timeframe import Timeframe
-from trader.models.user import User
+from trader.strategies.base import Strategy
 from trader.tasks import app
-from trader.tasks.buy_signal import handle_buy_signal
+from trader.tasks.buy_signal import handle_buy_signals
+from trader.utilities.constants import BUY_SIGNAL_DISPATCH_CHUNK_SIZE
+from trader.utilities.exit_state import exit_state_store, get_changed_exit_states, get_exit_implementation_state
 from trader.utilities.functions import get_asset_us_dollar_id
-from trader.utilities.functions.implementation import dataframe_is_valid, fetch_asset_ohlcv_dataframe
-from trader.utilities.functions.strategy import fetch_data_feeds_to_strategy_mapping
+from trader.utilities.functions.buy_signal import insert_buy_signals
+from trader.utilities.functions.exit_implementation import (
+    OpenPosition,
+    ensure_exit_implementations,
+    fetch_open_positions,
+    insert_exit_implementation_runs,
+    insert_sell_signals,
+)
+from trader.utilities.functions.implementation import (
+    dataframe_is_valid,
+    fetch_cached_asset_ohlcv_dataframe,
+    fetch_cached_asset_ohlcv_panel,
+)
 from trader.utilities.functions.time import TIMEFRAME_UNIT_TO_DELTA_FUNCTION
+from trader.utilities.logging import logger
+from trader.utilities.strategy_registry import RegisteredStrategyVersionInstance, strategy_registry
 
 
 def fetch_one_day_asset_ohlcv_dataframe(timeframe_id: int, base_asset_id: int) -> Tuple[pd.DataFrame, Dict[str, Any]]:
@@ -28,7 +41,150 @@ def fetch_one_day_asset_ohlcv_dataframe(timeframe_id: int, base_asset_id: int) -
         "asset_ohlcv_source_id": coin_market_cap_id,
         "asset_ohlcv_quote_asset_id": us_dollar_id,
     }
-    return fetch_asset_ohlcv_dataframe(coin_market_cap_id, base_asset_id, us_dollar_id, timeframe_id), extra_fields
+    return (
+        fetch_cached_asset_ohlcv_dataframe(coin_market_cap_id, base_asset_id, us_dollar_id, timeframe_id),
+        extra_fields,
+    )
+
+
+def fetch_one_day_asset_ohlcv_panel(
+    timeframe_id: int, base_asset_ids: Sequence[int]
+) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+    coin_market_cap_id = SOURCE_COIN_MARKET_CAP.fetch_id()
+    us_dollar_id = get_asset_us_dollar_id()
+    extra_fields = {
+        "asset_ohlcv_source_id": coin_market_cap_id,
+        "asset_ohlcv_quote_asset_id": us_dollar_id,
+    }
+    return (
+        fetch_cached_asset_ohlcv_panel(coin_market_cap_id, base_asset_ids, us_dollar_id, timeframe_id),
+        extra_fields,
+    )
+
+
+def run_entry_implementations(
+    timeframe: Timeframe,
+    base_asset_id: int,
+    dataframe: pd.DataFrame,
+    extra_fields: Dict[str, Any],
+    strategy_version_instances: List[Tuple[Type[Strategy], RegisteredStrategyVersionInstance]],
+) -> None:
+    indicator_registry = IndicatorRegistry(dataframe)
+    for strategy, strategy_version_instance in strategy_version_instances:
+        implementation = (
+            session.query(EntryImplementation)
+            .filter_by(
+                timeframe_id=timeframe.id,
+                base_asset_id=base_asset_id,
+                strategy_version_instance_id=strategy_version_instance.id,
+            )
+            .one_or_none()
+        )
+        if not implementation:
+            implementation = EntryImplementation(
+                timeframe_id=timeframe.id,
+                base_asset_id=base_asset_id,
+                strategy_version_instance_id=strategy_version_instance.id,
+            )
+            session.add(implementation)
+            session.flush()
+        last_date = (
+            session.query(func.max(EntryImplementationRun.end_date))
+            .select_from(EntryImplementationRun)
+            .filter_by(entry_implementation_id=implementation.id)
+            .one_or_none()
+        )
+        if last_date[0]:
+            start_date = last_date[0] + TIMEFRAME_UNIT_TO_DELTA_FUNCTION[timeframe.unit](timeframe.amount)
+            try:
+                start_index = dataframe.index.tolist().index(start_date)
+            except ValueError:
+                continue
+        else:
+            start_date = dataframe.index[0].to_pydatetime()
+            start_index = 0
+        implementation_run = EntryImplementationRun(
+            entry_implementation_id=implementation.id,
+            extra_fields=extra_fields,
+            start_date=start_date,
+            end_date=dataframe.index[-1].to_pydatetime(),
+        )
+        session.add(implementation_run)
+        session.flush()
+        strategy_object = strategy(base_asset_id, strategy_version_instance.arguments)
+        indicator_values, implementation.indicator_state = strategy_object.advance_indicators(
+            indicator_registry, start_index, implementation.indicator_state
+        )
+        buy_signal_strengths = strategy_object.get_buy_signal_strengths_from_indicators(
+            indicator_registry, indicator_values, start_index
+        )
+        signal_indices = np.flatnonzero(buy_signal_strengths)
+        buy_signal_ids = insert_buy_signals(
+            implementation_run.id,
+            [dataframe.index[start_index + i].to_pydatetime() for i in signal_indices],
+            buy_signal_strengths[signal_indices].tolist(),
+        )
+        session.commit()
+        for i in range(0, len(buy_signal_ids), BUY_SIGNAL_DISPATCH_CHUNK_SIZE):
+            handle_buy_signals.apply_async(args=(buy_signal_ids[i : i + BUY_SIGNAL_DISPATCH_CHUNK_SIZE],), priority=5)
+
+
+def run_exit_implementations(
+    timeframe: Timeframe,
+    base_asset_id: int,
+    dataframe: pd.DataFrame,
+    extra_fields: Dict[str, Any],
+    strategy_version_instances: List[Tuple[Type[Strategy], RegisteredStrategyVersionInstance]],
+) -> None:
+    positions = fetch_open_positions(base_asset_id)
+    if not positions or not strategy_version_instances:
+        return
+    exit_state_store.load_states(positions)
+    previous_datas = [deepcopy(p.data) for p in positions]
+    position_ids = [p.id for p in positions]
+    date_opens = dataframe.index
+    next_bar_delta = TIMEFRAME_UNIT_TO_DELTA_FUNCTION[timeframe.unit](timeframe.amount)
+    for strategy, strategy_version_instance in strategy_version_instances:
+        implementations = ensure_exit_implementations(timeframe.id, strategy_version_instance.id, position_ids)
+        start_indices = np.array(
+            [
+                date_opens.searchsorted(
+                    implementations[p.id][1] + next_bar_delta if implementations[p.id][1] else p.date_opened
+                )
+                for p in positions
+            ],
+            dtype="int64",
+        )
+        evaluated_positions = [i for i, start_index in enumerate(start_indices) if start_index < dataframe.shape[0]]
+        if not evaluated_positions:
+            continue
+        implementation_positions = [
+            OpenPosition(
+                p.id, p.bought_price, p.date_opened, get_exit_implementation_state(p, implementations[p.id][0])
+            )
+            for p in positions
+        ]
+        strategy_object = strategy(base_asset_id, strategy_version_instance.arguments, None)
+        sell_signal_strengths = strategy_object.get_position_sell_signal_strength_matrix(
+            strategy_object.enhance_data(dataframe), implementation_positions, start_indices
+        )
+        run_ids = insert_exit_implementation_runs(
+            [implementations[positions[i].id][0] for i in evaluated_positions],
+            [date_opens[start_indices[i]].to_pydatetime() for i in evaluated_positions],
+            date_opens[-1].to_pydatetime(),
+            extra_fields,
+        )
+        position_indices, signal_indices = np.nonzero(sell_signal_strengths)
+        insert_sell_signals(
+            [run_ids[implementations[positions[i].id][0]] for i in position_indices.tolist()],
+            [date_opens[i].to_pydatetime() for i in signal_indices.tolist()],
+            sell_signal_strengths[position_indices, signal_indices].tolist(),
+        )
+    exit_state_store.store_states(
+        get_changed_exit_states(positions, previous_datas),
+        {f for strategy, _ in strategy_version_instances for f in strategy.MAXIMUM_STATE_FIELDS},
+    )
+    session.commit()
 
 
 @app.task
@@ -55,88 +211,54 @@ def run_implementations(timeframe_id: int, base_asset_id: int, data_feed_ids: Se
     is_valid = dataframe_is_valid(dataframe, timeframe)
     if not is_valid:
         raise Exception("Invalid values available for buy signal dataframe")
-    for strategy in fetch_data_feeds_to_strategy_mapping(True)[data_feed_ids]:
-        strategy_version_id = int(cache.get(strategy.get_cache_key()).decode())
-        strategy_version_instances = (
-            session.query(StrategyVersionInstance).filter_by(strategy_version_id=strategy_version_id).all()
-        )
-        for strategy_version_instance in strategy_version_instances:
-            enabled_strategy_version_instance = strategy_version_instance.enabled_strategy_version_instance
-            if not enabled_strategy_version_instance or not enabled_strategy_version_instance.history[0].is_enabled:
-                continue
-            implementation = session.query(EntryImplementation).filter_by(
-                timeframe_id=timeframe_id,
-                base_asset_id=base_asset_id,
-                strategy_version_instance_id=strategy_version_instance.id,
-            )
-            if not implementation:
-                implementation = EntryImplementation(
-                    timeframe_id=timeframe_id,
-                    base_asset_id=base_asset_id,
-                    strategy_version_instance_id=strategy_version_instance.id,
-                )
-                session.add(implementation)
-                session.flush()
-            last_date = (
-                session.query(func.max(EntryImplementationRun.end_date))
-                .select_from(EntryImplementationRun)
-                .filter_by(entry_implementation_id=implementation.id)
-                .one_or_none()
-            )
-            if last_date[0]:
-                start_date = last_date[0] + TIMEFRAME_UNIT_TO_DELTA_FUNCTION[timeframe.unit](timeframe.amount)
-                try:
-                    start_index = dataframe.index.tolist().index(start_date)
-                except ValueError:
-                    continue
-            else:
-                start_date = dataframe.index[0].to_pydatetime()
-                start_index = 0
-            implementation_run = EntryImplementationRun(
-                entry_implementation_id=implementation.id,
-                extra_fields=extra_fields,
-                start_date=start_date,
-                end_date=dataframe.index[-1].to_pydatetime(),
-            )
-            session.add(implementation_run)
-            session.flush()
-            strategy_object = strategy(base_asset_id, strategy_version_instance.arguments)
-            strategy_dataframe = strategy_object.enhance_data(dataframe)
-            for i in range(start_index, strategy_dataframe.shape[0]):
-                buy_signal_strength = strategy_object.get_buy_signal_strength(strategy_dataframe, i)
-                if buy_signal_strength:
-                    buy_signal = BuySignal(
-                        entry_implementation_run_id=implementation_run.id,
-                        signal_date=dataframe.index[i],
-                        strength=buy_signal_strength,
-                    )
-                    session.add(buy_signal)
-                    session.flush()
-                    handle_buy_signal.apply_async(args=(buy_signal.id,), priority=5)
-            session.commit()
-    users = session.query(User).filter_by(is_live=True).all()
-    for user in users:
-        positions = session.query(Position).filter_by(user_id=user.id, asset_id=base_asset_id, date_closed=None).all()
-        for position in positions:
-            for strategy in fetch_data_feeds_to_strategy_mapping(False)[data_feed_ids]:
-                strategy_version_id = int(cache.get(strategy.get_cache_key()).decode())
-                strategy_version_instances = (
-                    session.query(StrategyVersionInstance).filter_by(strategy_version_id=strategy_version_id).all()
-                )
-                for strategy_version_instance in strategy_version_instances:
-                    enabled_strategy_version_instance = strategy_version_instance.enabled_strategy_version_instance
-                    if not enabled_strategy_version_instance or enabled_strategy_version_instance.is_disabled:
-                        continue
-                    implementation = session.query(ExitImplementation).filter_by(
-                        timeframe_id=timeframe_id,
-                        position_id=position.id,
-                        strategy_version_instance_id=strategy_version_instance.id,
-                    )
-                    if not implementation:
-                        implementation = ExitImplementation(
-                            timeframe_id=timeframe_id,
-                            position_id=position.id,
-                            strategy_version_instance_id=strategy_version_instance.id,
-                        )
-                        session.add(implementation)
-                        session.flush()
+    entry_strategy_version_instances = strategy_registry.get_enabled_strategy_version_instances(
+        timeframe_id, True, data_feed_ids
+    )
+    exit_strategy_version_instances = strategy_registry.get_enabled_strategy_version_instances(
+        timeframe_id, False, data_feed_ids
+    )
+    run_entry_implementations(timeframe, base_asset_id, dataframe, extra_fields, entry_strategy_version_instances)
+    run_exit_implementations(timeframe, base_asset_id, dataframe, extra_fields, exit_strategy_version_instances)
+    session.commit()
+
+
+@app.task
+def run_implementations_batch(timeframe_id: int, base_asset_ids: Sequence[int], data_feed_ids: Sequence[int]) -> None:
+    base_asset_ids = tuple(base_asset_ids)
+    data_feed_ids = tuple(data_feed_ids)
+    timeframe_one_day_id = TIMEFRAME_ONE_DAY.fetch_id()
+    data_feed_asset_ohlcv_id = DATA_FEED_ASSET_OHLCV.fetch_id()
+    timeframe_data_feed_to_panel_function_mapping: Dict[
+        Tuple[int, int], Callable[[int, Sequence[int]], Tuple[pd.DataFrame, Dict[str, Any]]]
+    ] = {
+        (timeframe_one_day_id, data_feed_asset_ohlcv_id): fetch_one_day_asset_ohlcv_panel,
+    }
+    panels: List[pd.DataFrame] = []
+    extra_fields: Dict[str, Any] = {}
+    for data_feed_id in data_feed_ids:
+        panel_function = timeframe_data_feed_to_panel_function_mapping[(timeframe_id, data_feed_id)]
+        data_feed_panel, data_feed_extra_fields = panel_function(timeframe_id, base_asset_ids)
+        panels.append(data_feed_panel)
+        extra_fields.update(data_feed_extra_fields)
+    panel = panels[0]
+    for join_panel in panels[1:]:
+        panel = panel.join(join_panel, how="inner")
+    timeframe = session.query(Timeframe).get(timeframe_id)
+    entry_strategy_version_instances = strategy_registry.get_enabled_strategy_version_instances(
+        timeframe_id, True, data_feed_ids
+    )
+    exit_strategy_version_instances = strategy_registry.get_enabled_strategy_version_instances(
+        timeframe_id, False, data_feed_ids
+    )
+    panel_base_asset_ids = set(panel.index.get_level_values("base_asset_id").unique())
+    for base_asset_id in base_asset_ids:
+        if base_asset_id not in panel_base_asset_ids:
+            logger.warning("No values available for base asset %s buy signal dataframe", base_asset_id)
+            continue
+        dataframe = panel.xs(base_asset_id, level="base_asset_id")
+        if not dataframe_is_valid(dataframe, timeframe):
+            logger.warning("Invalid values available for base asset %s buy signal dataframe", base_asset_id)
+            continue
+        run_entry_implementations(timeframe, base_asset_id, dataframe, extra_fields, entry_strategy_version_instances)
+        run_exit_implementations(timeframe, base_asset_id, dataframe, extra_fields, exit_strategy_version_instances)
+    session.commit()
@@ -1,7 +1,7 @@
 from typing import Dict
 from bs4 import BeautifulSoup
-import requests
 from trader.connections.database import session
+from trader.connections.http import http_client
 from trader.data.initial.asset_type import ASSET_TYPE_STANDARD_CURRENCY, ASSET_TYPE_UNKNOWN_CURRENCY
 from trader.data.initial.source import SOURCE_ISO
 from trader.models.asset import Asset
@@ -15,7 +15,7 @@ def update_standard_currencies_from_iso() -> None:
     iso_id = SOURCE_ISO.fetch_id()
     standard_currency_id = ASSET_TYPE_STANDARD_CURRENCY.fetch_id()
     unknown_currency_id = ASSET_TYPE_UNKNOWN_CURRENCY.fetch_id()
-    response = requests.get("https://en.wikipedia.org/wiki/ISO_4217")
+    response = http_client.get("https://en.wikipedia.org/wiki/ISO_4217")
     soup = BeautifulSoup(response.text, "lxml")
     table_h2 = soup.select("span#Active_codes")[0]
     table_body_rows = table_h2.parent.next_sibling.next_sibling.next_sibling.next_sibling.find_all("tr")[1:]
@@ -13,4 +13,23 @@ DATA_FEED_MONITOR_QUEUE_KEY = "data_feed_monitor_queue"
 DATA_FEED_MESSAGE_DELIMITER = ":"
 
 
+ASSET_OHLCV_ARRAY_CACHE_KEY_PREFIX = "asset_ohlcv_array"
+ASSET_OHLCV_ARRAY_CACHE_RECENCY_KEY = "asset_ohlcv_array_recency"
+ASSET_OHLCV_ARRAY_CACHE_SIZE_KEY = "asset_ohlcv_array_size"
+ASSET_OHLCV_ARRAY_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+BUY_SIGNAL_DISPATCH_CHUNK_SIZE = 500
+
+
+STRATEGY_REGISTRY_INVALIDATION_CHANNEL = "strategy_registry_invalidation"
+
+
+EXIT_STATE_CACHE_KEY_PREFIX = "exit_state"
+EXIT_STATE_DIRTY_KEY = "exit_state_dirty"
+EXIT_STATE_FIELD_DELIMITER = ":"
+EXIT_STATE_CACHE_TTL_SECONDS = 60 * 60 * 24 * 30
+EXIT_STATE_CHECKPOINT_BATCH_SIZE = 1000
+
+
 DATA_DEFAULT_FLOOR = datetime(2017, 1, 1)
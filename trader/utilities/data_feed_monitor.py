@@ -1,9 +1,9 @@
 from ast import literal_eval
 from collections import defaultdict
 from time import sleep
-from typing import DefaultDict, Dict, Set, Tuple
+from typing import DefaultDict, Dict, List, Set, Tuple
 from trader.connections.cache import cache
-from trader.tasks.implementation import run_implementations
+from trader.tasks.implementation import run_implementations_batch
 from trader.utilities.constants import DATA_FEED_MESSAGE_DELIMITER, DATA_FEED_MONITOR_QUEUE_KEY
 from trader.utilities.functions.strategy import fetch_data_feeds_to_strategy_mapping
 
@@ -11,6 +11,8 @@ from trader.utilities.functions.strategy import fetch_data_feeds_to_strategy_map
 class DataFeedMonitor:
     IDLE_SLEEP_SECONDS = 0.5
     CACHE_STATE_KEY = "data_feed_monitor_state"
+    CACHE_READY_BASE_ASSETS_KEY = "data_feed_monitor_ready_base_assets"
+    MAX_BATCH_SIZE = 100
 
     def __init__(self):
         self.data_feed_to_entry_strategy_mapping = fetch_data_feeds_to_strategy_mapping(True)
@@ -20,6 +22,7 @@ class DataFeedMonitor:
         )
         self.data_feed_to_combinations_mapping = self.generate_data_feed_to_combinations_mapping()
         self.data_feed_load_status = self.generate_data_feed_load_status()
+        self.ready_base_assets = self.generate_ready_base_assets()
 
     def generate_data_feed_to_combinations_mapping(self) -> DefaultDict[int, Set[Tuple[int, ...]]]:
         output: DefaultDict[int, Set[Tuple[int, ...]]] = defaultdict(set)
@@ -38,22 +41,53 @@ class DataFeedMonitor:
             return literal_eval(saved_state.decode())
         return {}
 
+    @classmethod
+    def generate_ready_base_assets(cls) -> DefaultDict[Tuple[int, Tuple[int, ...]], List[int]]:
+        output: DefaultDict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+        saved_ready_base_assets = cache.get(cls.CACHE_READY_BASE_ASSETS_KEY)
+        if saved_ready_base_assets:
+            output.update(literal_eval(saved_ready_base_assets.decode()))
+        return output
+
+    def save_state(self) -> None:
+        pipeline = cache.pipeline()
+        pipeline.set(self.CACHE_STATE_KEY, str(self.data_feed_load_status))
+        pipeline.set(self.CACHE_READY_BASE_ASSETS_KEY, str(dict(self.ready_base_assets)))
+        pipeline.execute()
+
+    def dispatch_batch(self, timeframe_id: int, target: Tuple[int, ...]) -> None:
+        base_asset_ids = self.ready_base_assets.pop((timeframe_id, target))
+        run_implementations_batch.apply_async(args=(timeframe_id, base_asset_ids, target), priority=5)
+
+    def dispatch_batches(self) -> None:
+        if not self.ready_base_assets:
+            return
+        for timeframe_id, target in list(self.ready_base_assets.keys()):
+            self.dispatch_batch(timeframe_id, target)
+        self.save_state()
+
+    def process_record(self, record: bytes) -> None:
+        timeframe_id, base_asset_id, data_feed_id = map(int, record.decode().split(DATA_FEED_MESSAGE_DELIMITER))
+        if timeframe_id not in self.data_feed_load_status:
+            self.data_feed_load_status[timeframe_id] = {}
+        if base_asset_id not in self.data_feed_load_status[timeframe_id]:
+            self.data_feed_load_status[timeframe_id][base_asset_id] = self.data_feed_load_combinations()
+        combinations = self.data_feed_load_status[timeframe_id][base_asset_id]
+        targets = self.data_feed_to_combinations_mapping[data_feed_id]
+        for target in targets:
+            combinations[target].remove(data_feed_id)
+            if len(combinations[target]) == 0:
+                self.ready_base_assets[(timeframe_id, target)].append(base_asset_id)
+                if len(self.ready_base_assets[(timeframe_id, target)]) >= self.MAX_BATCH_SIZE:
+                    self.dispatch_batch(timeframe_id, target)
+                combinations[target] = set(target)
+        self.save_state()
+
     def run(self) -> None:
         while True:
             record = cache.lpop(DATA_FEED_MONITOR_QUEUE_KEY)
             if not record:
+                self.dispatch_batches()
                 sleep(self.IDLE_SLEEP_SECONDS)
                 continue
-            timeframe_id, base_asset_id, data_feed_id = map(int, record.decode().split(DATA_FEED_MESSAGE_DELIMITER))
-            if timeframe_id not in self.data_feed_load_status:
-                self.data_feed_load_status[timeframe_id] = {}
-            if base_asset_id not in self.data_feed_load_status[timeframe_id]:
-                self.data_feed_load_status[timeframe_id][base_asset_id] = self.data_feed_load_combinations()
-            combinations = self.data_feed_load_status[timeframe_id][base_asset_id]
-            targets = self.data_feed_to_combinations_mapping[data_feed_id]
-            for target in targets:
-                combinations[target].remove(data_feed_id)
-                if len(combinations[target]) == 0:
-                    run_implementations.apply_async(args=(timeframe_id, base_asset_id, target), priority=5)
-                    combinations[target] = set(target)
-            cache.set(DataFeedMonitor.CACHE_STATE_KEY, str(self.data_feed_load_status))
+            self.process_record(record)
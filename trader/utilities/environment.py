@@ -17,3 +17,15 @@ POSTGRES_DATABASE = os.environ["POSTGRES_DATABASE"]
 
 REMOTE_WEBDRIVER_HOST = os.environ["REMOTE_WEBDRIVER_HOST"]
 REMOTE_WEBDRIVER_PORT = os.environ["REMOTE_WEBDRIVER_PORT"]
+
+HTTP_CACHE_DIRECTORY = os.environ.get("HTTP_CACHE_DIRECTORY", os.path.join(os.getcwd(), ".http_cache"))
+HTTP_CACHE_MODE = os.environ.get("HTTP_CACHE_MODE", "off")
+HTTP_CACHE_TTL_SECONDS = int(os.environ.get("HTTP_CACHE_TTL_SECONDS", 60 * 60 * 6))
+HTTP_POOL_CONNECTIONS = int(os.environ.get("HTTP_POOL_CONNECTIONS", 10))
+HTTP_POOL_MAXSIZE = int(os.environ.get("HTTP_POOL_MAXSIZE", 10))
+HTTP_RETRY_TOTAL = int(os.environ.get("HTTP_RETRY_TOTAL", 5))
+HTTP_RETRY_BACKOFF_FACTOR = float(os.environ.get("HTTP_RETRY_BACKOFF_FACTOR", 0.5))
+HTTP_RETRY_BACKOFF_MAX_SECONDS = float(os.environ.get("HTTP_RETRY_BACKOFF_MAX_SECONDS", 60))
+HTTP_TIMEOUT_SECONDS = float(os.environ.get("HTTP_TIMEOUT_SECONDS", 30))
+
+EXIT_STATE_STORE = os.environ.get("EXIT_STATE_STORE", "redis")
@@ -0,0 +1,154 @@
+from abc import ABC, abstractmethod
+import json
+from typing import Any, Collection, Dict, Sequence
+from trader.connections.cache import cache
+from trader.connections.database import session
+from trader.utilities.constants import (
+    EXIT_STATE_CACHE_KEY_PREFIX,
+    EXIT_STATE_CACHE_TTL_SECONDS,
+    EXIT_STATE_CHECKPOINT_BATCH_SIZE,
+    EXIT_STATE_DIRTY_KEY,
+    EXIT_STATE_FIELD_DELIMITER,
+)
+from trader.utilities.environment import EXIT_STATE_STORE
+from trader.utilities.functions.exit_implementation import OpenPosition, update_position_data
+
+
+EXIT_STATE_STORE_REDIS = "redis"
+EXIT_STATE_STORE_POSTGRES = "postgres"
+EXIT_STATE_STORES = (EXIT_STATE_STORE_REDIS, EXIT_STATE_STORE_POSTGRES)
+
+
+STORE_EXIT_STATE_SCRIPT = """
+for i = 3, #ARGV, 3 do
+    local current = redis.call("HGET", KEYS[1], ARGV[i])
+    if ARGV[i + 2] == "0" or not current or tonumber(ARGV[i + 1]) > tonumber(current) then
+        redis.call("HSET", KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+end
+redis.call("EXPIRE", KEYS[1], ARGV[1])
+redis.call("SADD", KEYS[2], ARGV[2])
+"""
+
+
+def get_exit_state_cache_key(position_id: int) -> str:
+    return f"{EXIT_STATE_CACHE_KEY_PREFIX}:{position_id}"
+
+
+def get_exit_implementation_state(position: OpenPosition, exit_implementation_id: int) -> Dict[str, Any]:
+    return position.data.setdefault(str(exit_implementation_id), {})
+
+
+def get_changed_exit_states(
+    positions: Sequence[OpenPosition], previous_datas: Sequence[Dict[str, Any]]
+) -> Dict[int, Dict[str, Dict[str, Any]]]:
+    output: Dict[int, Dict[str, Dict[str, Any]]] = {}
+    for position, previous_data in zip(positions, previous_datas):
+        states: Dict[str, Dict[str, Any]] = {}
+        for exit_implementation_key, state in position.data.items():
+            if not isinstance(state, dict):
+                continue
+            previous_state = previous_data.get(exit_implementation_key)
+            if not isinstance(previous_state, dict):
+                previous_state = {}
+            changed_state = {k: v for k, v in state.items() if k not in previous_state or previous_state[k] != v}
+            if changed_state:
+                states[exit_implementation_key] = changed_state
+        if states:
+            output[position.id] = states
+    return output
+
+
+class ExitStateStore(ABC):
+    @abstractmethod
+    def load_states(self, positions: Sequence[OpenPosition]) -> None:
+        ...
+
+    @abstractmethod
+    def store_states(self, states: Dict[int, Dict[str, Dict[str, Any]]], maximum_fields: Collection[str] = ()) -> None:
+        ...
+
+    @abstractmethod
+    def checkpoint(self) -> int:
+        ...
+
+
+class PostgresExitStateStore(ExitStateStore):
+    def load_states(self, positions: Sequence[OpenPosition]) -> None:
+        pass
+
+    def store_states(self, states: Dict[int, Dict[str, Dict[str, Any]]], maximum_fields: Collection[str] = ()) -> None:
+        update_position_data(states)
+
+    def checkpoint(self) -> int:
+        return 0
+
+
+class RedisExitStateStore(ExitStateStore):
+    def __init__(
+        self, ttl_seconds: int = EXIT_STATE_CACHE_TTL_SECONDS, batch_size: int = EXIT_STATE_CHECKPOINT_BATCH_SIZE
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.batch_size = batch_size
+        self.store_script = cache.register_script(STORE_EXIT_STATE_SCRIPT)
+
+    @staticmethod
+    def fetch_states(position_ids: Sequence[int]) -> Dict[int, Dict[str, Dict[str, Any]]]:
+        pipeline = cache.pipeline(transaction=False)
+        for position_id in position_ids:
+            pipeline.hgetall(get_exit_state_cache_key(position_id))
+        output: Dict[int, Dict[str, Dict[str, Any]]] = {}
+        for position_id, fields in zip(position_ids, pipeline.execute()):
+            for field, value in fields.items():
+                exit_implementation_key, key = field.decode("utf-8").split(EXIT_STATE_FIELD_DELIMITER, 1)
+                output.setdefault(position_id, {}).setdefault(exit_implementation_key, {})[key] = json.loads(value)
+        return output
+
+    def load_states(self, positions: Sequence[OpenPosition]) -> None:
+        states = self.fetch_states([p.id for p in positions])
+        for position in positions:
+            for exit_implementation_key, state in states.get(position.id, {}).items():
+                if not isinstance(position.data.get(exit_implementation_key), dict):
+                    position.data[exit_implementation_key] = {}
+                position.data[exit_implementation_key].update(state)
+
+    def store_states(self, states: Dict[int, Dict[str, Dict[str, Any]]], maximum_fields: Collection[str] = ()) -> None:
+        if not states:
+            return
+        pipeline = cache.pipeline(transaction=False)
+        for position_id, state in states.items():
+            arguments = [self.ttl_seconds, position_id]
+            for exit_implementation_key, exit_implementation_state in state.items():
+                for k, v in exit_implementation_state.items():
+                    field = f"{exit_implementation_key}{EXIT_STATE_FIELD_DELIMITER}{k}"
+                    arguments.extend((field, json.dumps(v), 1 if k in maximum_fields else 0))
+            self.store_script(
+                keys=[get_exit_state_cache_key(position_id), EXIT_STATE_DIRTY_KEY], args=arguments, client=pipeline
+            )
+        pipeline.execute()
+
+    def checkpoint(self) -> int:
+        checkpointed = 0
+        while True:
+            position_ids = [int(i) for i in cache.spop(EXIT_STATE_DIRTY_KEY, self.batch_size) or []]
+            if not position_ids:
+                return checkpointed
+            try:
+                update_position_data(self.fetch_states(position_ids))
+                session.commit()
+            except Exception:
+                session.rollback()
+                cache.sadd(EXIT_STATE_DIRTY_KEY, *position_ids)
+                raise
+            checkpointed += len(position_ids)
+
+
+def get_exit_state_store(store: str) -> ExitStateStore:
+    if store == EXIT_STATE_STORE_REDIS:
+        return RedisExitStateStore()
+    if store == EXIT_STATE_STORE_POSTGRES:
+        return PostgresExitStateStore()
+    raise ValueError(f"Exit state store must be one of {', '.join(EXIT_STATE_STORES)}")
+
+
+exit_state_store = get_exit_state_store(EXIT_STATE_STORE)
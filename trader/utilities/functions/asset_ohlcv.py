@@ -0,0 +1,139 @@
+from datetime import datetime
+from typing import List, Optional, Tuple, Union
+import numpy as np
+import pandas as pd
+from trader.data.initial.timeframe import TimeframeData
+from trader.models.timeframe import Timeframe
+
+
+NANOSECONDS_PER_SECOND = 1000 * 1000 * 1000
+SECONDS_PER_DAY = 60 * 60 * 24
+
+
+def timeframe_is_derivable(
+    source_timeframe: Union[Timeframe, TimeframeData], target_timeframe: Union[Timeframe, TimeframeData]
+) -> bool:
+    if source_timeframe.seconds_length is None:
+        return False
+    if target_timeframe.seconds_length is None:
+        return target_timeframe.unit == "M" and SECONDS_PER_DAY % source_timeframe.seconds_length == 0
+    return (
+        target_timeframe.seconds_length > source_timeframe.seconds_length
+        and target_timeframe.seconds_length % source_timeframe.seconds_length == 0
+    )
+
+
+def get_extreme_dates(dataframe: pd.DataFrame, column: str, date_opens: np.ndarray) -> np.ndarray:
+    if column not in dataframe:
+        return date_opens
+    values = pd.to_datetime(dataframe[column], utc=True).dt.tz_localize(None).to_numpy(dtype="datetime64[ns]")
+    return np.where(np.isnat(values), date_opens, values)
+
+
+def resample_asset_ohlcv_dataframe(
+    dataframe: pd.DataFrame,
+    source_timeframe: Union[Timeframe, TimeframeData],
+    target_timeframe: Union[Timeframe, TimeframeData],
+    complete_only: bool = True,
+) -> pd.DataFrame:
+    if not timeframe_is_derivable(source_timeframe, target_timeframe):
+        raise ValueError("Target timeframe cannot be derived from the source timeframe")
+    columns = ["open", "high", "low", "close", "volume", "date_high", "date_low"]
+    if dataframe.shape[0] == 0:
+        return pd.DataFrame(columns=columns, index=pd.DatetimeIndex([], tz="UTC"))
+    dataframe = dataframe.sort_index()
+    date_opens = pd.DatetimeIndex(dataframe.index).tz_convert("UTC").tz_localize(None).to_numpy(dtype="datetime64[ns]")
+    source_width = source_timeframe.seconds_length * NANOSECONDS_PER_SECOND
+    if target_timeframe.seconds_length is None:
+        months = date_opens.astype("datetime64[M]").astype(np.int64)
+        months -= months % target_timeframe.amount
+        buckets = months.astype("datetime64[M]").astype("datetime64[ns]").astype(np.int64)
+        bucket_ends = (
+            (months + target_timeframe.amount).astype("datetime64[M]").astype("datetime64[ns]").astype(np.int64)
+        )
+    else:
+        target_width = target_timeframe.seconds_length * NANOSECONDS_PER_SECOND
+        nanoseconds = date_opens.astype(np.int64)
+        buckets = nanoseconds - nanoseconds % target_width
+        bucket_ends = buckets + target_width
+    count = buckets.shape[0]
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = np.concatenate((starts[1:], [count])) - 1
+    bar_counts = np.diff(np.concatenate((starts, [count])))
+    expected_bar_counts = (bucket_ends[starts] - buckets[starts]) // source_width
+    opens = dataframe["open"].to_numpy(dtype=np.float64)
+    highs = dataframe["high"].to_numpy(dtype=np.float64)
+    lows = dataframe["low"].to_numpy(dtype=np.float64)
+    closes = dataframe["close"].to_numpy(dtype=np.float64)
+    volumes = dataframe["volume"].to_numpy(dtype=np.float64)
+    segments = np.repeat(np.arange(starts.shape[0]), bar_counts)
+    high_indexes = np.lexsort((-highs, segments))[starts]
+    low_indexes = np.lexsort((lows, segments))[starts]
+    date_highs = get_extreme_dates(dataframe, "date_high", date_opens)
+    date_lows = get_extreme_dates(dataframe, "date_low", date_opens)
+    output = pd.DataFrame(
+        {
+            "open": opens[starts],
+            "high": np.maximum.reduceat(highs, starts),
+            "low": np.minimum.reduceat(lows, starts),
+            "close": closes[ends],
+            "volume": np.add.reduceat(volumes, starts),
+            "date_high": pd.DatetimeIndex(date_highs[high_indexes]).tz_localize("UTC"),
+            "date_low": pd.DatetimeIndex(date_lows[low_indexes]).tz_localize("UTC"),
+        },
+        index=pd.to_datetime(buckets[starts]).tz_localize("UTC"),
+    )
+    if complete_only:
+        output = output[bar_counts == expected_bar_counts]
+    return output
+
+
+def datetime_to_numpy_position(datetime_val: datetime, unit: str) -> int:
+    return int(
+        np.datetime64(pd.Timestamp(datetime_val).tz_convert("UTC").tz_localize(None))
+        .astype(f"datetime64[{unit}]")
+        .astype(np.int64)
+    )
+
+
+def numpy_position_to_datetime(position: int, unit: str) -> datetime:
+    return pd.Timestamp(np.datetime64(int(position), unit)).tz_localize("UTC").to_pydatetime()
+
+
+def find_asset_ohlcv_gaps(
+    date_opens: pd.DatetimeIndex,
+    timeframe: Union[Timeframe, TimeframeData],
+    from_inclusive: Optional[datetime] = None,
+    to_exclusive: Optional[datetime] = None,
+    coalesce_bars: int = 0,
+) -> List[Tuple[datetime, datetime]]:
+    if date_opens.shape[0] == 0:
+        if from_inclusive and to_exclusive and from_inclusive < to_exclusive:
+            return [(from_inclusive, to_exclusive)]
+        return []
+    date_opens = pd.DatetimeIndex(date_opens).tz_convert("UTC").tz_localize(None)
+    if timeframe.seconds_length is None:
+        if timeframe.unit != "M":
+            raise ValueError("Timeframe must have a fixed length or a unit of months")
+        unit = "M"
+        width = timeframe.amount
+    else:
+        unit = "ns"
+        width = timeframe.seconds_length * NANOSECONDS_PER_SECOND
+    positions = np.unique(date_opens.to_numpy(dtype="datetime64[ns]").astype(f"datetime64[{unit}]").astype(np.int64))
+    if from_inclusive:
+        positions = np.concatenate(([datetime_to_numpy_position(from_inclusive, unit) - width], positions))
+    if to_exclusive:
+        positions = np.concatenate((positions, [datetime_to_numpy_position(to_exclusive, unit)]))
+    missing = np.flatnonzero(np.diff(positions) > width)
+    gap_starts = positions[missing] + width
+    gap_ends = positions[missing + 1]
+    if gap_starts.shape[0] > 1 and coalesce_bars > 0:
+        separate = (gap_starts[1:] - gap_ends[:-1]) > coalesce_bars * width
+        first_indexes = np.flatnonzero(np.concatenate(([True], separate)))
+        last_indexes = np.concatenate((first_indexes[1:], [gap_starts.shape[0]])) - 1
+        gap_starts = gap_starts[first_indexes]
+        gap_ends = gap_ends[last_indexes]
+    return [
+        (numpy_position_to_datetime(s, unit), numpy_position_to_datetime(e, unit)) for s, e in zip(gap_starts, gap_ends)
+    ]
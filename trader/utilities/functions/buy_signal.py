@@ -0,0 +1,37 @@
+from datetime import datetime
+from textwrap import dedent
+from typing import List, Sequence
+from trader.connections.database import session
+from trader.models.buy_signal import BuySignal
+
+
+INSERT_BUY_SIGNALS_SQL = dedent(
+    """
+    INSERT INTO public.{buy_signal_table} (entry_implementation_run_id, signal_date, strength)
+    SELECT
+        %(entry_implementation_run_id)s
+        ,s.signal_date
+        ,s.strength
+    FROM UNNEST(%(signal_dates)s::TIMESTAMPTZ[], %(strengths)s::NUMERIC[]) AS s (signal_date, strength)
+    ON CONFLICT (entry_implementation_run_id, signal_date) DO NOTHING
+    RETURNING id
+    """.format(buy_signal_table=BuySignal.__tablename__)
+).strip()
+
+
+def insert_buy_signals(
+    entry_implementation_run_id: int, signal_dates: Sequence[datetime], strengths: Sequence[float]
+) -> List[int]:
+    if not signal_dates:
+        return []
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_BUY_SIGNALS_SQL,
+            {
+                "entry_implementation_run_id": entry_implementation_run_id,
+                "signal_dates": list(signal_dates),
+                "strengths": list(strengths),
+            },
+        )
+        return [r[0] for r in cursor.fetchall()]
@@ -1,26 +1,50 @@
-from typing import Set, Sequence
+from sqlalchemy.sql import Subquery
 from trader.connections.database import session
-from trader.models.cryptocurrency_exchange import CryptocurrencyExchange
 from trader.models.cryptocurrency_exchange_market import CryptocurrencyExchangeMarket
-from trader.models.enabled_quote_asset import EnabledQuoteAsset
+from trader.models.enabled_cryptocurrency_exchange import (
+    EnabledCryptocurrencyExchange,
+    EnabledCryptocurrencyExchangeHistory,
+)
+from trader.models.enabled_quote_asset import EnabledQuoteAsset, EnabledQuoteAssetHistory
 
 
-def fetch_enabled_base_asset_ids_for_cryptocurrency_exchanges(
-    cryptocurrency_exchanges: Sequence[CryptocurrencyExchange],
-) -> Set[int]:
-    enabled_quote_assets = session.query(EnabledQuoteAsset).all()
-    enabled_quote_asset_ids = [c.asset.id for c in enabled_quote_assets if c.history[0].is_enabled]
-    base_asset_ids: Set[int] = set()
-    for cryptocurrency_exchange in cryptocurrency_exchanges:
-        markets = (
-            session.query(CryptocurrencyExchangeMarket)
-            .filter(
-                CryptocurrencyExchangeMarket.cryptocurrency_exchange_id == cryptocurrency_exchange.id,
-                CryptocurrencyExchangeMarket.quote_asset_id.in_(enabled_quote_asset_ids),
-                CryptocurrencyExchangeMarket.is_active.is_(True),
-            )
-            .all()
+def fetch_enabled_base_asset_ids_subquery() -> Subquery:
+    latest_exchange_history = (
+        session.query(
+            EnabledCryptocurrencyExchangeHistory.enabled_cryptocurrency_exchange_id,
+            EnabledCryptocurrencyExchangeHistory.is_enabled,
         )
-        for market in markets:
-            base_asset_ids.add(market.base_asset_id)
-    return base_asset_ids
+        .distinct(EnabledCryptocurrencyExchangeHistory.enabled_cryptocurrency_exchange_id)
+        .order_by(
+            EnabledCryptocurrencyExchangeHistory.enabled_cryptocurrency_exchange_id,
+            EnabledCryptocurrencyExchangeHistory.date_created.desc(),
+        )
+        .subquery()
+    )
+    latest_quote_asset_history = (
+        session.query(EnabledQuoteAssetHistory.enabled_quote_asset_id, EnabledQuoteAssetHistory.is_enabled)
+        .distinct(EnabledQuoteAssetHistory.enabled_quote_asset_id)
+        .order_by(EnabledQuoteAssetHistory.enabled_quote_asset_id, EnabledQuoteAssetHistory.date_created.desc())
+        .subquery()
+    )
+    return (
+        session.query(CryptocurrencyExchangeMarket.base_asset_id)
+        .join(
+            EnabledCryptocurrencyExchange,
+            EnabledCryptocurrencyExchange.cryptocurrency_exchange_id
+            == CryptocurrencyExchangeMarket.cryptocurrency_exchange_id,
+        )
+        .join(
+            latest_exchange_history,
+            latest_exchange_history.c.enabled_cryptocurrency_exchange_id == EnabledCryptocurrencyExchange.id,
+        )
+        .join(EnabledQuoteAsset, EnabledQuoteAsset.asset_id == CryptocurrencyExchangeMarket.quote_asset_id)
+        .join(latest_quote_asset_history, latest_quote_asset_history.c.enabled_quote_asset_id == EnabledQuoteAsset.id)
+        .filter(
+            CryptocurrencyExchangeMarket.is_active.is_(True),
+            latest_exchange_history.c.is_enabled.is_(True),
+            latest_quote_asset_history.c.is_enabled.is_(True),
+        )
+        .distinct()
+        .subquery()
+    )
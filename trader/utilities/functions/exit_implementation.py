@@ -0,0 +1,209 @@
+from dataclasses import dataclass
+from datetime import datetime
+import json
+from textwrap import dedent
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from trader.connections.database import session
+from trader.models.exit_implementation import ExitImplementation, ExitImplementationRun
+from trader.models.position import Position, PositionPurchase
+from trader.models.sell_signal import SellSignal
+from trader.models.user import User
+
+
+@dataclass
+class OpenPosition:
+    id: int
+    bought_price: float
+    date_opened: datetime
+    data: Dict[str, Any]
+
+
+SELECT_OPEN_POSITIONS_SQL = dedent(
+    """
+    SELECT
+        p.id
+        ,(SUM(pp.price * pp.size) / SUM(pp.size))::FLOAT8
+        ,MIN(pp.purchase_date)
+        ,p.data
+    FROM public.{position_table} p
+        INNER JOIN public.{user_table} u ON
+            p.user_id = u.id
+        INNER JOIN public.{position_purchase_table} pp ON
+            p.id = pp.position_id
+    WHERE
+        p.asset_id = %(base_asset_id)s
+        AND p.date_closed IS NULL
+        AND u.is_live
+    GROUP BY
+        p.id
+        ,p.data
+    HAVING SUM(pp.size) > 0
+    ORDER BY p.id
+    """.format(
+        position_table=Position.__tablename__,
+        user_table=User.__tablename__,
+        position_purchase_table=PositionPurchase.__tablename__,
+    )
+).strip()
+
+
+INSERT_EXIT_IMPLEMENTATIONS_SQL = dedent(
+    """
+    INSERT INTO public.{exit_implementation_table} (timeframe_id, position_id, strategy_version_instance_id)
+    SELECT
+        %(timeframe_id)s
+        ,p.position_id
+        ,%(strategy_version_instance_id)s
+    FROM UNNEST(%(position_ids)s::INTEGER[]) AS p (position_id)
+    ON CONFLICT (timeframe_id, position_id, strategy_version_instance_id) DO NOTHING
+    """.format(
+        exit_implementation_table=ExitImplementation.__tablename__
+    )
+).strip()
+
+
+SELECT_EXIT_IMPLEMENTATIONS_SQL = dedent(
+    """
+    SELECT
+        e.position_id
+        ,e.id
+        ,MAX(r.end_date)
+    FROM public.{exit_implementation_table} e
+        LEFT JOIN public.{exit_implementation_run_table} r ON
+            e.id = r.exit_implementation_id
+    WHERE
+        e.timeframe_id = %(timeframe_id)s
+        AND e.strategy_version_instance_id = %(strategy_version_instance_id)s
+        AND e.position_id = ANY(%(position_ids)s::INTEGER[])
+    GROUP BY
+        e.position_id
+        ,e.id
+    """.format(
+        exit_implementation_table=ExitImplementation.__tablename__,
+        exit_implementation_run_table=ExitImplementationRun.__tablename__,
+    )
+).strip()
+
+
+INSERT_EXIT_IMPLEMENTATION_RUNS_SQL = dedent(
+    """
+    INSERT INTO public.{exit_implementation_run_table} (exit_implementation_id, extra_fields, start_date, end_date)
+    SELECT
+        r.exit_implementation_id
+        ,%(extra_fields)s::JSONB
+        ,r.start_date
+        ,%(end_date)s
+    FROM UNNEST(%(exit_implementation_ids)s::INTEGER[], %(start_dates)s::TIMESTAMPTZ[]) AS r (
+        exit_implementation_id, start_date
+    )
+    RETURNING exit_implementation_id, id
+    """.format(
+        exit_implementation_run_table=ExitImplementationRun.__tablename__
+    )
+).strip()
+
+
+INSERT_SELL_SIGNALS_SQL = dedent(
+    """
+    INSERT INTO public.{sell_signal_table} (exit_implementation_run_id, signal_date, strength)
+    SELECT
+        s.exit_implementation_run_id
+        ,s.signal_date
+        ,s.strength
+    FROM UNNEST(
+        %(exit_implementation_run_ids)s::INTEGER[], %(signal_dates)s::TIMESTAMPTZ[], %(strengths)s::NUMERIC[]
+    ) AS s (exit_implementation_run_id, signal_date, strength)
+    ON CONFLICT (exit_implementation_run_id, signal_date) DO NOTHING
+    RETURNING id
+    """.format(
+        sell_signal_table=SellSignal.__tablename__
+    )
+).strip()
+
+
+UPDATE_POSITION_DATA_SQL = dedent(
+    """
+    UPDATE public.{position_table} p
+    SET data = COALESCE(p.data, '{{}}'::JSONB) || (
+        SELECT JSONB_OBJECT_AGG(e.key, COALESCE(p.data -> e.key, '{{}}'::JSONB) || e.value)
+        FROM JSONB_EACH(u.data) e
+    )
+    FROM UNNEST(%(position_ids)s::INTEGER[], %(datas)s::JSONB[]) AS u (position_id, data)
+    WHERE p.id = u.position_id
+    """.format(
+        position_table=Position.__tablename__
+    )
+).strip()
+
+
+def fetch_open_positions(base_asset_id: int) -> List[OpenPosition]:
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        cursor.execute(SELECT_OPEN_POSITIONS_SQL, {"base_asset_id": base_asset_id})
+        return [OpenPosition(r[0], r[1], r[2], r[3] or {}) for r in cursor.fetchall()]
+
+
+def ensure_exit_implementations(
+    timeframe_id: int, strategy_version_instance_id: int, position_ids: Sequence[int]
+) -> Dict[int, Tuple[int, Optional[datetime]]]:
+    parameters = {
+        "timeframe_id": timeframe_id,
+        "strategy_version_instance_id": strategy_version_instance_id,
+        "position_ids": list(position_ids),
+    }
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        cursor.execute(INSERT_EXIT_IMPLEMENTATIONS_SQL, parameters)
+        cursor.execute(SELECT_EXIT_IMPLEMENTATIONS_SQL, parameters)
+        return {r[0]: (r[1], r[2]) for r in cursor.fetchall()}
+
+
+def insert_exit_implementation_runs(
+    exit_implementation_ids: Sequence[int],
+    start_dates: Sequence[datetime],
+    end_date: datetime,
+    extra_fields: Dict[str, Any],
+) -> Dict[int, int]:
+    if not exit_implementation_ids:
+        return {}
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_EXIT_IMPLEMENTATION_RUNS_SQL,
+            {
+                "exit_implementation_ids": list(exit_implementation_ids),
+                "start_dates": list(start_dates),
+                "end_date": end_date,
+                "extra_fields": json.dumps(extra_fields),
+            },
+        )
+        return {r[0]: r[1] for r in cursor.fetchall()}
+
+
+def insert_sell_signals(
+    exit_implementation_run_ids: Sequence[int], signal_dates: Sequence[datetime], strengths: Sequence[float]
+) -> List[int]:
+    if not exit_implementation_run_ids:
+        return []
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            INSERT_SELL_SIGNALS_SQL,
+            {
+                "exit_implementation_run_ids": list(exit_implementation_run_ids),
+                "signal_dates": list(signal_dates),
+                "strengths": list(strengths),
+            },
+        )
+        return [r[0] for r in cursor.fetchall()]
+
+
+def update_position_data(states: Dict[int, Dict[str, Dict[str, Any]]]) -> None:
+    if not states:
+        return
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        cursor.execute(
+            UPDATE_POSITION_DATA_SQL,
+            {"position_ids": list(states.keys()), "datas": [json.dumps(v) for v in states.values()]},
+        )
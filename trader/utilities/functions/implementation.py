@@ -1,12 +1,151 @@
-from datetime import datetime, timedelta
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+from textwrap import dedent
+from typing import Any, Dict, List, Optional, Sequence, Set
+import numpy as np
 import pandas as pd
+from trader.connections.cache import cache
 from trader.connections.database import session
-from trader.models.asset_ohlcv import AssetOHLCV, AssetOHLCVGroup, AssetOHLCVPull
+from trader.models.asset_ohlcv import AssetOHLCV, AssetOHLCVGroup, AssetOHLCVGroupWatermark
 from trader.models.timeframe import Timeframe
+from trader.utilities.constants import (
+    ASSET_OHLCV_ARRAY_CACHE_KEY_PREFIX,
+    ASSET_OHLCV_ARRAY_CACHE_MAX_BYTES,
+    ASSET_OHLCV_ARRAY_CACHE_RECENCY_KEY,
+    ASSET_OHLCV_ARRAY_CACHE_SIZE_KEY,
+)
 from trader.utilities.functions.time import clean_range_cap, TIMEFRAME_UNIT_TO_DELTA_FUNCTION
 
 
+ASSET_OHLCV_DATAFRAME_COLUMNS = ("id", "open", "high", "low", "close", "volume")
+ASSET_OHLCV_PANEL_FLOOR = datetime(1970, 1, 1, tzinfo=timezone.utc)
+ASSET_OHLCV_ARRAY_DTYPE = np.dtype(
+    [
+        ("id", "<i8"),
+        ("date_open_ms", "<i8"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+ASSET_OHLCV_PANEL_ARRAY_DTYPE = np.dtype([("base_asset_id", "<i8")] + ASSET_OHLCV_ARRAY_DTYPE.descr)
+
+
+SELECT_ASSET_OHLCV_DATAFRAME_SQL = dedent(
+    """
+    SELECT
+        a.id
+        ,(EXTRACT(EPOCH FROM a.date_open) * 1000)::BIGINT AS date_open_ms
+        ,a.open::FLOAT8
+        ,a.high::FLOAT8
+        ,a.low::FLOAT8
+        ,a.close::FLOAT8
+        ,a.volume::FLOAT8
+    FROM public.{asset_ohlcv_table} a
+        INNER JOIN public.{asset_ohlcv_group_table} ag ON
+            a.asset_ohlcv_group_id = ag.id
+    WHERE
+        ag.source_id = %(source_id)s
+        AND ag.base_asset_id = %(base_asset_id)s
+        AND ag.quote_asset_id = %(quote_asset_id)s
+        AND ag.timeframe_id = %(timeframe_id)s
+        AND a.timeframe_id = %(timeframe_id)s
+        {range_filters}
+    ORDER BY a.date_open ASC
+    """
+).strip()
+
+
+SELECT_ASSET_OHLCV_PANEL_SQL = dedent(
+    """
+    SELECT
+        ag.base_asset_id
+        ,a.id
+        ,(EXTRACT(EPOCH FROM a.date_open) * 1000)::BIGINT AS date_open_ms
+        ,a.open::FLOAT8
+        ,a.high::FLOAT8
+        ,a.low::FLOAT8
+        ,a.close::FLOAT8
+        ,a.volume::FLOAT8
+    FROM public.{asset_ohlcv_table} a
+        INNER JOIN public.{asset_ohlcv_group_table} ag ON
+            a.asset_ohlcv_group_id = ag.id
+        INNER JOIN UNNEST(%(base_asset_ids)s::INTEGER[], %(from_inclusives)s::TIMESTAMPTZ[]) AS f (
+            base_asset_id, from_inclusive
+        ) ON
+            ag.base_asset_id = f.base_asset_id
+    WHERE
+        ag.source_id = %(source_id)s
+        AND ag.quote_asset_id = %(quote_asset_id)s
+        AND ag.timeframe_id = %(timeframe_id)s
+        AND a.timeframe_id = %(timeframe_id)s
+        AND a.date_open >= f.from_inclusive
+    ORDER BY
+        ag.base_asset_id ASC
+        ,a.date_open ASC
+    """.format(
+        asset_ohlcv_table=AssetOHLCV.__tablename__,
+        asset_ohlcv_group_table=AssetOHLCVGroup.__tablename__,
+    )
+).strip()
+
+
+def copy_select_to_array(select_sql: str, parameters: Dict[str, Any], dtype: np.dtype) -> np.ndarray:
+    buffer = StringIO()
+    connection = session.connection().connection
+    with connection.cursor() as cursor:
+        copy_sql = "COPY ({select_sql}) TO STDOUT WITH (FORMAT CSV)".format(
+            select_sql=cursor.mogrify(select_sql, parameters).decode()
+        )
+        cursor.copy_expert(copy_sql, buffer)
+    if buffer.tell() == 0:
+        return np.empty(0, dtype=dtype)
+    buffer.seek(0)
+    dataframe = pd.read_csv(buffer, header=None, names=dtype.names, dtype={n: dtype[n] for n in dtype.names})
+    array = np.empty(dataframe.shape[0], dtype=dtype)
+    for name in dtype.names:
+        array[name] = dataframe[name].to_numpy()
+    return array
+
+
+def fetch_asset_ohlcv_array(
+    source_id: int,
+    base_asset_id: int,
+    quote_asset_id: int,
+    timeframe_id: int,
+    from_inclusive: Optional[datetime] = None,
+    to_exclusive: Optional[datetime] = None,
+) -> np.ndarray:
+    range_filters: List[str] = []
+    if from_inclusive:
+        range_filters.append("AND a.date_open >= %(from_inclusive)s")
+    if to_exclusive:
+        range_filters.append("AND a.date_open < %(to_exclusive)s")
+    select_sql = SELECT_ASSET_OHLCV_DATAFRAME_SQL.format(
+        asset_ohlcv_table=AssetOHLCV.__tablename__,
+        asset_ohlcv_group_table=AssetOHLCVGroup.__tablename__,
+        range_filters="\n        ".join(range_filters),
+    )
+    parameters = {
+        "source_id": source_id,
+        "base_asset_id": base_asset_id,
+        "quote_asset_id": quote_asset_id,
+        "timeframe_id": timeframe_id,
+        "from_inclusive": from_inclusive,
+        "to_exclusive": to_exclusive,
+    }
+    return copy_select_to_array(select_sql, parameters, ASSET_OHLCV_ARRAY_DTYPE)
+
+
+def asset_ohlcv_array_to_dataframe(array: np.ndarray) -> pd.DataFrame:
+    return pd.DataFrame(
+        {c: array[c] for c in ASSET_OHLCV_DATAFRAME_COLUMNS},
+        index=pd.DatetimeIndex(pd.to_datetime(array["date_open_ms"], unit="ms", utc=True)),
+    )
+
+
 def fetch_asset_ohlcv_dataframe(
     source_id: int,
     base_asset_id: int,
@@ -15,30 +154,180 @@ def fetch_asset_ohlcv_dataframe(
     from_inclusive: Optional[datetime] = None,
     to_exclusive: Optional[datetime] = None,
 ) -> pd.DataFrame:
-    records_query = (
-        session.query(AssetOHLCV)
-        .join(AssetOHLCVPull)
+    array = fetch_asset_ohlcv_array(
+        source_id, base_asset_id, quote_asset_id, timeframe_id, from_inclusive=from_inclusive, to_exclusive=to_exclusive
+    )
+    return asset_ohlcv_array_to_dataframe(array)
+
+
+def get_asset_ohlcv_array_cache_key(source_id: int, base_asset_id: int, quote_asset_id: int, timeframe_id: int) -> str:
+    return f"{ASSET_OHLCV_ARRAY_CACHE_KEY_PREFIX}_{source_id}_{base_asset_id}_{quote_asset_id}_{timeframe_id}"
+
+
+def fetch_asset_ohlcv_panel_array(
+    source_id: int, quote_asset_id: int, timeframe_id: int, from_inclusives: Dict[int, datetime]
+) -> np.ndarray:
+    parameters = {
+        "source_id": source_id,
+        "quote_asset_id": quote_asset_id,
+        "timeframe_id": timeframe_id,
+        "base_asset_ids": list(from_inclusives.keys()),
+        "from_inclusives": list(from_inclusives.values()),
+    }
+    return copy_select_to_array(SELECT_ASSET_OHLCV_PANEL_SQL, parameters, ASSET_OHLCV_PANEL_ARRAY_DTYPE)
+
+
+def split_asset_ohlcv_panel_array(panel_array: np.ndarray) -> Dict[int, np.ndarray]:
+    output: Dict[int, np.ndarray] = {}
+    if panel_array.shape[0] == 0:
+        return output
+    base_asset_ids, starts = np.unique(panel_array["base_asset_id"], return_index=True)
+    for base_asset_id, chunk in zip(base_asset_ids, np.split(panel_array, starts[1:])):
+        array = np.empty(chunk.shape[0], dtype=ASSET_OHLCV_ARRAY_DTYPE)
+        for name in ASSET_OHLCV_ARRAY_DTYPE.names:
+            array[name] = chunk[name]
+        output[int(base_asset_id)] = array
+    return output
+
+
+def asset_ohlcv_arrays_to_panel(arrays: Dict[int, np.ndarray]) -> pd.DataFrame:
+    base_asset_ids = sorted(arrays.keys())
+    array = (
+        np.concatenate([arrays[b] for b in base_asset_ids])
+        if base_asset_ids
+        else np.empty(0, dtype=ASSET_OHLCV_ARRAY_DTYPE)
+    )
+    index = pd.MultiIndex.from_arrays(
+        (
+            np.repeat(np.array(base_asset_ids, dtype="int64"), [arrays[b].shape[0] for b in base_asset_ids]),
+            pd.to_datetime(array["date_open_ms"], unit="ms", utc=True),
+        ),
+        names=("base_asset_id", "date_open"),
+    )
+    return pd.DataFrame({c: array[c] for c in ASSET_OHLCV_DATAFRAME_COLUMNS}, index=index)
+
+
+def fetch_asset_ohlcv_group_bar_counts(
+    source_id: int, base_asset_ids: Sequence[int], quote_asset_id: int, timeframe_id: int
+) -> Dict[int, int]:
+    records = (
+        session.query(AssetOHLCVGroup.base_asset_id, AssetOHLCVGroupWatermark.bar_count)
+        .select_from(AssetOHLCVGroupWatermark)
         .join(AssetOHLCVGroup)
         .filter(
             AssetOHLCVGroup.source_id == source_id,
-            AssetOHLCVGroup.base_asset_id == base_asset_id,
+            AssetOHLCVGroup.base_asset_id.in_(base_asset_ids),
             AssetOHLCVGroup.quote_asset_id == quote_asset_id,
             AssetOHLCVGroup.timeframe_id == timeframe_id,
         )
-        .order_by(AssetOHLCV.date_open.asc())
+        .all()
     )
-    if from_inclusive:
-        records_query.filter(AssetOHLCV.date_open >= from_inclusive)
-    if to_exclusive:
-        records_query.filter(AssetOHLCV.date_open < to_exclusive)
-    records = records_query.all()
-    return pd.DataFrame(
-        (
-            {"id": r.id, "open": r.open, "high": r.high, "low": r.low, "close": r.close, "volume": r.volume}
-            for r in records
-        ),
-        index=(r.date_open for r in records),
+    return {b: c for b, c in records}
+
+
+def evict_asset_ohlcv_arrays(max_bytes: int = ASSET_OHLCV_ARRAY_CACHE_MAX_BYTES) -> None:
+    sizes = {k: int(v) for k, v in cache.hgetall(ASSET_OHLCV_ARRAY_CACHE_SIZE_KEY).items()}
+    total_bytes = sum(sizes.values())
+    if total_bytes <= max_bytes:
+        return
+    evicted_keys: List[bytes] = []
+    for cache_key in cache.zrange(ASSET_OHLCV_ARRAY_CACHE_RECENCY_KEY, 0, -1):
+        if total_bytes <= max_bytes:
+            break
+        total_bytes -= sizes.get(cache_key, 0)
+        evicted_keys.append(cache_key)
+    if evicted_keys:
+        pipeline = cache.pipeline()
+        pipeline.delete(*evicted_keys)
+        pipeline.zrem(ASSET_OHLCV_ARRAY_CACHE_RECENCY_KEY, *evicted_keys)
+        pipeline.hdel(ASSET_OHLCV_ARRAY_CACHE_SIZE_KEY, *evicted_keys)
+        pipeline.execute()
+
+
+def store_asset_ohlcv_arrays(arrays: Dict[str, np.ndarray]) -> None:
+    if not arrays:
+        return
+    now = datetime.now(timezone.utc).timestamp()
+    pipeline = cache.pipeline()
+    for cache_key, array in arrays.items():
+        payload = array.tobytes()
+        pipeline.set(cache_key, payload)
+        pipeline.hset(ASSET_OHLCV_ARRAY_CACHE_SIZE_KEY, cache_key, len(payload))
+    pipeline.zadd(ASSET_OHLCV_ARRAY_CACHE_RECENCY_KEY, {k: now for k in arrays.keys()})
+    pipeline.execute()
+    evict_asset_ohlcv_arrays()
+
+
+def decode_asset_ohlcv_array(payload: Optional[bytes]) -> Optional[np.ndarray]:
+    if payload is None or len(payload) % ASSET_OHLCV_ARRAY_DTYPE.itemsize != 0:
+        return None
+    return np.frombuffer(payload, dtype=ASSET_OHLCV_ARRAY_DTYPE)
+
+
+def fetch_cached_asset_ohlcv_arrays(
+    source_id: int, base_asset_ids: Sequence[int], quote_asset_id: int, timeframe_id: int
+) -> Dict[int, np.ndarray]:
+    bar_counts = fetch_asset_ohlcv_group_bar_counts(source_id, base_asset_ids, quote_asset_id, timeframe_id)
+    cache_keys = {
+        b: get_asset_ohlcv_array_cache_key(source_id, b, quote_asset_id, timeframe_id) for b in base_asset_ids
+    }
+    payloads = cache.mget([cache_keys[b] for b in base_asset_ids])
+    arrays: Dict[int, np.ndarray] = {}
+    from_inclusives: Dict[int, datetime] = {}
+    for base_asset_id, payload in zip(base_asset_ids, payloads):
+        array = decode_asset_ohlcv_array(payload)
+        bar_count = bar_counts.get(base_asset_id)
+        if array is not None and bar_count is not None and 0 < array.shape[0] <= bar_count:
+            arrays[base_asset_id] = array
+            if array.shape[0] < bar_count:
+                last_date_open = pd.Timestamp(int(array["date_open_ms"][-1]), unit="ms", tz="UTC").to_pydatetime()
+                from_inclusives[base_asset_id] = last_date_open + timedelta(microseconds=1)
+        else:
+            from_inclusives[base_asset_id] = ASSET_OHLCV_PANEL_FLOOR
+    empty_array = np.empty(0, dtype=ASSET_OHLCV_ARRAY_DTYPE)
+    changed_base_asset_ids: Set[int] = set()
+    if from_inclusives:
+        new_arrays = split_asset_ohlcv_panel_array(
+            fetch_asset_ohlcv_panel_array(source_id, quote_asset_id, timeframe_id, from_inclusives)
+        )
+        stale_from_inclusives: Dict[int, datetime] = {}
+        for base_asset_id in from_inclusives.keys():
+            new_array = new_arrays.get(base_asset_id, empty_array)
+            if base_asset_id in arrays:
+                arrays[base_asset_id] = np.concatenate((arrays[base_asset_id], new_array))
+                if arrays[base_asset_id].shape[0] != bar_counts[base_asset_id]:
+                    stale_from_inclusives[base_asset_id] = ASSET_OHLCV_PANEL_FLOOR
+            else:
+                arrays[base_asset_id] = new_array
+            changed_base_asset_ids.add(base_asset_id)
+        if stale_from_inclusives:
+            refetched_arrays = split_asset_ohlcv_panel_array(
+                fetch_asset_ohlcv_panel_array(source_id, quote_asset_id, timeframe_id, stale_from_inclusives)
+            )
+            for base_asset_id in stale_from_inclusives.keys():
+                arrays[base_asset_id] = refetched_arrays.get(base_asset_id, empty_array)
+    store_asset_ohlcv_arrays(
+        {cache_keys[b]: arrays[b] for b in changed_base_asset_ids if b in bar_counts and arrays[b].shape[0] > 0}
     )
+    unchanged_base_asset_ids = arrays.keys() - changed_base_asset_ids
+    if unchanged_base_asset_ids:
+        now = datetime.now(timezone.utc).timestamp()
+        cache.zadd(ASSET_OHLCV_ARRAY_CACHE_RECENCY_KEY, {cache_keys[b]: now for b in unchanged_base_asset_ids})
+    return arrays
+
+
+def fetch_cached_asset_ohlcv_dataframe(
+    source_id: int, base_asset_id: int, quote_asset_id: int, timeframe_id: int
+) -> pd.DataFrame:
+    arrays = fetch_cached_asset_ohlcv_arrays(source_id, (base_asset_id,), quote_asset_id, timeframe_id)
+    return asset_ohlcv_array_to_dataframe(arrays[base_asset_id])
+
+
+def fetch_cached_asset_ohlcv_panel(
+    source_id: int, base_asset_ids: Sequence[int], quote_asset_id: int, timeframe_id: int
+) -> pd.DataFrame:
+    arrays = fetch_cached_asset_ohlcv_arrays(source_id, base_asset_ids, quote_asset_id, timeframe_id)
+    return asset_ohlcv_arrays_to_panel(arrays)
 
 
 def fetch_time_deltas_from_dataframe_index(dataframe: pd.DataFrame) -> List[timedelta]:
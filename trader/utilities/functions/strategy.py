@@ -1,7 +1,8 @@
 from bisect import insort_left
 from collections import defaultdict
-from typing import DefaultDict, Dict, List, Tuple
+from typing import DefaultDict, Dict, List, Tuple, Type
 from trader.data.initial.data_feed import DataFeedData
+from trader.models.strategy import StrategyVersion
 from trader.strategies.base import Strategy
 from trader.strategies.entry import ENTRY_STRATEGIES
 from trader.strategies.exit import EXIT_STRATEGIES
@@ -20,3 +21,13 @@ def fetch_data_feeds_to_strategy_mapping(is_entry: bool) -> DefaultDict[Tuple[in
         if data_feed_list:
             output[tuple(data_feed_list)].append(strategy)
     return output
+
+
+def get_strategy_from_strategy_version(strategy_version: StrategyVersion) -> Type[Strategy]:
+    strategies = ENTRY_STRATEGIES if strategy_version.strategy.is_entry else EXIT_STRATEGIES
+    for strategy in strategies:
+        if strategy.NAME == strategy_version.strategy.name and strategy.VERSION == strategy_version.version:
+            return strategy
+    raise ValueError(
+        f"No strategy implementation available for {strategy_version.strategy.name} {strategy_version.version}"
+    )
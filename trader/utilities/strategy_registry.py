@@ -0,0 +1,135 @@
+from dataclasses import dataclass
+import os
+from textwrap import dedent
+from typing import Any, Dict, List, Optional, Tuple, Type
+from redis.client import PubSub
+from redis.exceptions import ConnectionError
+from trader.connections.cache import cache
+from trader.connections.database import session
+from trader.models.enabled_strategy_version_instance import (
+    EnabledStrategyVersionInstance,
+    EnabledStrategyVersionInstanceHistory,
+)
+from trader.models.strategy import Strategy as StrategyModel, StrategyVersion, StrategyVersionInstance
+from trader.strategies.base import Strategy
+from trader.utilities.constants import STRATEGY_REGISTRY_INVALIDATION_CHANNEL
+from trader.utilities.functions.strategy import fetch_data_feeds_to_strategy_mapping
+
+
+@dataclass(frozen=True)
+class RegisteredStrategyVersionInstance:
+    id: int
+    arguments: Dict[str, Any]
+    priority: Optional[int]
+
+
+SELECT_ENABLED_STRATEGY_VERSION_INSTANCES_SQL = dedent(
+    """
+    SELECT
+        c.name
+        ,c.is_entry
+        ,c.version
+        ,c.strategy_version_instance_id
+        ,c.arguments
+        ,c.priority
+    FROM (
+        SELECT DISTINCT ON (e.id)
+            s.name
+            ,s.is_entry
+            ,sv.version
+            ,svi.id AS strategy_version_instance_id
+            ,svi.arguments
+            ,h.priority
+            ,h.is_enabled
+        FROM public.{enabled_strategy_version_instance_table} e
+            INNER JOIN public.{enabled_strategy_version_instance_history_table} h ON
+                e.id = h.enabled_strategy_version_instance_id
+            INNER JOIN public.{strategy_version_instance_table} svi ON
+                e.strategy_version_instance_id = svi.id
+            INNER JOIN public.{strategy_version_table} sv ON
+                svi.strategy_version_id = sv.id
+            INNER JOIN public.{strategy_table} s ON
+                sv.strategy_id = s.id
+        WHERE e.timeframe_id = %(timeframe_id)s
+        ORDER BY
+            e.id
+            ,h.date_created DESC
+    ) c
+    WHERE c.is_enabled
+    ORDER BY c.strategy_version_instance_id
+    """.format(
+        enabled_strategy_version_instance_table=EnabledStrategyVersionInstance.__tablename__,
+        enabled_strategy_version_instance_history_table=EnabledStrategyVersionInstanceHistory.__tablename__,
+        strategy_version_instance_table=StrategyVersionInstance.__tablename__,
+        strategy_version_table=StrategyVersion.__tablename__,
+        strategy_table=StrategyModel.__tablename__,
+    )
+).strip()
+
+
+def publish_strategy_registry_invalidation() -> None:
+    cache.publish(STRATEGY_REGISTRY_INVALIDATION_CHANNEL, "invalidate")
+
+
+class StrategyRegistry:
+    def __init__(self):
+        self.enabled_strategy_version_instances: Dict[
+            int, Dict[Tuple[str, bool, str], List[RegisteredStrategyVersionInstance]]
+        ] = {}
+        self.data_feeds_to_strategy_mapping: Dict[bool, Dict[Tuple[int, ...], List[Type[Strategy]]]] = {}
+        self._pubsub: Optional[PubSub] = None
+        self._pubsub_pid: Optional[int] = None
+
+    def clear(self) -> None:
+        self.enabled_strategy_version_instances.clear()
+        self.data_feeds_to_strategy_mapping.clear()
+
+    def subscribe(self) -> None:
+        self.clear()
+        self._pubsub = cache.pubsub(ignore_subscribe_messages=True)
+        self._pubsub.subscribe(STRATEGY_REGISTRY_INVALIDATION_CHANNEL)
+        self._pubsub_pid = os.getpid()
+
+    def poll_invalidations(self) -> None:
+        if self._pubsub is None or self._pubsub_pid != os.getpid():
+            self.subscribe()
+            return
+        try:
+            while True:
+                message = self._pubsub.get_message()
+                if message is None:
+                    return
+                self.clear()
+        except ConnectionError:
+            self.subscribe()
+
+    def fetch_timeframe_instances(
+        self, timeframe_id: int
+    ) -> Dict[Tuple[str, bool, str], List[RegisteredStrategyVersionInstance]]:
+        if timeframe_id not in self.enabled_strategy_version_instances:
+            output: Dict[Tuple[str, bool, str], List[RegisteredStrategyVersionInstance]] = {}
+            connection = session.connection().connection
+            with connection.cursor() as cursor:
+                cursor.execute(SELECT_ENABLED_STRATEGY_VERSION_INSTANCES_SQL, {"timeframe_id": timeframe_id})
+                for name, is_entry, version, instance_id, arguments, priority in cursor.fetchall():
+                    output.setdefault((name, is_entry, version), []).append(
+                        RegisteredStrategyVersionInstance(instance_id, arguments, priority)
+                    )
+            self.enabled_strategy_version_instances[timeframe_id] = output
+        return self.enabled_strategy_version_instances[timeframe_id]
+
+    def get_enabled_strategy_version_instances(
+        self, timeframe_id: int, is_entry: bool, data_feed_ids: Tuple[int, ...]
+    ) -> List[Tuple[Type[Strategy], RegisteredStrategyVersionInstance]]:
+        self.poll_invalidations()
+        if is_entry not in self.data_feeds_to_strategy_mapping:
+            self.data_feeds_to_strategy_mapping[is_entry] = fetch_data_feeds_to_strategy_mapping(is_entry)
+        timeframe_instances = self.fetch_timeframe_instances(timeframe_id)
+        return [
+            (strategy, instance)
+            for strategy in self.data_feeds_to_strategy_mapping[is_entry].get(data_feed_ids, [])
+            for instance in timeframe_instances.get((strategy.NAME, strategy.IS_ENTRY, strategy.VERSION), [])
+        ]
+
+
+strategy_registry = StrategyRegistry()
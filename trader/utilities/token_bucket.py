@@ -0,0 +1,28 @@
+import asyncio
+from time import monotonic
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("Rate must be greater than zero")
+        if capacity < 1:
+            raise ValueError("Capacity must be at least one")
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = monotonic()
+
+    def reserve(self) -> float:
+        now = monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+        self.last_refill = now
+        self.tokens -= 1
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+    async def acquire(self) -> None:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)